@@ -4,17 +4,52 @@ FastAPI backend for the Pinterest Agent Platform
 This is the main FastAPI application that sets up the server and middleware and includes the routers
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.util.config import get_settings
+from app.util.serialization import ORJSONResponse
+from app.services.database.db import ensure_indexes
 from app.routes import prompts, websockets, health
+from app.models.pin import Pin
+from app.models.session import Session
+from app.models.pinterest_account import PinterestAccount
 
-app = FastAPI()
+
+def _build_model_schemas() -> None:
+    """
+    Make sure every model's validator is built before the first request.
+    model_rebuild() is a no-op for models that are already complete, and builds any
+    that were deferred (forward refs, defer_build) so the first request doesn't pay for it.
+    """
+    for model in (prompts.PromptIn, prompts.PromptOut, Pin, Session, PinterestAccount):
+        model.model_rebuild()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build model schemas, create indexes and warm shared clients on startup, close them on shutdown"""
+    _build_model_schemas()
+    # In the background, an unreachable MongoDB would otherwise hold up startup for the
+    # driver's 30s server selection timeout
+    indexes = asyncio.create_task(ensure_indexes())
+    health.init_clients()
+    yield
+    indexes.cancel()
+    await health.close_clients()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Allowed frontend origins, CORSMiddleware only does `origin in allow_origins`
+# so a frozenset makes the per-request check a hash lookup instead of a list scan
+CORS_ORIGINS = frozenset(get_settings().CORS_ORIGINS)
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_settings().CORS_ORIGINS,  # Frontend URL
+    allow_origins=CORS_ORIGINS,  # Frontend URL
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
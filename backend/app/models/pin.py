@@ -1,22 +1,48 @@
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from bson import ObjectId
 
 
+def _new_id() -> str:
+    return str(ObjectId())
+
+
 class PinMetadata(BaseModel):
     """Metadata for pins and eval"""
 
-    collected_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When the pin was collected"
+    model_config = ConfigDict(frozen=True)
+
+    # Held as a unix timestamp, converted to a UTC datetime only when dumped
+    collected_at: float = Field(
+        default_factory=time.time,
+        description="When the pin was collected",
     )
 
+    @field_validator("collected_at", mode="before")
+    @classmethod
+    def _coerce_collected_at(cls, v):
+        # documents loaded from MongoDB carry a datetime (naive UTC)
+        if isinstance(v, datetime):
+            return (v if v.tzinfo else v.replace(tzinfo=timezone.utc)).timestamp()
+        return v
+
+    @field_serializer("collected_at")
+    def _serialize_collected_at(self, v: float) -> datetime:
+        return datetime.fromtimestamp(v, timezone.utc)
+
+
+def _new_metadata() -> PinMetadata:
+    # the timestamp is always valid, skip validation
+    return PinMetadata.model_construct(collected_at=time.time())
+
 
 class Pin(BaseModel):
     """Model for pins and eval"""
 
     # MongoDB ObjectId as string (will be converted to ObjectId when stored)
-    id: str = Field(alias="_id", default_factory=lambda: str(ObjectId()))
+    id: str = Field(alias="_id", default_factory=_new_id)
 
     # Reference to the prompt that initiated this evaluation
     prompt_id: str = Field(..., description="ObjectId of the associated prompt")
@@ -40,13 +66,14 @@ class Pin(BaseModel):
 
     # Metadata
     metadata: PinMetadata = Field(
-        default_factory=PinMetadata, description="Additional metadata"
+        default_factory=_new_metadata, description="Additional metadata"
     )
 
-    class Config:
+    model_config = ConfigDict(
         # Allow population by field name (for MongoDB compatibility)
-        populate_by_name = True
-        # Allow extra fields (for future extensibility)
-        extra = "allow"
-        # Use JSON serialization for datetime
-        json_encoders = {datetime: lambda v: v.isoformat()}
+        populate_by_name=True,
+        # Drop unknown fields instead of keeping a per-instance extras dict
+        extra="ignore",
+        # Never mutated after construction (updates go straight to MongoDB)
+        frozen=True,
+    )
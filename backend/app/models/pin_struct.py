@@ -0,0 +1,41 @@
+"""
+msgspec mirrors of the Pin document for the scraping write path
+
+The scraper builds these instead of the Pydantic Pin model, the fields are already
+known good so there is nothing to validate, and msgspec converts them to the
+BSON-ready dict much faster. Pin stays the model for reads and the API.
+The shape matches Pin.model_dump() so documents written either way are identical.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Literal
+
+import msgspec
+from bson import ObjectId
+
+
+class PinMetadataStruct(msgspec.Struct, kw_only=True):
+    """Metadata for pins and eval"""
+
+    collected_at: datetime = msgspec.field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+
+class PinStruct(msgspec.Struct, kw_only=True):
+    """Pin document as written to MongoDB"""
+
+    id: str = msgspec.field(default_factory=lambda: str(ObjectId()))
+    prompt_id: str
+    image_url: str
+    pin_url: str
+    title: str = ""
+    description: str = ""
+    match_score: float = 0.0
+    status: Literal["approved", "disqualified", "pending"] = "pending"
+    ai_explanation: str = ""
+    metadata: PinMetadataStruct = msgspec.field(default_factory=PinMetadataStruct)
+
+    def to_document(self) -> Dict[str, Any]:
+        """Convert to a dict for insert_one, datetimes are left for BSON to encode"""
+        return msgspec.to_builtins(self, builtin_types=(datetime,))
@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
+from functools import cached_property
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
 class PinterestCookie(BaseModel):
@@ -31,7 +32,8 @@ class PinterestCookie(BaseModel):
         return d
 
     # validation: convert datetime to float if user passes datetime
-    @validator("expires", pre=True)
+    @field_validator("expires", mode="before")
+    @classmethod
     def _coerce_expires(cls, v):
         if isinstance(v, datetime):
             return v.replace(tzinfo=timezone.utc).timestamp()
@@ -49,14 +51,20 @@ class ProxyConfig(BaseModel):
     proxy_type: str = "http"  # http | https | socks5
     port: Optional[int] = None
 
+    # server with its scheme, resolved once after validation
+    _normalized_server: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _normalize_server(self) -> "ProxyConfig":
+        self._normalized_server = (
+            self.server if "://" in self.server else f"{self.proxy_type}://{self.server}"
+        )
+        return self
+
     def to_playwright(self) -> Dict[str, str]:
         """Return kwargs for Playwright proxy param."""
         return {
-            "server": (
-                self.server
-                if "://" in self.server
-                else f"{self.proxy_type}://{self.server}"
-            ),
+            "server": self._normalized_server,
             "username": self.username,
             "password": self.password,
         }
@@ -79,23 +87,37 @@ class PinterestAccount(BaseModel):
 
     last_login: Optional[datetime] = None
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     def needs_login(self) -> bool:
         """Decide whether to call session.login()."""
         return self.storage_state is None
 
-    def playwright_proxy(self) -> Optional[Dict[str, str]]:
+    @cached_property
+    def slug(self) -> str:
+        """Profile path segment, the username lowercased with spaces removed."""
+        return self.username.replace(" ", "").lower()
+
+    # Playwright forms are built once per account instance, the proxy and cookies
+    # don't change while the account is in use
+    @cached_property
+    def _playwright_proxy(self) -> Optional[Dict[str, str]]:
         return self.proxy.to_playwright() if self.proxy else None
 
-    def playwright_cookies(self) -> List[Dict[str, Any]]:
-        """Convert list of PinterestCookie → Playwright cookie dicts."""
-        now = datetime.utcnow().timestamp()
+    @cached_property
+    def _playwright_cookie_entries(self) -> List[Tuple[float, Dict[str, Any]]]:
+        # (expiry, cookie dict) pairs, session cookies (no expiry) never expire
         return [
-            c.to_playwright() for c in self.cookies if (c.expires or now + 60) > now
+            (c.expires or float("inf"), c.to_playwright()) for c in self.cookies
         ]
-    
-    class Config:
-        orm_mode = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+
+    def playwright_proxy(self) -> Optional[Dict[str, str]]:
+        return self._playwright_proxy
+
+    def playwright_cookies(self) -> List[Dict[str, Any]]:
+        """Convert list of PinterestCookie → Playwright cookie dicts."""
+        now = datetime.now(timezone.utc).timestamp()
+        return [d for expires, d in self._playwright_cookie_entries if expires > now]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal
 from pydantic import BaseModel, Field
 
@@ -6,7 +6,7 @@ from pydantic import BaseModel, Field
 class Prompt(BaseModel):
     text: str = Field(...)
     status: Literal["pending", "completed", "error"] = Field(default="pending")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # MongoDB document format (for reference)
@@ -14,5 +14,5 @@ class Prompt(BaseModel):
 #     "_id": ObjectId("..."),
 #     "text": "boho minimalist bedroom",
 #     "status": "pending",
-#     "created_at": datetime.utcnow()
+#     "created_at": datetime.now(timezone.utc)
 # }
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from bson import ObjectId
 
 
@@ -25,7 +25,8 @@ class Session(BaseModel):
 
     # Timestamp of when this session record was created/updated
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Timestamp of the session update"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Timestamp of the session update",
     )
 
     # Array of log messages for this session
@@ -34,10 +35,11 @@ class Session(BaseModel):
         description="Array of log messages for debugging and tracking",
     )
 
-    class Config:
+    model_config = ConfigDict(
         # Allow population by field name (for MongoDB compatibility)
-        populate_by_name = True
-        # Allow extra fields (for future extensibility)
-        extra = "allow"
-        # Use JSON serialization for datetime
-        json_encoders = {datetime: lambda v: v.isoformat()}
+        populate_by_name=True,
+        # Drop unknown fields instead of keeping a per-instance extras dict
+        extra="ignore",
+        # Never mutated after construction (updates go straight to MongoDB)
+        frozen=True,
+    )
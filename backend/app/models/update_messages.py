@@ -1,8 +1,11 @@
-from pydantic import BaseModel, HttpUrl, Field
-from typing import Union, Literal
+import orjson
+from pydantic import BaseModel, Field
+from typing import Annotated, Union, Literal
 
 
 # definitions for the different types of messages that can be sent over the websocket by tasks
+# tasks build these from data they already produced, so they use model_construct() to skip
+# validation; the field constraints still apply anywhere the models are validated
 class WarmupMessage(BaseModel):
     type: Literal["warmup"]
     message: str = Field(..., min_length=1)
@@ -12,8 +15,8 @@ class ScrapedImageMessage(BaseModel):
     type: Literal["scraped_image"]
     pin_id: str
     image_title: str
-    url: HttpUrl
-    pin_url: HttpUrl
+    url: str
+    pin_url: str
 
 
 class ValidationMessage(BaseModel):
@@ -23,6 +26,23 @@ class ValidationMessage(BaseModel):
     label: str = Field(..., min_length=1)
     valid: bool
 
-
-# union of all possible message types
-UpdateMessage = Union[WarmupMessage, ScrapedImageMessage, ValidationMessage]
+    def to_bytes(self) -> bytes:
+        # Every field is already a JSON type, so orjson encodes them directly instead of
+        # going through model_dump(mode="json"); validation sends one of these per pin
+        return orjson.dumps(
+            {
+                "type": "validation",
+                "pin_id": self.pin_id,
+                "score": self.score,
+                "label": self.label,
+                "valid": self.valid,
+            }
+        )
+
+
+# union of all possible message types, tagged on "type" so validation picks the
+# matching model directly instead of trying each one in turn
+UpdateMessage = Annotated[
+    Union[WarmupMessage, ScrapedImageMessage, ValidationMessage],
+    Field(discriminator="type"),
+]
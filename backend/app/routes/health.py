@@ -4,15 +4,103 @@ Health check routes for the Pinterest Agent Platform
 This module provides health check endpoints for monitoring and load balancers.
 """
 
+import asyncio
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 from fastapi import APIRouter, HTTPException
-from motor.motor_asyncio import AsyncIOMotorClient
 from app.util.config import get_settings
-import redis.asyncio as redis
+from app.util.serialization import ORJSONResponse
 import logging
 
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    import redis.asyncio as redis
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Upper bound (seconds) on each dependency ping so a hung backend can't stall the probe,
+# just above the clients' own 0.5s timeouts so those normally report the failure first
+HEALTH_CHECK_TIMEOUT = 0.75
+
+
+@lru_cache(maxsize=1)
+def _mongo() -> "AsyncIOMotorClient":
+    """Shared MongoDB client for health checks, created once and kept open"""
+    # Imported lazily, the lru_cache means this only runs on the first call
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    # Use the MongoDB URI directly (it should already be configured for Docker)
+    mongo_uri = get_settings().mongo_uri
+    if not mongo_uri:
+        raise ValueError("MongoDB URI not configured")
+    # Short timeouts so an unreachable server fails the probe instead of hanging it,
+    # a single connection is enough for one ping per probe
+    return AsyncIOMotorClient(
+        mongo_uri,
+        serverSelectionTimeoutMS=500,
+        connectTimeoutMS=500,
+        socketTimeoutMS=500,
+        maxPoolSize=1,
+    )
+
+
+@lru_cache(maxsize=1)
+def _redis() -> "redis.Redis":
+    """Shared Redis client for health checks, created once and kept open"""
+    import redis.asyncio as redis
+
+    # Use the Redis URL directly (it should already be configured for Docker)
+    redis_url = get_settings().redis_url
+    if not redis_url:
+        raise ValueError("Redis URL not configured")
+    return redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+
+def init_clients() -> None:
+    """
+    Create the health check clients ahead of the first request.
+    Called from the app lifespan so the connection pools are ready before the first probe.
+    """
+    for factory in (_mongo, _redis):
+        try:
+            factory()
+        except Exception as e:
+            logger.error(f"Failed to create health check client: {e}")
+
+
+async def close_clients() -> None:
+    """Close the health check clients on shutdown"""
+    if _mongo.cache_info().currsize:
+        _mongo().close()
+        _mongo.cache_clear()
+    if _redis.cache_info().currsize:
+        await _redis().aclose()
+        _redis.cache_clear()
+
+
+async def _check_mongo() -> Tuple[str, Optional[str]]:
+    """Ping MongoDB, returning ("healthy"|"unhealthy", error)"""
+    try:
+        await asyncio.wait_for(
+            _mongo().admin.command('ping'), timeout=HEALTH_CHECK_TIMEOUT
+        )
+        return "healthy", None
+    except Exception as e:
+        logger.error(f"MongoDB health check failed: {e!r}")
+        return "unhealthy", repr(e)
+
+
+async def _check_redis() -> Tuple[str, Optional[str]]:
+    """Ping Redis, returning ("healthy"|"unhealthy", error)"""
+    try:
+        await asyncio.wait_for(_redis().ping(), timeout=HEALTH_CHECK_TIMEOUT)
+        return "healthy", None
+    except Exception as e:
+        logger.error(f"Redis health check failed: {e!r}")
+        return "unhealthy", repr(e)
+
+
 @router.get("/health")
 async def health_check():
     """
@@ -22,9 +110,11 @@ async def health_check():
     - Application status
     - MongoDB connectivity
     - Redis connectivity
+
+    MongoDB and Redis are pinged concurrently, each capped at HEALTH_CHECK_TIMEOUT.
     
     Returns:
-        dict: Health status with detailed information
+        ORJSONResponse: Health status with detailed information
     """
     health_status = {
         "status": "healthy",
@@ -35,45 +125,22 @@ async def health_check():
             "redis": "unknown"
         }
     }
-    
-    # Check MongoDB connectivity
-    try:
-        settings = get_settings()
-        # Use the MongoDB URI directly (it should already be configured for Docker)
-        mongo_uri = settings.mongo_uri
-        if not mongo_uri:
-            raise ValueError("MongoDB URI not configured")
-        client = AsyncIOMotorClient(mongo_uri)
-        await client.admin.command('ping')
-        health_status["checks"]["mongodb"] = "healthy"
-        client.close()
-    except Exception as e:
-        logger.error(f"MongoDB health check failed: {e}")
-        health_status["checks"]["mongodb"] = "unhealthy"
-        health_status["status"] = "degraded"
-    
-    # Check Redis connectivity
-    try:
-        settings = get_settings()
-        # Use the Redis URL directly (it should already be configured for Docker)
-        redis_url = settings.redis_url
-        if not redis_url:
-            raise ValueError("Redis URL not configured")
-        redis_client = redis.from_url(redis_url)
-        await redis_client.ping()
-        await redis_client.close()
-        health_status["checks"]["redis"] = "healthy"
-    except Exception as e:
-        logger.error(f"Redis health check failed: {e}")
-        health_status["checks"]["redis"] = "unhealthy"
-        health_status["status"] = "degraded"
+
+    results = await asyncio.gather(
+        _check_mongo(), _check_redis(), return_exceptions=True
+    )
+    for name, result in zip(("mongodb", "redis"), results):
+        status = result[0] if isinstance(result, tuple) else "unhealthy"
+        health_status["checks"][name] = status
+        if status == "unhealthy":
+            health_status["status"] = "degraded"
     
     # Determine overall status
     if health_status["checks"]["mongodb"] == "unhealthy" and health_status["checks"]["redis"] == "unhealthy":
         health_status["status"] = "unhealthy"
         raise HTTPException(status_code=503, detail="Service unavailable")
     
-    return health_status
+    return ORJSONResponse(health_status)
 
 @router.get("/health/simple")
 async def simple_health_check():
@@ -81,6 +148,6 @@ async def simple_health_check():
     Simple health check endpoint for basic monitoring.
     
     Returns:
-        dict: Simple health status
+        ORJSONResponse: Simple health status
     """
-    return {"status": "healthy", "service": "pinterest-agent-backend"} 
\ No newline at end of file
+    return ORJSONResponse({"status": "healthy", "service": "pinterest-agent-backend"}) 
\ No newline at end of file
@@ -5,17 +5,29 @@ This module handles all prompt-related endpoints including creation
 and management of user search prompts.
 """
 
-from fastapi import APIRouter
+import asyncio
+import logging
+
+from bson import ObjectId
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-from celery import chain
 
 from app.services.database.repo import PromptRepo, SessionRepo
-from app.tasks.warmup_and_scraping import warm_up_scraping
-from app.tasks.validation import validate
+from app.util.serialization import dumps
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _log_dispatch_failure(fut: asyncio.Future) -> None:
+    """Done callback for the chain dispatch, the request has already returned"""
+    if fut.cancelled():
+        return
+    exc = fut.exception()
+    if exc is not None:
+        logger.error(f"Failed to dispatch task chain: {exc!r}")
+
+
 class PromptIn(BaseModel):
     text: str
 
@@ -24,8 +36,10 @@ class PromptOut(BaseModel):
     id: str
 
 
-@router.post("/prompts", response_model=PromptOut)
-async def create_prompt(p: PromptIn):
+# PromptOut is only referenced for the OpenAPI docs, the handler returns a pre-encoded
+# response so FastAPI does not re-validate it through a response_model
+@router.post("/prompts", status_code=201, responses={201: {"model": PromptOut}})
+async def create_prompt(p: PromptIn) -> Response:
     """
     Creates a new prompt and session in mongodb
     Starts the task chain
@@ -33,18 +47,34 @@ async def create_prompt(p: PromptIn):
     TODO: return the session id instead of the prompt id
     """
     # Create a new prompt and session in mongodb
-    promptRepo = PromptRepo()
-    pid = await promptRepo.create(p.text)
+    # IDs are generated here so both inserts can run at the same time
+    pid = str(ObjectId())
+    session_id = str(ObjectId())
+    prompt_ok, session_ok = await asyncio.gather(
+        PromptRepo().create_with_id(pid, p.text),
+        SessionRepo().create_with_id(session_id, pid),
+    )
+    if not (prompt_ok and session_ok):
+        raise HTTPException(status_code=500, detail="Failed to create prompt")
 
-    session_repo = SessionRepo()
-    session_id = await session_repo.create(pid)
+    # Imported here so the API process only pays for celery and the task modules
+    # (playwright, spacy, ...) once the first prompt comes in, not at startup
+    from celery import chain
+    from app.tasks.warmup_and_scraping import warm_up_scraping
+    from app.tasks.validation import validate
 
     # Start the task chain
     pipe = chain(
         warm_up_scraping.si(pid, session_id, p.text),  # freeze the initial arg
         validate.si(pid, session_id, p.text),  # receives scrape's return
     )
-    pipe.apply_async()
+    # apply_async blocks on the broker round trip, send it from a worker thread and
+    # return to the client without waiting for it
+    dispatch = asyncio.get_running_loop().run_in_executor(None, pipe.apply_async)
+    dispatch.add_done_callback(_log_dispatch_failure)
 
     # Return the prompt id to the frontend so it can be used to connect to the websocket
-    return {"id": pid}
+    # Body is encoded here and handed over as bytes, no response class render step
+    return Response(
+        content=dumps({"id": pid}), status_code=201, media_type="application/json"
+    )
@@ -2,6 +2,10 @@
 Reusable playwright actions for pinterest
 Actions take a in a page object, use browser_factory to get the page object
 
+PIN_FAST_MODE=1 drops the fixed pauses (SLEEP_TIME_*, sleep_random) and human-like typing.
+Those exist to look less like a bot and to give a throttled Docker CPU time to render, so
+fast mode is for batch/CI runs where detection isn't a concern, element waits still apply.
+
 TODO:
   Add a check to see if the board is already created, if so, skip the create board step
   Fix the save_pins_to_board function to actually save pins, improving recommendations
@@ -11,29 +15,288 @@ TODO:
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
-from playwright.async_api import Page, TimeoutError as PWTimeout, ElementHandle
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
+from playwright.async_api import (
+    Page,
+    Error as PWError,
+    TimeoutError as PWTimeout,
+    Locator,
+    expect,
+)
 import logging
 from app.models.pinterest_account import PinterestAccount
+import os
 import random
+import re
+import weakref
 from functools import wraps
+from urllib.parse import urlparse
+from selectolax.parser import HTMLParser, Node
 
 logger = logging.getLogger(__name__)
 
 # Configuration constants
+# DEFAULT_TIMEOUT and NAVIGATION_TIMEOUT are also the context defaults (set by the browser
+# factory), so calls that use them don't pass timeout= explicitly
 DEFAULT_TIMEOUT = 15000  # Increased for Docker
+SHORT_TIMEOUT = 5000  # for probes and actions that should fail fast
 LONG_TIMEOUT = 45000     # Increased for Docker
 NAVIGATION_TIMEOUT = 90000  # Increased for Docker
 RETRY_ATTEMPTS = 3
-RETRY_DELAY = 3  # Increased delay for Docker
-SLEEP_TIME_LONG = 3  # seconds - increased for Docker
-SLEEP_TIME_SHORT = 2  # seconds - increased for Docker
+RETRY_INITIAL_DELAY = 0.5  # seconds, doubled after each failed attempt
+RETRY_MAX_DELAY = 5.0  # seconds
+RETRY_TIMEOUT_DELAY = 0.2  # seconds, a Playwright timeout is usually fine to retry right away
+# Skip the human-like pauses and typing, see module docstring
+FAST_MODE = os.getenv("PIN_FAST_MODE") == "1"
+SLEEP_TIME_LONG = 0 if FAST_MODE else 3  # seconds - increased for Docker
+SLEEP_TIME_SHORT = 0 if FAST_MODE else 2  # seconds - increased for Docker
+# Type inputs key by key (slow, human-like) instead of filling them in one go
+HUMAN_TYPING = not FAST_MODE and os.getenv("PIN_HUMAN_TYPING") == "1"
+# Take diagnostic screenshots / page probes (also on when this logger is at DEBUG)
+DEBUG_SCREENSHOTS = os.getenv("PIN_DEBUG_SCREENSHOTS") == "1"
+
+# =======Selectors=======
+# Known constants, built once at import along with their comma-joined unions
+
+# Present when logged in
+LOGIN_INDICATORS: Tuple[str, ...] = (
+    '[data-test-id="header-profile"]',
+    '[data-test-id="profile-menu"]',
+    'a[href*="/profile/"]',
+    'a[href*="/settings/"]',
+    '[aria-label*="profile" i]',
+    '[aria-label*="account" i]',
+    'button[aria-label*="profile" i]',
+    'button[aria-label*="account" i]',
+    '[data-test-id="user-menu"]',
+    'div[data-test-id="header-profile"]',
+)
+LOGIN_INDICATORS_UNION = ", ".join(LOGIN_INDICATORS)
+
+# Login page elements, if we see these we're NOT logged in
+LOGOUT_INDICATORS: Tuple[str, ...] = (
+    'input[name="id"]',
+    'input[name="email"]',
+    'input[type="email"]',
+    'button:has-text("Log in")',
+    'button:has-text("Sign in")',
+    '[data-test-id="login-button"]',
+    'form[action*="login"]',
+)
+LOGOUT_INDICATORS_UNION = ", ".join(LOGOUT_INDICATORS)
+
+# Login form email field
+EMAIL_SELECTORS: Tuple[str, ...] = (
+    'input[name="id"]',
+    'input[name="email"]',
+    'input[type="email"]',
+    '[data-test-id="email-field"] input',
+    'input[placeholder*="email" i]',
+    'input[placeholder*="Email" i]',
+    'input[autocomplete="email"]',
+)
+EMAIL_SELECTORS_UNION = ", ".join(EMAIL_SELECTORS)
+
+# Login form password field
+PASSWORD_SELECTORS: Tuple[str, ...] = (
+    'input[name="password"]',
+    'input[type="password"]',
+    '[data-test-id="password-field"] input',
+    'input[placeholder*="password" i]',
+    'input[placeholder*="Password" i]',
+    'input[autocomplete="current-password"]',
+)
+PASSWORD_SELECTORS_UNION = ", ".join(PASSWORD_SELECTORS)
+
+# Login form submit button
+LOGIN_BUTTON_SELECTORS: Tuple[str, ...] = (
+    'button[type="submit"]',
+    'button:has-text("Log in")',
+    'button:has-text("Sign in")',
+    '[data-test-id="login-button"]',
+    'button[data-test-id="login-button"]',
+    'input[type="submit"]',
+)
+LOGIN_BUTTON_SELECTORS_UNION = ", ".join(LOGIN_BUTTON_SELECTORS)
+
+# Shown once login succeeds
+LOGIN_SUCCESS_INDICATORS: Tuple[str, ...] = (
+    '[data-test-id="header-profile"]',
+    '[data-test-id="profile-menu"]',
+    'a[href*="/profile/"]',
+)
+LOGIN_SUCCESS_INDICATORS_UNION = ", ".join(LOGIN_SUCCESS_INDICATORS)
+
+# Shown when login fails
+LOGIN_ERROR_INDICATORS: Tuple[str, ...] = (
+    '[data-test-id="error-message"]',
+    ".error-message",
+    '[role="alert"]',
+)
+LOGIN_ERROR_INDICATORS_UNION = ", ".join(LOGIN_ERROR_INDICATORS)
+
+# Popup close/skip buttons
+POPUP_SELECTORS: Tuple[str, ...] = (
+    'button:has-text("Skip")',
+    'button:has-text("Skip all")',
+    'button:has-text("Skip for now")',
+    'button:has-text("Not now")',
+    'button:has-text("Maybe later")',
+    'button[aria-label*="Skip" i]',
+    'button[aria-label*="Close" i]',
+    '[data-test-id="close-button"]',
+    'button[aria-label="Close"]',
+    'svg[aria-label="Close"]',
+    ".close-button",
+    ".popup-close",
+)
+POPUP_SELECTORS_UNION = ", ".join(POPUP_SELECTORS)
+
+# Links to the user's boards
+BOARDS_LINK_SELECTORS: Tuple[str, ...] = (
+    'a[aria-label="Your boards"]',
+    'a:has-text("Your boards")',
+    '[data-test-id="sidebar-boards-link"]',
+    'a[href*="/boards/"]',
+    'a[href*="/profile/"]',
+    'a[href*="/pins/"]',
+)
+BOARDS_LINK_SELECTORS_UNION = ", ".join(BOARDS_LINK_SELECTORS)
+
+# The plus (create) button
+PLUS_BUTTON_SELECTORS: Tuple[str, ...] = (
+    'div[class*="SPw"] svg path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
+    'svg[class*="gUZ"] path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
+    'div[style*="height: 48px; width: 48px;"] svg path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
+)
+PLUS_BUTTON_SELECTORS_UNION = ", ".join(PLUS_BUTTON_SELECTORS)
+
+# "Board" option in the create dropdown
+BOARD_OPTION_SELECTORS: Tuple[str, ...] = (
+    'button[data-test-id="Create board"]',
+    'button[id="board_actions-item-1"]',
+    'div[data-test-id="create-board-button"]',
+)
+BOARD_OPTION_SELECTORS_UNION = ", ".join(BOARD_OPTION_SELECTORS)
+
+# Board name input in the create board form
+NAME_INPUT_SELECTORS: Tuple[str, ...] = (
+    'input[id="boardEditName"]',
+    'input[name="boardName"]',
+    'input[placeholder*="Places" i]',
+    'input[placeholder*="Like" i]',
+    '[data-test-id="board-name-input"]',
+    'input[class*="_Jl"]',
+    'input[type="text"][name="boardName"]',
+)
+NAME_INPUT_SELECTORS_UNION = ", ".join(NAME_INPUT_SELECTORS)
+
+# "Keep this board secret" checkbox
+SECRET_SELECTORS: Tuple[str, ...] = (
+    'input[type="checkbox"][name="secret"]',
+    'input[type="checkbox"][aria-label*="secret" i]',
+    '[data-test-id="secret-board-toggle"]',
+)
+SECRET_SELECTORS_UNION = ", ".join(SECRET_SELECTORS)
+
+# Create board form submit button
+CREATE_BUTTON_SELECTORS: Tuple[str, ...] = (
+    'button:has-text("Create")',
+    'button[type="submit"]:has-text("Create")',
+    '[data-test-id="create-board-submit"]',
+    'button[aria-label*="Create" i]',
+    'button:has-text("Save")',
+    'button:has-text("Done")',
+)
+CREATE_BUTTON_SELECTORS_UNION = ", ".join(CREATE_BUTTON_SELECTORS)
+
+# "More Ideas" button
+MORE_IDEAS_SELECTORS: Tuple[str, ...] = (
+    'button:has-text("More Ideas")',
+    'a:has-text("More Ideas")',
+    '[data-test-id="more-ideas-button"]',
+    '[aria-label*="More Ideas" i]',
+    'button[aria-label*="More Ideas" i]',
+    'a[aria-label*="More Ideas" i]',
+    'button:has-text("more ideas")',
+    'a:has-text("more ideas")',
+    'button:has-text("More ideas")',
+    'a:has-text("More ideas")',
+    # Pinterest specific selectors
+    '[data-test-id="pinner-recommendations-more-ideas"]',
+    'button[data-test-id*="more-ideas"]',
+    'a[data-test-id*="more-ideas"]',
+)
+MORE_IDEAS_SELECTORS_UNION = ", ".join(MORE_IDEAS_SELECTORS)
+
+# Pin containers (the full pin components) on the more ideas page, in priority order
+PIN_CONTAINER_SELECTORS: Tuple[str, ...] = (
+    'div[data-test-id="pin"]',
+    "div[data-test-pin-id]",
+    "div[data-grid-item-idx]",
+    'div[class*="pin"]',
+    'div[class*="Pin"]',
+    'article[data-test-id="pin"]',
+    'div[role="button"][tabindex="0"]',  # Pinterest often uses these for pin containers
+)
+PIN_CONTAINER_SELECTORS_UNION = ", ".join(PIN_CONTAINER_SELECTORS)
+
+# "pinimg.com" or "pin" anywhere (any case) in an image URL or alt text, for the broad search
+_PIN_RE = re.compile("pin", re.IGNORECASE)
+
+# Pin images, used when no containers are found, in priority order
+PIN_IMAGE_SELECTORS: Tuple[str, ...] = (
+    'img[src*="pinimg.com"]',  # Pinterest's image CDN
+    'img[data-test-id*="pin"]',
+    'img[alt*="Pin"]',
+    'img[src*="i.pinimg.com"]',
+    'img[data-test-id="pin-image"]',
+    'img[data-test-id="pin-img"]',
+    'img[class*="pin"]',
+    'img[class*="Pin"]',
+    'img[data-test-id="pin-image-img"]',
+    # Fallback to any image that might be a pin
+    'img[src*="pin"]',
+    'img[alt*="pin"]',
+)
+PIN_IMAGE_SELECTORS_UNION = ", ".join(PIN_IMAGE_SELECTORS)
+
 
 # =======Utility functions=======
 
 
-def retry_on_failure(max_attempts: int = RETRY_ATTEMPTS, delay: float = RETRY_DELAY):
-    """Decorator to retry functions on failure"""
+# Playwright errors that another attempt can't fix: the page/context/browser is gone
+# or the navigation was aborted on purpose
+_FATAL_PW_ERRORS = (
+    "Target page, context or browser has been closed",
+    "Target closed",
+    "net::ERR_ABORTED",
+    "Browser has been closed",
+)
+
+
+def _is_retryable(e: Exception) -> bool:
+    """Timeouts and ordinary errors are worth retrying, a closed target or aborted navigation isn't"""
+    if isinstance(e, PWTimeout):
+        return True
+    if isinstance(e, PWError):
+        return not any(marker in str(e) for marker in _FATAL_PW_ERRORS)
+    return True
+
+
+def retry_on_failure(
+    max_attempts: int = RETRY_ATTEMPTS,
+    initial_delay: float = RETRY_INITIAL_DELAY,
+    max_delay: float = RETRY_MAX_DELAY,
+    multiplier: float = 2.0,
+    jitter: float = 0.2,
+):
+    """
+    Decorator to retry functions on failure
+    Waits with exponential backoff (capped at max_delay, +-jitter fraction) between attempts,
+    Playwright timeouts are retried after a short fixed delay instead, and errors from a
+    closed page or aborted navigation are raised straight away
+    """
 
     def decorator(func):
         @wraps(func)
@@ -44,10 +307,19 @@ def retry_on_failure(max_attempts: int = RETRY_ATTEMPTS, delay: float = RETRY_DE
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
+                    if not _is_retryable(e):
+                        logger.error(f"Not retrying {func.__name__}: {e}")
+                        raise
                     if attempt < max_attempts - 1:
                         logger.warning(
                             f"Attempt {attempt + 1} failed for {func.__name__}: {e}"
                         )
+                        if isinstance(e, PWTimeout):
+                            delay = RETRY_TIMEOUT_DELAY
+                        else:
+                            delay = min(
+                                initial_delay * multiplier**attempt, max_delay
+                            ) * random.uniform(1 - jitter, 1 + jitter)
                         await asyncio.sleep(delay)
                     else:
                         logger.error(
@@ -60,16 +332,86 @@ def retry_on_failure(max_attempts: int = RETRY_ATTEMPTS, delay: float = RETRY_DE
     return decorator
 
 
+# Finds which selector an element matched, Playwright-only selectors (:has-text)
+# throw in el.matches and are skipped
+_MATCHED_SELECTOR_JS = """(el, selectors) => selectors.find(s => {
+    try { return el.matches(s); } catch (e) { return false; }
+}) || null"""
+
+
+def _is_plain_css(selectors: Sequence[str]) -> bool:
+    """True if none of the selectors use Playwright-only syntax document.querySelector can't run"""
+    return not any(
+        ":has-text(" in s or ">>" in s or s.startswith(("text=", "xpath="))
+        for s in selectors
+    )
+
+
+def visible_locator(page: Page, selector: str) -> Locator:
+    """Locator for the first visible element matching the selector (or selector union)"""
+    return page.locator(f"{selector} >> visible=true").first
+
+
+async def wait_for_any_selector_mo(
+    page: Page, selectors: Sequence[str], timeout: int = DEFAULT_TIMEOUT
+) -> Optional[str]:
+    """
+    Wait in the page for the first visible element matching any selector, using the
+    MutationObserver helper the browser factory installs (window.__pinWaitAny).
+    Resolves on the DOM change that adds the element instead of on a polling tick.
+    Returns the selector that matched, None on timeout, raises if the helper isn't installed.
+    """
+    return await page.evaluate(
+        "([selectors, timeout]) => window.__pinWaitAny(selectors, timeout)",
+        [list(selectors), timeout],
+    )
+
+
 async def wait_for_element(
-    page: Page, selectors: List[str], timeout: int = DEFAULT_TIMEOUT
-) -> Tuple[Optional[ElementHandle], Optional[str]]:
-    """Wait for any of the provided selectors to appear and return the element and selector used"""
+    page: Page,
+    selectors: Sequence[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    union: Optional[str] = None,
+) -> Tuple[Optional[Locator], Optional[str]]:
+    """
+    Wait for any of the provided selectors to appear and return a locator and the selector used
+    Pass the precomputed union (", ".join(selectors)) for module-level selector sets
+    """
+    # Plain CSS can be watched for in the page, which resolves as soon as the element renders
+    if _is_plain_css(selectors):
+        try:
+            matched = await wait_for_any_selector_mo(page, selectors, timeout)
+            if not matched:
+                return None, None
+            logger.debug(f"Found element with selector: {matched}")
+            return visible_locator(page, matched), matched
+        except Exception as e:
+            # helper missing (page not from BrowserFactory) or the page navigated mid-wait
+            logger.debug(f"In-page wait unavailable, using locator wait: {e}")
+
+    # Wait on all selectors in one call rather than one wait (and timeout) per selector
+    joined = union or ", ".join(selectors)
+    try:
+        locator = visible_locator(page, joined)
+        await locator.wait_for(state="visible", timeout=timeout)
+        matched = await locator.evaluate(_MATCHED_SELECTOR_JS, list(selectors))
+        if matched:
+            locator = visible_locator(page, matched)
+        selector = matched or joined
+        logger.debug(f"Found element with selector: {selector}")
+        return locator, selector
+    except PWTimeout:
+        return None, None
+    except Exception as e:
+        # e.g. one bad selector breaks the whole union, fall back to checking them one by one
+        logger.debug(f"Error with joined selector {joined}: {e}")
+
     for selector in selectors:
         try:
-            element = await page.wait_for_selector(selector, timeout=timeout)
-            if element:
-                logger.debug(f"Found element with selector: {selector}")
-                return element, selector
+            locator = visible_locator(page, selector)
+            await locator.wait_for(state="visible", timeout=timeout)
+            logger.debug(f"Found element with selector: {selector}")
+            return locator, selector
         except PWTimeout:
             continue
         except Exception as e:
@@ -78,16 +420,114 @@ async def wait_for_element(
     return None, None
 
 
+async def race_selectors(
+    page: Page, selector_groups: Dict[str, str], timeout: int = DEFAULT_TIMEOUT
+) -> Optional[str]:
+    """
+    Wait for whichever group of selectors appears first and return that group's name.
+    Each group is a selector union (comma-joined CSS), e.g. LOGIN_INDICATORS_UNION.
+    All groups are waited on at once, so the cost is the first match rather than the
+    sum of each group's timeout. Returns None if no group appears within the timeout.
+    """
+    tasks = {
+        asyncio.create_task(
+            visible_locator(page, union).wait_for(state="visible", timeout=timeout)
+        ): name
+        for name, union in selector_groups.items()
+    }
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                # a group that timed out or errored just drops out of the race
+                if task.exception() is None:
+                    return tasks[task]
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def wait_until_ready(
+    page: Page, selector: str, timeout: int = DEFAULT_TIMEOUT, state: str = "visible"
+) -> bool:
+    """Wait for the element the next step needs instead of sleeping, returns as soon as it matches"""
+    try:
+        await page.locator(selector).first.wait_for(state=state, timeout=timeout)
+        return True
+    except PWTimeout:
+        logger.debug(f"Timed out waiting for {selector} to be {state}")
+        return False
+    except Exception as e:
+        logger.debug(f"Error waiting for {selector}: {e}")
+        return False
+
+
+# page -> {logical name: (locator, selector)} for elements found during a flow, a page's
+# entry is dropped whenever its main frame navigates since what matched belongs to the old document
+_element_cache: "weakref.WeakKeyDictionary[Page, Dict[str, Tuple[Locator, Optional[str]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_element_cache(page: Page) -> None:
+    """Forget every element cached for this page"""
+    _element_cache.pop(page, None)
+
+
+def _page_element_cache(page: Page) -> Dict[str, Tuple[Locator, Optional[str]]]:
+    """Get the cache for a page, hooking up invalidation on navigation the first time"""
+    cache = _element_cache.get(page)
+    if cache is None:
+        cache = _element_cache[page] = {}
+        page.on(
+            "framenavigated",
+            lambda frame: invalidate_element_cache(page)
+            if frame == page.main_frame
+            else None,
+        )
+    return cache
+
+
+async def cached_wait(
+    page: Page,
+    logical: str,
+    selectors: Sequence[str],
+    union: Optional[str] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Tuple[Optional[Locator], Optional[str]]:
+    """
+    wait_for_element that remembers which selector matched under a logical name, so the same
+    element looked up again in the flow (e.g. on a retry) costs one visibility check instead of a wait
+    """
+    cache = _page_element_cache(page)
+    hit = cache.get(logical)
+    if hit:
+        try:
+            if await hit[0].is_visible():
+                return hit
+        except Exception:
+            pass
+        cache.pop(logical, None)
+
+    locator, selector = await wait_for_element(page, selectors, timeout=timeout, union=union)
+    if locator:
+        cache[logical] = (locator, selector)
+    return locator, selector
+
+
 async def click_element_safely(
-    page: Page, element: ElementHandle, description: str = "element"
+    page: Page, element: Locator, description: str = "element"
 ) -> bool:
     """Safely click an element with proper error handling"""
     try:
-        # Ensure element is visible and clickable
-        await element.wait_for_element_state("visible", timeout=5000)
-        await element.scroll_into_view_if_needed()
-
-        await element.click()
+        # click() waits for the element to be visible, stable and enabled, scrolls it into
+        # view and re-resolves the locator if the DOM re-rendered in between
+        await element.click(timeout=SHORT_TIMEOUT)
         logger.debug(f"Successfully clicked {description}")
         return True
     except Exception as e:
@@ -96,16 +536,21 @@ async def click_element_safely(
 
 
 async def fill_input_safely(
-    page: Page, element: ElementHandle, value: str, description: str = "input"
+    page: Page,
+    element: Locator,
+    value: str,
+    description: str = "input",
+    human_like: bool = HUMAN_TYPING,
 ) -> bool:
     """Safely fill an input element with proper error handling"""
     try:
-        await element.wait_for_element_state("visible", timeout=5000)
-        await element.scroll_into_view_if_needed()
-
-        # Clear existing content and fill
-        await element.fill("")
-        await element.type(value, delay=100)  # Type with delay for human-like behavior
+        if human_like:
+            # Clear existing content, then key by key with a varying delay for human-like behavior
+            await element.fill("", timeout=SHORT_TIMEOUT)
+            await element.press_sequentially(value, delay=random.randint(30, 90))
+        else:
+            # fill() waits for the input, clears it and sets the value in one call
+            await element.fill(value, timeout=SHORT_TIMEOUT)
         logger.debug(f"Successfully filled {description} with: {value[:20]}...")
         return True
     except Exception as e:
@@ -114,10 +559,28 @@ async def fill_input_safely(
 
 
 async def sleep_random(min_seconds: float = 1, max_seconds: float = 3) -> None:
-    """Sleep for a random amount of time between min_seconds and max_seconds"""
+    """Sleep for a random amount of time between min_seconds and max_seconds (no-op in fast mode)"""
+    if FAST_MODE:
+        return
     await asyncio.sleep(random.uniform(min_seconds, max_seconds))
 
 
+def debug_enabled() -> bool:
+    """Whether to spend round trips on diagnostics (screenshots, extra page probes)"""
+    return DEBUG_SCREENSHOTS or logger.isEnabledFor(logging.DEBUG)
+
+
+async def debug_screenshot(page: Page, path: str) -> None:
+    """Save a screenshot only when diagnostics are enabled"""
+    if not debug_enabled():
+        return
+    try:
+        await page.screenshot(path=path)
+        logger.info(f"Screenshot saved: {path}")
+    except Exception as e:
+        logger.warning(f"Could not take screenshot: {e}")
+
+
 async def get_page_title(page: Page) -> str:
     """Get current page title with error handling"""
     try:
@@ -129,28 +592,225 @@ async def get_page_title(page: Page) -> str:
 
 # =======Pinterest actions=======
 
+# First text input whose placeholder, name or id looks like the board name field (or null)
+_FIND_BOARD_NAME_INPUT_JS = """() => {
+    const inputs = [...document.querySelectorAll('input[type="text"]')];
+    return inputs.findIndex(i => {
+        const p = (i.placeholder || '').toLowerCase();
+        const n = (i.name || '').toLowerCase();
+        const d = (i.id || '').toLowerCase();
+        return p.includes('board') || p.includes('name') || p.includes('like')
+            || n.includes('board') || d.includes('board');
+    });
+}"""
+
+# The image fallbacks only read static attributes, so they work on one page.content() dump
+# parsed in-process with selectolax (C parser) instead of querying the live DOM over CDP
+
+
+def _selector_indexes(tree: HTMLParser, selectors: Sequence[str]) -> Dict[int, int]:
+    """Node id -> index of the first selector (in priority order) the node matches"""
+    indexes: Dict[int, int] = {}
+    for i, selector in enumerate(selectors):
+        for node in tree.css(selector):
+            indexes.setdefault(node.mem_id, i)
+    return indexes
+
+
+def _attr(node: Optional[Node], name: str) -> str:
+    """Attribute value or "" (missing node, missing or valueless attribute)"""
+    if node is None:
+        return ""
+    return node.attributes.get(name) or ""
+
+
+# Everything the extraction needs from each pin container, run over all matches of the container
+# union in one locator.evaluate_all: the index of the first selector it matches (priority order,
+# -1 if none), pin id, pin link/description and its image
+_PIN_CONTAINER_ROWS_JS = """(els, selectors) => els.map(el => {
+    const link = el.querySelector("a[href*='/pin/']");
+    const img = el.querySelector("img[src*='pinimg.com']") || el.querySelector('img');
+    return {
+        index: selectors.findIndex(s => {
+            try { return el.matches(s); } catch (e) { return false; }
+        }),
+        pin_id: el.getAttribute('data-test-pin-id') || '',
+        pin_link: (link && link.getAttribute('href')) || '',
+        title: (link && link.getAttribute('aria-label')) || '',
+        image_url: img && img.getAttribute('src'),
+        alt_text: (img && img.getAttribute('alt')) || '',
+        img_title: (img && img.getAttribute('title')) || '',
+    };
+})"""
+
+
+async def _read_pin_containers(page: Page) -> List[Dict[str, Any]]:
+    """Rows for every pin container currently in the DOM"""
+    return await page.locator(PIN_CONTAINER_SELECTORS_UNION).evaluate_all(
+        _PIN_CONTAINER_ROWS_JS, list(PIN_CONTAINER_SELECTORS)
+    )
+
+
+def _add_container_pins(
+    rows: List[Dict[str, Any]],
+    container_selector: str,
+    extracted_pins: List[Dict[str, str]],
+    seen_urls: Set[str],
+) -> int:
+    """Turn container rows into pin dicts, skipping seen image URLs, returns how many were added"""
+    added = 0
+    for row in rows:
+        src = row["image_url"]
+        if src and src.startswith("http") and src not in seen_urls:
+            seen_urls.add(src)
+            # Combine container metadata with image data
+            extracted_pins.append(
+                {
+                    "image_url": src,
+                    "alt_text": row["alt_text"],
+                    # Prefer container description
+                    "title": row["title"] or row["img_title"],
+                    "pin_link": row["pin_link"],
+                    "pin_id": row["pin_id"],
+                    "selector_used": container_selector,
+                }
+            )
+            added += 1
+            logger.debug(f"Extracted pin: {src[:50]}... (ID: {row['pin_id']})")
+    return added
+
+
+# Scroll two viewports down and return the pin container count from before the scroll
+_SCROLL_FOR_PINS_JS = """(union) => {
+    const count = document.querySelectorAll(union).length;
+    window.scrollBy(0, window.innerHeight * 2);
+    return count;
+}"""
+
+
+async def _scroll_for_more_pins(
+    page: Page,
+    container_selector: str,
+    extracted_pins: List[Dict[str, str]],
+    seen_urls: Set[str],
+    max_scrolls: int,
+) -> None:
+    """Scroll the grid and extract each new batch of containers until nothing new loads"""
+    for scroll in range(max_scrolls):
+        count = await page.evaluate(_SCROLL_FOR_PINS_JS, PIN_CONTAINER_SELECTORS_UNION)
+        try:
+            # The grid is virtualized, so pins scrolled past can leave the DOM: any change in
+            # the count means a new batch rendered
+            await page.wait_for_function(
+                "([union, count]) => document.querySelectorAll(union).length !== count",
+                arg=[PIN_CONTAINER_SELECTORS_UNION, count],
+                timeout=SHORT_TIMEOUT,
+            )
+        except PWTimeout:
+            logger.info(f"No new pins loaded after scroll {scroll + 1}")
+            break
+
+        rows = [
+            row
+            for selector, group in _group_rows(
+                await _read_pin_containers(page), PIN_CONTAINER_SELECTORS
+            )
+            if selector == container_selector
+            for row in group
+        ]
+        added = _add_container_pins(rows, container_selector, extracted_pins, seen_urls)
+        logger.info(f"Scroll {scroll + 1}: {added} new pins")
+        if not added:
+            break
+
+
+def _pin_link_for(img: Node) -> Optional[Node]:
+    """The pin link wrapping the image (like element.closest), else one next to it in its parent"""
+    node = img.parent
+    while node is not None:
+        if node.tag == "a" and "/pin/" in _attr(node, "href"):
+            return node
+        node = node.parent
+    parent = img.parent
+    return parent.css_first("a[href*='/pin/']") if parent is not None else None
+
+
+def _pin_image_rows(
+    tree: HTMLParser, selectors: Sequence[str], union: str
+) -> List[Dict[str, Any]]:
+    """Same for bare images, with the pin link that wraps or sits next to each image"""
+    indexes = _selector_indexes(tree, selectors)
+    rows = []
+    for img in tree.css(union):
+        link = _pin_link_for(img)
+        rows.append(
+            {
+                "index": indexes.get(img.mem_id, -1),
+                "image_url": _attr(img, "src") or None,
+                "alt_text": _attr(img, "alt"),
+                "title": _attr(img, "title"),
+                "pin_link": _attr(link, "href"),
+            }
+        )
+    return rows
+
+
+def _group_rows(
+    rows: List[Dict[str, Any]], selectors: Sequence[str]
+) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """Split extraction rows by their matched selector, in the selectors' priority order"""
+    groups: Dict[int, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(row["index"], []).append(row)
+    return [(selectors[i], groups[i]) for i in sorted(groups) if i >= 0]
+
+
+# Title, image and div counts and the first 5 images' src/alt, for the extraction debug log
+_PAGE_SUMMARY_JS = """() => {
+    const images = document.querySelectorAll('img');
+    return [
+        document.title,
+        images.length,
+        document.getElementsByTagName('div').length,
+        Array.from(images).slice(0, 5).map(i => [i.getAttribute('src'), i.getAttribute('alt')]),
+    ];
+}"""
+
+# Total input count plus the attributes of the first 10, for the board name failure log
+_INPUTS_SNAPSHOT_JS = """() => {
+    const inputs = document.querySelectorAll('input');
+    return [inputs.length, Array.from(inputs).slice(0, 10).map(i => ({
+        id: i.id, name: i.name, placeholder: i.placeholder, type: i.type
+    }))];
+}"""
+
 
-@retry_on_failure(max_attempts=2, delay=1)
 async def navigate_to_pinterest(page: Page) -> bool:
-    """Navigate to Pinterest with retry mechanism"""
+    """Navigate to Pinterest, the page counts as loaded once its header or login form is visible"""
     try:
+        # A warm persistent profile may already be on Pinterest, no navigation needed
+        if "pinterest." in urlparse(page.url).netloc:
+            logger.info("Already on Pinterest")
+            return True
+
         logger.info("Navigating to Pinterest...")
         await page.goto(
             "https://www.pinterest.com",
             wait_until="domcontentloaded",
-            timeout=NAVIGATION_TIMEOUT,
         )
 
-        # Wait for page to be ready with CPU throttling
-        await asyncio.sleep(SLEEP_TIME_LONG)
-        
-        # Add small delays to prevent CPU spikes
-        await asyncio.sleep(0.5)
+        # The header (logged in) or the login form (logged out) has to render, expect() keeps
+        # polling for it within the one call rather than redoing the navigation on a miss
+        await expect(
+            visible_locator(
+                page,
+                '[data-test-id="header-profile"], input[name="id"], button:has-text("Log in")',
+            )
+        ).to_be_visible(timeout=NAVIGATION_TIMEOUT)
 
-        # Verify we're on Pinterest
-        title = await page.title()
-        if "Pinterest" not in title:
-            logger.warning(f"Unexpected page title: {title}")
+        # Verify we're on Pinterest (page.url is tracked locally, no round trip)
+        if "pinterest." not in urlparse(page.url).netloc:
+            logger.warning(f"Unexpected page url: {page.url}")
             return False
 
         logger.info("Successfully navigated to Pinterest")
@@ -164,55 +824,30 @@ async def test_login_status_on_pinterest(page: Page) -> bool:
     """Test if logged in with improved detection"""
     logger.info("Testing login status on Pinterest...")
     try:
-        # Wait for page to be fully loaded
-        await asyncio.sleep(SLEEP_TIME_LONG)
-
-        # Check if we're logged in by looking for multiple indicators
-        login_indicators = [
-            '[data-test-id="header-profile"]',
-            '[data-test-id="profile-menu"]',
-            'a[href*="/profile/"]',
-            'a[href*="/settings/"]',
-            '[aria-label*="profile" i]',
-            '[aria-label*="account" i]',
-            'button[aria-label*="profile" i]',
-            'button[aria-label*="account" i]',
-            '[data-test-id="user-menu"]',
-            'div[data-test-id="header-profile"]',
-        ]
-
-        # Check for login page indicators (if we see these, we're NOT logged in)
-        logout_indicators = [
-            'input[name="id"]',
-            'input[name="email"]',
-            'input[type="email"]',
-            'button:has-text("Log in")',
-            'button:has-text("Sign in")',
-            '[data-test-id="login-button"]',
-            'form[action*="login"]',
-        ]
+        # Pinterest sets _auth=1 for a signed in session, a warm profile usually has it
+        cookies = await get_cookies(page)
+        if any(c["name"] == "_auth" and c["value"] == "1" for c in cookies):
+            logger.info("Logged in to Pinterest (session cookie present)")
+            return True
 
-        # Check for logout indicators
-        logout_element, logout_selector = await wait_for_element(
-            page, logout_indicators, timeout=3000
+        # Check if we're logged in by racing the logged in indicators against the
+        # login page indicators (if we see those, we're NOT logged in)
+        status = await race_selectors(
+            page,
+            {"logged_in": LOGIN_INDICATORS_UNION, "logged_out": LOGOUT_INDICATORS_UNION},
+            timeout=SHORT_TIMEOUT,
         )
-        if logout_element:
-            logger.info(f"Found logout indicator: {logout_selector}")
+        if status == "logged_out":
             logger.warning("Connected to Pinterest but not logged in")
             return False
 
-        # Check for login indicators first
-        login_element, login_selector = await wait_for_element(
-            page, login_indicators, timeout=5000
-        )
-        if login_element:
-            logger.info(f"Found login indicator: {login_selector}")
+        if status == "logged_in":
             logger.info("Successfully connected and logged in to Pinterest")
             return True
 
         # If we can't determine login status, take a screenshot and assume not logged in
         logger.warning("Connected to Pinterest but login status unclear")
-        await page.screenshot(path="login_status_unclear.png")
+        await debug_screenshot(page, "/app/debug_screenshots/login_status_unclear.png")
         return False
 
     except Exception as e:
@@ -220,7 +855,7 @@ async def test_login_status_on_pinterest(page: Page) -> bool:
         return False
 
 
-@retry_on_failure(max_attempts=2, delay=2)
+@retry_on_failure(max_attempts=2, initial_delay=1.0)
 async def login_to_pinterest(page: Page, account: PinterestAccount) -> bool:
     """Attempt to login to Pinterest with improved error handling"""
     try:
@@ -230,47 +865,26 @@ async def login_to_pinterest(page: Page, account: PinterestAccount) -> bool:
         await page.goto(
             "https://www.pinterest.com/login/",
             wait_until="domcontentloaded",
-            timeout=NAVIGATION_TIMEOUT,
         )
-        await asyncio.sleep(SLEEP_TIME_LONG)
 
         # Wait for login form to load
-        email_selectors = [
-            'input[name="id"]',
-            'input[name="email"]',
-            'input[type="email"]',
-            '[data-test-id="email-field"] input',
-            'input[placeholder*="email" i]',
-            'input[placeholder*="Email" i]',
-            'input[autocomplete="email"]',
-        ]
-
         email_field, email_selector = await wait_for_element(
-            page, email_selectors, timeout=LONG_TIMEOUT
+            page, EMAIL_SELECTORS, timeout=LONG_TIMEOUT, union=EMAIL_SELECTORS_UNION
         )
         if not email_field:
             logger.error("Could not find email field on login page")
-            await page.screenshot(path="login_email_field_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/login_email_field_debug.png")
             return False
 
         # Fill email
         if not await fill_input_safely(page, email_field, account.email, "email field"):
             return False
 
-        await asyncio.sleep(SLEEP_TIME_SHORT)
-
         # Find and fill password field
-        password_selectors = [
-            'input[name="password"]',
-            'input[type="password"]',
-            '[data-test-id="password-field"] input',
-            'input[placeholder*="password" i]',
-            'input[placeholder*="Password" i]',
-            'input[autocomplete="current-password"]',
-        ]
-
         password_field, password_selector = await wait_for_element(
-            page, password_selectors, timeout=DEFAULT_TIMEOUT
+            page,
+            PASSWORD_SELECTORS,
+            union=PASSWORD_SELECTORS_UNION,
         )
         if not password_field:
             logger.error("Could not find password field on login page")
@@ -282,20 +896,11 @@ async def login_to_pinterest(page: Page, account: PinterestAccount) -> bool:
         ):
             return False
 
-        await asyncio.sleep(SLEEP_TIME_SHORT)
-
         # Find and click login button
-        login_button_selectors = [
-            'button[type="submit"]',
-            'button:has-text("Log in")',
-            'button:has-text("Sign in")',
-            '[data-test-id="login-button"]',
-            'button[data-test-id="login-button"]',
-            'input[type="submit"]',
-        ]
-
         login_button, login_selector = await wait_for_element(
-            page, login_button_selectors, timeout=DEFAULT_TIMEOUT
+            page,
+            LOGIN_BUTTON_SELECTORS,
+            union=LOGIN_BUTTON_SELECTORS_UNION,
         )
         if not login_button:
             logger.error("Could not find login button on login page")
@@ -307,32 +912,26 @@ async def login_to_pinterest(page: Page, account: PinterestAccount) -> bool:
 
         # Wait for login to complete (either success or error)
         try:
-            # Wait for either dashboard (success) or error message
-            success_indicators = [
-                '[data-test-id="header-profile"]',
-                '[data-test-id="profile-menu"]',
-                'a[href*="/profile/"]',
-            ]
-
-            error_indicators = [
-                '[data-test-id="error-message"]',
-                ".error-message",
-                '[role="alert"]',
-            ]
-
-            # Wait for either success or error
-            success_element, _ = await wait_for_element(
-                page, success_indicators, timeout=30000
+            # Wait for either dashboard (success) or error message, whichever comes first
+            outcome = await race_selectors(
+                page,
+                {
+                    "success": LOGIN_SUCCESS_INDICATORS_UNION,
+                    "error": LOGIN_ERROR_INDICATORS_UNION,
+                },
+                timeout=30000,
             )
-            if success_element:
+            if outcome == "success":
                 logger.info("Login successful!")
                 return True
 
-            error_element, _ = await wait_for_element(
-                page, error_indicators, timeout=5000
-            )
-            if error_element:
-                error_text = await error_element.text_content()
+            if outcome == "error":
+                error_element = page.locator(LOGIN_ERROR_INDICATORS_UNION).first
+                error_text = (
+                    await error_element.text_content(timeout=1000)
+                    if await error_element.count()
+                    else None
+                )
                 logger.error(f"Login failed with error: {error_text}")
                 return False
 
@@ -348,10 +947,12 @@ async def login_to_pinterest(page: Page, account: PinterestAccount) -> bool:
         return False
 
 
-async def get_cookies(page: Page) -> List[Dict[str, Any]]:
-    """Get cookies from page"""
+async def get_cookies(
+    page: Page, urls: Sequence[str] = ("https://www.pinterest.com",)
+) -> List[Dict[str, Any]]:
+    """Get the context's cookies for the given URLs (Pinterest by default), skipping third-party ones"""
     try:
-        return await page.cookies()
+        return await page.context.cookies(list(urls))
     except Exception as e:
         logger.error(f"Failed to get cookies: {e}")
         return []
@@ -363,37 +964,20 @@ async def check_and_skip_popups(page: Page) -> bool:
         # Wait a moment for popups to appear
         await asyncio.sleep(SLEEP_TIME_SHORT)
 
-        # Look for popup close buttons
-        popup_selectors = [
-            'button:has-text("Skip")',
-            'button:has-text("Skip all")',
-            'button:has-text("Skip for now")',
-            'button:has-text("Not now")',
-            'button:has-text("Maybe later")',
-            'button[aria-label*="Skip" i]',
-            'button[aria-label*="Close" i]',
-            '[data-test-id="close-button"]',
-            'button[aria-label="Close"]',
-            'svg[aria-label="Close"]',
-            ".close-button",
-            ".popup-close",
-        ]
-
-        for selector in popup_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    logger.info(f"Found popup close button: {selector}")
-                    await click_element_safely(
-                        page, element, f"popup close button ({selector})"
-                    )
-                    await asyncio.sleep(SLEEP_TIME_SHORT)
-                    return True
-            except Exception as e:
-                logger.debug(f"Error with popup selector {selector}: {e}")
-                continue
+        # One query for every close button, most of the time there is no popup at all
+        element = page.locator(POPUP_SELECTORS_UNION).first
+        if not await element.count():
+            logger.debug("No popups detected")
+            return True
 
-        logger.debug("No popups detected")
+        # Only for the log line, :has-text selectors can't be matched in the page
+        selector = (
+            await element.evaluate(_MATCHED_SELECTOR_JS, list(POPUP_SELECTORS))
+            or "popup selector union"
+        )
+        logger.info(f"Found popup close button: {selector}")
+        await click_element_safely(page, element, f"popup close button ({selector})")
+        await asyncio.sleep(SLEEP_TIME_SHORT)
         return True
 
     except Exception as e:
@@ -401,20 +985,20 @@ async def check_and_skip_popups(page: Page) -> bool:
         return True  # Don't fail the whole process for popup issues
 
 
-@retry_on_failure(max_attempts=2, delay=1)
+@retry_on_failure(max_attempts=2, initial_delay=1.0)
 async def navigate_to_create_board(page: Page, account: PinterestAccount) -> bool:
     """Navigate to the create board page with improved navigation"""
     try:
         logger.info("Navigating to boards page...")
 
-        accountpage = account.username.replace(" ", "").lower()
+        slug = account.slug
+        profile_url = f"https://www.pinterest.com/{slug}/"
         # Try multiple approaches to get to boards page
         navigation_methods = [
             # Method 1 : Direct URL navigation to user profile
             lambda: page.goto(
-                f"https://www.pinterest.com/{accountpage}/",
+                profile_url,
                 wait_until="domcontentloaded",
-                timeout=NAVIGATION_TIMEOUT,
             ),
             # Method 2: Click boards link
             lambda: _click_boards_link(page),
@@ -425,11 +1009,8 @@ async def navigate_to_create_board(page: Page, account: PinterestAccount) -> boo
                 await method()
                 await asyncio.sleep(SLEEP_TIME_LONG)
 
-                # Check if we're on a boards page
-                url = page.url
-                title = await page.title()
-
-                if accountpage in url.lower() or accountpage in title.lower():
+                # Check if we're on a boards page, the title is only fetched if the URL doesn't say
+                if slug in page.url.lower() or slug in (await page.title()).lower():
                     logger.info(
                         f"Successfully navigated to boards page using method {i+1}"
                     )
@@ -440,7 +1021,7 @@ async def navigate_to_create_board(page: Page, account: PinterestAccount) -> boo
                 continue
 
         logger.error("All navigation methods failed")
-        await page.screenshot(path="boards_navigation_debug.png")
+        await debug_screenshot(page, "/app/debug_screenshots/boards_navigation_debug.png")
         return False
 
     except Exception as e:
@@ -450,24 +1031,18 @@ async def navigate_to_create_board(page: Page, account: PinterestAccount) -> boo
 
 async def _click_boards_link(page: Page) -> None:
     """Helper function to click boards link"""
-    board_selectors = [
-        'a[aria-label="Your boards"]',
-        'a:has-text("Your boards")',
-        '[data-test-id="sidebar-boards-link"]',
-        'a[href*="/boards/"]',
-        'a[href*="/profile/"]',
-        'a[href*="/pins/"]',
-    ]
-
-    board_element, _ = await wait_for_element(page, board_selectors, timeout=5000)
+    board_element, _ = await wait_for_element(
+        page, BOARDS_LINK_SELECTORS, timeout=SHORT_TIMEOUT, union=BOARDS_LINK_SELECTORS_UNION
+    )
     if board_element:
         await click_element_safely(page, board_element, "boards link")
-        await page.wait_for_load_state("domcontentloaded", timeout=10000)
+        # The link routes client-side, so wait for the boards page's create button rather
+        # than a document load that never happens
+        await wait_until_ready(page, PLUS_BUTTON_SELECTORS_UNION, timeout=10000)
     else:
         raise Exception("Could not find boards link")
 
 
-@retry_on_failure(max_attempts=2, delay=1)
 async def create_board(page: Page, board_name: str, is_secret: bool = False) -> bool:
     """
     Create a new board on Pinterest with improved error handling
@@ -479,18 +1054,16 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         logger.info(f"Creating board: {board_name}")
 
         # First, look for the plus button (create button)
-        plus_button_selectors = [
-            'div[class*="SPw"] svg path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
-            'svg[class*="gUZ"] path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
-            'div[style*="height: 48px; width: 48px;"] svg path[d="M11 13v10h2V13h10v-2H13V1h-2v10H1v2z"]',
-        ]
-
-        plus_button, _ = await wait_for_element(
-            page, plus_button_selectors, timeout=LONG_TIMEOUT
+        plus_button, _ = await cached_wait(
+            page,
+            "plus_button",
+            PLUS_BUTTON_SELECTORS,
+            timeout=LONG_TIMEOUT,
+            union=PLUS_BUTTON_SELECTORS_UNION,
         )
         if not plus_button:
             logger.error("Could not find plus/create button")
-            await page.screenshot(path="plus_button_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/plus_button_debug.png")
             return False
 
         logger.info("Found plus button, clicking to open dropdown...")
@@ -499,21 +1072,17 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         if not await click_element_safely(page, plus_button, "plus button"):
             return False
 
-        await asyncio.sleep(SLEEP_TIME_LONG)  # Wait for dropdown to appear
-
         # Now look for the "Board" option in the dropdown - using actual Pinterest DOM
-        board_option_selectors = [
-            'button[data-test-id="Create board"]',
-            'button[id="board_actions-item-1"]',
-            'div[data-test-id="create-board-button"]',
-        ]
-
-        board_option, _ = await wait_for_element(
-            page, board_option_selectors, timeout=DEFAULT_TIMEOUT
+        # (waiting on it is what replaces a fixed sleep for the dropdown to open)
+        board_option, _ = await cached_wait(
+            page,
+            "board_option",
+            BOARD_OPTION_SELECTORS,
+            union=BOARD_OPTION_SELECTORS_UNION,
         )
         if not board_option:
             logger.error("Could not find 'Board' option in dropdown")
-            await page.screenshot(path="board_option_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/board_option_debug.png")
             return False
 
         logger.info("Found Board option, clicking to create board...")
@@ -522,53 +1091,46 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         if not await click_element_safely(page, board_option, "Board option"):
             return False
 
-        await page.wait_for_load_state("domcontentloaded", timeout=10000)
-        await asyncio.sleep(SLEEP_TIME_LONG)
+        # Wait for the board form to open
+        await wait_until_ready(page, 'input[id="boardEditName"]')
 
-        # Enhanced debugging before looking for inputs
-        logger.info("=== DEBUGGING BOARD FORM ===")
-        try:
-            current_url = page.url
-            logger.info(f"Current URL: {current_url}")
-            
-            # Take a screenshot for visual debugging
-            await page.screenshot(path="/app/debug_screenshots/board_form_debug.png")
-            logger.info("Screenshot saved: /app/debug_screenshots/board_form_debug.png")
-            
-            # Check page title
-            title = await page.title()
-            logger.info(f"Page title: {title}")
-            
-            # Check if we're in a modal
-            modal = await page.query_selector('[role="dialog"], [class*="modal"], [class*="popup"]')
-            if modal:
-                logger.info("Found modal container")
-            else:
-                logger.info("No modal found")
-                
-        except Exception as e:
-            logger.error(f"Debugging error: {e}")
+        # Enhanced debugging before looking for inputs, skipped unless diagnostics are on
+        if debug_enabled():
+            logger.info("=== DEBUGGING BOARD FORM ===")
+            try:
+                current_url = page.url
+                logger.info(f"Current URL: {current_url}")
+
+                # Take a screenshot for visual debugging
+                await debug_screenshot(page, "/app/debug_screenshots/board_form_debug.png")
+
+                # Check page title
+                title = await page.title()
+                logger.info(f"Page title: {title}")
+
+                # Check if we're in a modal
+                modal = page.locator('[role="dialog"], [class*="modal"], [class*="popup"]')
+                if await modal.count():
+                    logger.info("Found modal container")
+                else:
+                    logger.info("No modal found")
+
+            except Exception as e:
+                logger.error(f"Debugging error: {e}")
 
         logger.info("Filling board name...")
         # Now fill in the board name - using actual Pinterest DOM selectors
-        name_input_selectors = [
-            'input[id="boardEditName"]',
-            'input[name="boardName"]',
-            'input[placeholder*="Places" i]',
-            'input[placeholder*="Like" i]',
-            '[data-test-id="board-name-input"]',
-            'input[class*="_Jl"]',
-            'input[type="text"][name="boardName"]',
-        ]
-
         # Try multiple strategies to find the input
         name_input = None
         used_strategy = None
         
         # Strategy 1: Wait for specific input
         logger.info("Strategy 1: Looking for board name input...")
-        name_input, _ = await wait_for_element(
-            page, name_input_selectors, timeout=DEFAULT_TIMEOUT
+        name_input, _ = await cached_wait(
+            page,
+            "board_name_input",
+            NAME_INPUT_SELECTORS,
+            union=NAME_INPUT_SELECTORS_UNION,
         )
         if name_input:
             used_strategy = "direct_selector"
@@ -577,29 +1139,14 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         if not name_input:
             logger.info("Strategy 2: Looking for any text input...")
             try:
-                await asyncio.sleep(2)  # Wait a bit more
-                all_text_inputs = await page.query_selector_all('input[type="text"]')
-                logger.info(f"Found {len(all_text_inputs)} text inputs")
-                
-                for i, inp in enumerate(all_text_inputs):
-                    try:
-                        placeholder = await inp.get_attribute('placeholder')
-                        name_attr = await inp.get_attribute('name')
-                        id_attr = await inp.get_attribute('id')
-                        
-                        logger.info(f"Text input {i}: placeholder='{placeholder}', name='{name_attr}', id='{id_attr}'")
-                        
-                        # Check if this looks like a board name input
-                        if (placeholder and ("board" in placeholder.lower() or "name" in placeholder.lower() or "like" in placeholder.lower())) or \
-                           (name_attr and "board" in name_attr.lower()) or \
-                           (id_attr and "board" in id_attr.lower()):
-                            logger.info(f"Found likely board input: {placeholder} | {name_attr} | {id_attr}")
-                            name_input = inp
-                            used_strategy = "text_input_search"
-                            break
-                    except Exception as e:
-                        logger.warning(f"Error checking input {i}: {e}")
-                        
+                await asyncio.sleep(SLEEP_TIME_SHORT)  # Wait a bit more
+                # Scan the text inputs in the page for the first one that looks like the
+                # board name field, one round trip instead of 3 per input
+                index = await page.evaluate(_FIND_BOARD_NAME_INPUT_JS)
+                if index >= 0:
+                    name_input = page.locator('input[type="text"]').nth(index)
+                    logger.info("Found likely board input among text inputs")
+                    used_strategy = "text_input_search"
             except Exception as e:
                 logger.error(f"Strategy 2 failed: {e}")
         
@@ -608,28 +1155,22 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
             logger.info("Strategy 3: Waiting longer and retrying...")
             await asyncio.sleep(5)  # Wait 5 more seconds
             name_input, _ = await wait_for_element(
-                page, name_input_selectors, timeout=DEFAULT_TIMEOUT
+                page,
+                NAME_INPUT_SELECTORS,
+                union=NAME_INPUT_SELECTORS_UNION,
             )
             if name_input:
                 used_strategy = "longer_wait"
         
         if not name_input:
             logger.error("Could not find board name input")
-            await page.screenshot(path="/app/debug_screenshots/board_name_input_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/board_name_input_debug.png")
             
             # Enhanced debugging - check what inputs are actually available
             try:
-                all_inputs = await page.query_selector_all('input')
-                logger.error(f"Found {len(all_inputs)} input elements on page")
-                for i, inp in enumerate(all_inputs[:5]):  # Log first 5 inputs
-                    try:
-                        input_id = await inp.get_attribute('id')
-                        input_name = await inp.get_attribute('name')
-                        input_placeholder = await inp.get_attribute('placeholder')
-                        input_type = await inp.get_attribute('type')
-                        logger.error(f"Input {i}: id='{input_id}', name='{input_name}', placeholder='{input_placeholder}', type='{input_type}'")
-                    except Exception as e:
-                        logger.error(f"Input {i}: <error reading attributes: {e}>")
+                # One round trip for the whole snapshot instead of 4 per input
+                count, inputs = await page.evaluate(_INPUTS_SNAPSHOT_JS)
+                logger.error(f"Found {count} input elements on page: {inputs}")
             except Exception as e:
                 logger.error(f"Could not inspect input elements: {e}")
             
@@ -643,19 +1184,16 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         ):
             return False
 
-        await asyncio.sleep(SLEEP_TIME_SHORT)
+        # The Create button is enabled once the name registers
+        await wait_until_ready(
+            page, 'button:has-text("Create"):not([disabled])'
+        )
 
         logger.info("Setting board privacy...")
         # Set board privacy if needed - based on the "Keep this board secret" checkbox in the image
         if is_secret:
-            secret_selectors = [
-                'input[type="checkbox"][name="secret"]',
-                'input[type="checkbox"][aria-label*="secret" i]',
-                '[data-test-id="secret-board-toggle"]',
-            ]
-
             secret_toggle, _ = await wait_for_element(
-                page, secret_selectors, timeout=5000
+                page, SECRET_SELECTORS, timeout=SHORT_TIMEOUT, union=SECRET_SELECTORS_UNION
             )
             if secret_toggle:
                 await secret_toggle.check()
@@ -664,21 +1202,15 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
                 logger.warning("Could not find secret board checkbox")
 
         # Click create button - based on the gray "Create" button in the modal
-        create_button_selectors = [
-            'button:has-text("Create")',
-            'button[type="submit"]:has-text("Create")',
-            '[data-test-id="create-board-submit"]',
-            'button[aria-label*="Create" i]',
-            'button:has-text("Save")',
-            'button:has-text("Done")',
-        ]
-
-        create_button, _ = await wait_for_element(
-            page, create_button_selectors, timeout=DEFAULT_TIMEOUT
+        create_button, _ = await cached_wait(
+            page,
+            "create_board_button",
+            CREATE_BUTTON_SELECTORS,
+            union=CREATE_BUTTON_SELECTORS_UNION,
         )
         if not create_button:
             logger.error("Could not find Create button")
-            await page.screenshot(path="create_button_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/create_button_debug.png")
             return False
 
         logger.info("Found Create button, clicking to create board...")
@@ -687,8 +1219,19 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         if not await click_element_safely(page, create_button, "Create button"):
             return False
 
-        await page.wait_for_load_state("domcontentloaded", timeout=10000)
-        await asyncio.sleep(SLEEP_TIME_LONG)
+        # The board form closing is what confirms the board was created
+        await expect(page.locator('input[id="boardEditName"]').first).to_be_hidden(
+            timeout=DEFAULT_TIMEOUT
+        )
+
+        # Pinterest then opens the new board, titled with its name. The title can differ from
+        # what was typed (Pinterest may change the name's case or spacing), so only warn
+        try:
+            await page.get_by_role("heading", name=board_name).first.wait_for(
+                timeout=SHORT_TIMEOUT
+            )
+        except PWTimeout:
+            logger.warning(f"Board page heading doesn't show '{board_name}', url: {page.url}")
 
         logger.info(f"Successfully created board: {board_name}")
         return True
@@ -698,7 +1241,7 @@ async def create_board(page: Page, board_name: str, is_secret: bool = False) ->
         return False
 
 
-@retry_on_failure(max_attempts=2, delay=1)
+@retry_on_failure(max_attempts=2, initial_delay=0.3)
 async def save_pins_to_board(
     page: Page,
     prompt: str,
@@ -708,14 +1251,12 @@ async def save_pins_to_board(
 ) -> bool:
     """Save pins to a board with improved error handling"""
     try:
-        # Wait for the modal to load
-        await asyncio.sleep(SLEEP_TIME_LONG)
-        await check_and_skip_popups(page)
-
         # Constants for selectors
         DONE_BTN = 'button:has-text("Done")'
 
-        await asyncio.sleep(SLEEP_TIME_LONG)
+        # Wait for the modal to load
+        await wait_until_ready(page, DONE_BTN)
+        await check_and_skip_popups(page)
 
         # TODO: I'd like to implement pre-screening of the suggested pin board to populate some basic
         # pins in my recommended board. Will come back to this
@@ -726,13 +1267,12 @@ async def save_pins_to_board(
         try:
             logger.info("Clicking Done button...")
             done_button = page.locator(DONE_BTN)
-            await done_button.wait_for(state="visible", timeout=5000)
+            await done_button.wait_for(state="visible", timeout=SHORT_TIMEOUT)
             await done_button.click()
             logger.info("✅ Done button clicked")
 
             # Wait for modal to close
-            await page.wait_for_load_state("domcontentloaded", timeout=10000)
-            await asyncio.sleep(2)
+            await wait_until_ready(page, DONE_BTN, timeout=10000, state="hidden")
 
         except Exception as e:
             logger.warning(f"Could not click Done button: {e}")
@@ -747,7 +1287,7 @@ async def save_pins_to_board(
         return False
 
 
-@retry_on_failure(max_attempts=2, delay=1)
+@retry_on_failure(max_attempts=2, initial_delay=1.0)
 async def navigate_to_more_ideas(page: Page) -> bool:
     """
     Find and click the 'More Ideas' button to navigate to more suggestions
@@ -758,44 +1298,32 @@ async def navigate_to_more_ideas(page: Page) -> bool:
     try:
         logger.info("Looking for 'More Ideas' button...")
 
-        # Multiple selectors to find the "More Ideas" button
-        more_ideas_selectors = [
-            'button:has-text("More Ideas")',
-            'a:has-text("More Ideas")',
-            '[data-test-id="more-ideas-button"]',
-            '[aria-label*="More Ideas" i]',
-            'button[aria-label*="More Ideas" i]',
-            'a[aria-label*="More Ideas" i]',
-            'button:has-text("more ideas")',
-            'a:has-text("more ideas")',
-            'button:has-text("More ideas")',
-            'a:has-text("More ideas")',
-            # Pinterest specific selectors
-            '[data-test-id="pinner-recommendations-more-ideas"]',
-            'button[data-test-id*="more-ideas"]',
-            'a[data-test-id*="more-ideas"]',
-        ]
-
-        # Wait for any of the selectors to appear
+        # Wait for any of the "More Ideas" selectors to appear
         more_ideas_button, used_selector = await wait_for_element(
-            page, more_ideas_selectors, timeout=DEFAULT_TIMEOUT
+            page,
+            MORE_IDEAS_SELECTORS,
+            union=MORE_IDEAS_SELECTORS_UNION,
         )
 
         if not more_ideas_button:
             logger.warning("Could not find 'More Ideas' button with any selector")
             # Take a screenshot for debugging
-            await page.screenshot(path="more_ideas_button_debug.png")
+            await debug_screenshot(page, "/app/debug_screenshots/more_ideas_button_debug.png")
             return False
 
         logger.info(f"Found 'More Ideas' button with selector: {used_selector}")
 
         # Click the button
+        previous_url = page.url
         if not await click_element_safely(page, more_ideas_button, "More Ideas button"):
             return False
 
-        # Wait for navigation to complete
-        await page.wait_for_load_state("domcontentloaded", timeout=NAVIGATION_TIMEOUT)
-        await asyncio.sleep(2)
+        # Pinterest routes client-side here, wait for the URL to change instead of a page load
+        await page.wait_for_url(
+            lambda url: url != previous_url,
+            wait_until="commit",
+        )
+        await asyncio.sleep(SLEEP_TIME_SHORT)
 
         # Verify we're on a new page (URL should have changed)
         current_url = page.url
@@ -809,10 +1337,14 @@ async def navigate_to_more_ideas(page: Page) -> bool:
 
 
 # TODO: break function into smaller more testable functions
-@retry_on_failure(max_attempts=2, delay=1)
-async def extract_pin_images_from_more_ideas(page: Page) -> List[Dict[str, str]]:
+@retry_on_failure(max_attempts=3, initial_delay=0.25, max_delay=8.0, jitter=0.5)
+async def extract_pin_images_from_more_ideas(
+    page: Page, max_scrolls: int = 0
+) -> List[Dict[str, str]]:
     """
     Wait for the more ideas page to load and extract all pin image URLs and alt text
+    With max_scrolls, the grid is scrolled up to that many times and each newly loaded batch
+    of pin containers is extracted too, stopping early when a scroll brings nothing new
         Returns a list of dictionaries with the following keys:
             - image_url: the URL of the pin image
             - alt_text: the alt text of the pin image
@@ -825,149 +1357,62 @@ async def extract_pin_images_from_more_ideas(page: Page) -> List[Dict[str, str]]
     try:
         logger.info("Waiting for more ideas page to load...")
 
-        # Wait for the page to fully load (simplified for Docker)
-        await page.wait_for_load_state("domcontentloaded", timeout=NAVIGATION_TIMEOUT)
-        await asyncio.sleep(5)  # Simple wait instead of networkidle, networkidle breaks in docker container
+        # Wait for the page to load, then for the first pin to render (networkidle breaks in
+        # the docker container), whichever of these shows up first
+        await page.wait_for_load_state("domcontentloaded")
+        if not await wait_until_ready(
+            page,
+            'div[data-test-id="pin"], div[data-test-pin-id], img[src*="pinimg.com"]',
+            timeout=NAVIGATION_TIMEOUT,
+            state="attached",
+        ):
+            await asyncio.sleep(1)
 
         # Take a screenshot for debugging
-        try:
-            await page.screenshot(path="/app/debug_screenshots/more_ideas_page.png")
-            logger.info("Screenshot saved: /app/debug_screenshots/more_ideas_page.png")
-        except Exception as e:
-            logger.warning(f"Could not take screenshot: {e}")
+        await debug_screenshot(page, "/app/debug_screenshots/more_ideas_page.png")
 
         logger.info("Page loaded, extracting pin images...")
-        
-        # Debug: Check what's actually on the page
-        try:
-            current_url = page.url
-            logger.info(f"Current URL: {current_url}")
-            
-            # Check page title
-            title = await page.title()
-            logger.info(f"Page title: {title}")
-            
-            # Count total images on page
-            all_images = await page.query_selector_all("img")
-            logger.info(f"Total images found on page: {len(all_images)}")
-            
-            # Log first few images for debugging
-            for i, img in enumerate(all_images[:5]):
-                try:
-                    src = await img.get_attribute("src")
-                    alt = await img.get_attribute("alt")
+
+        # Debug: Check what's actually on the page (one evaluate, only when diagnostics are on)
+        if debug_enabled():
+            try:
+                logger.info(f"Current URL: {page.url}")
+                title, image_count, div_count, images = await page.evaluate(
+                    _PAGE_SUMMARY_JS
+                )
+                logger.info(f"Page title: {title}")
+                logger.info(f"Total images found on page: {image_count}")
+                for i, (src, alt) in enumerate(images):
                     logger.info(f"Image {i}: src='{src[:50] if src else 'None'}...', alt='{alt[:50] if alt else 'None'}...'")
-                except Exception as e:
-                    logger.warning(f"Error reading image {i}: {e}")
-            
-            # Count total divs on page
-            all_divs = await page.query_selector_all("div")
-            logger.info(f"Total divs found on page: {len(all_divs)}")
-            
-        except Exception as e:
-            logger.error(f"Error during page analysis: {e}")
-
-        # First, try to find pin containers (the full pin components)
-        pin_container_selectors = [
-            'div[data-test-id="pin"]',
-            "div[data-test-pin-id]",
-            "div[data-grid-item-idx]",
-            'div[class*="pin"]',
-            'div[class*="Pin"]',
-            'article[data-test-id="pin"]',
-            'div[role="button"][tabindex="0"]',  # Pinterest often uses these for pin containers
-        ]
+                logger.info(f"Total divs found on page: {div_count}")
+            except Exception as e:
+                logger.error(f"Error during page analysis: {e}")
 
         extracted_pins = []
+        seen_urls: Set[str] = set()  # image URLs already extracted, for O(1) duplicate checks
 
-        # Try to find pin containers first
-        for container_selector in pin_container_selectors:
-            try:
-                logger.info(f"Trying container selector: {container_selector}")
-
-                # Try to find containers without waiting (more robust)
-                containers = await page.query_selector_all(container_selector)
-                
-                if not containers:
-                    logger.info(f"No containers found with selector: {container_selector}")
-                    continue
+        # One round trip reads every container with its link and image, then the containers
+        # are grouped by the highest priority selector they match and the groups tried in order
+        container_groups = _group_rows(
+            await _read_pin_containers(page), PIN_CONTAINER_SELECTORS
+        )
+        if not container_groups:
+            logger.info("No pin containers found")
 
-                if containers:
-                    logger.info(
-                        f"Found {len(containers)} pin containers with selector: {container_selector}"
+        for container_selector, containers in container_groups:
+            logger.info(
+                f"Found {len(containers)} pin containers with selector: {container_selector}"
+            )
+            _add_container_pins(containers, container_selector, extracted_pins, seen_urls)
+
+            # If we found pins with this container selector, break to avoid duplicates
+            if extracted_pins:
+                # The grid scrolls infinitely, later pins only enter the DOM once scrolled to
+                if max_scrolls:
+                    await _scroll_for_more_pins(
+                        page, container_selector, extracted_pins, seen_urls, max_scrolls
                     )
-
-                    for container in containers:
-                        try:
-                            # Extract pin metadata from container
-                            pin_id = (
-                                await container.get_attribute("data-test-pin-id") or ""
-                            )
-
-                            # Find the link element within the container
-                            link_element = await container.query_selector(
-                                "a[href*='/pin/']"
-                            )
-                            pin_link = ""
-                            title_description = ""
-
-                            if link_element:
-                                pin_link = (
-                                    await link_element.get_attribute("href") or ""
-                                )
-                                title_description = (
-                                    await link_element.get_attribute("aria-label") or ""
-                                )
-
-                            # Find the image within the container
-                            img_element = await container.query_selector(
-                                "img[src*='pinimg.com']"
-                            )
-                            if not img_element:
-                                # Fallback to any img in the container
-                                img_element = await container.query_selector("img")
-
-                            if img_element:
-                                # Extract image data
-                                src = await img_element.get_attribute("src")
-                                alt_text = await img_element.get_attribute("alt") or ""
-                                img_title = (
-                                    await img_element.get_attribute("title") or ""
-                                )
-
-                                if src and src.startswith("http"):
-                                    # Combine container metadata with image data
-                                    pin_data = {
-                                        "image_url": src,
-                                        "alt_text": alt_text,
-                                        "title": title_description
-                                        or img_title,  # Prefer container description
-                                        "pin_link": pin_link,
-                                        "pin_id": pin_id,
-                                        "selector_used": container_selector,
-                                    }
-
-                                    # Avoid duplicates based on image URL
-                                    if not any(
-                                        pin["image_url"] == src
-                                        for pin in extracted_pins
-                                    ):
-                                        extracted_pins.append(pin_data)
-                                        logger.debug(
-                                            f"Extracted pin: {src[:50]}... (ID: {pin_id})"
-                                        )
-
-                        except Exception as e:
-                            logger.debug(f"Error processing individual container: {e}")
-                            continue
-
-                    # If we found pins with this container selector, break to avoid duplicates
-                    if extracted_pins:
-                        break
-
-            except Exception as e:
-                logger.debug(f"Container selector {container_selector} failed: {e}")
-                continue
+                break
 
         # Fallback: If no containers found, try the old image-only approach
         if not extracted_pins:
@@ -975,98 +1420,39 @@ async def extract_pin_images_from_more_ideas(page: Page) -> List[Dict[str, str]]
                 "No pin containers found, falling back to image-only extraction..."
             )
 
-            # Multiple selectors to find pin images on Pinterest
-            pin_image_selectors = [
-                'img[src*="pinimg.com"]',  # Pinterest's image CDN
-                'img[data-test-id*="pin"]',
-                'img[alt*="Pin"]',
-                'img[src*="i.pinimg.com"]',
-                'img[data-test-id="pin-image"]',
-                'img[data-test-id="pin-img"]',
-                'img[class*="pin"]',
-                'img[class*="Pin"]',
-                # More specific Pinterest selectors
-                'img[data-test-id="pin-image"]',
-                'img[data-test-id="pin-img"]',
-                'img[data-test-id="pin-image-img"]',
-                # Fallback to any image that might be a pin
-                'img[src*="pin"]',
-                'img[alt*="pin"]',
-            ]
-
-            # Try each selector to find pin images
-            for selector in pin_image_selectors:
-                try:
-                    logger.info(f"Trying image selector: {selector}")
-
-                    # Try to find images without waiting (more robust)
-                    images = await page.query_selector_all(selector)
-                    
-                    if not images:
-                        logger.info(f"No images found with selector: {selector}")
-                        continue
-
-                    if images:
-                        logger.info(
-                            f"Found {len(images)} images with selector: {selector}"
-                        )
-
-                        for img in images:
-                            try:
-                                # Extract image URL
-                                src = await img.get_attribute("src")
-                                if not src:
-                                    continue
-
-                                # Extract alt text
-                                alt = await img.get_attribute("alt") or ""
-
-                                # Extract title if available
-                                title = await img.get_attribute("title") or ""
-
-                                # Get the parent element to find pin link if available
-                                parent = await img.query_selector("xpath=..")
-                                pin_link = ""
-                                if parent:
-                                    link_element = await parent.query_selector(
-                                        "a[href*='/pin/']"
-                                    )
-                                    if link_element:
-                                        pin_link = (
-                                            await link_element.get_attribute("href")
-                                            or ""
-                                        )
-
-                                # Only include if we have a valid image URL
-                                if src and src.startswith("http"):
-                                    pin_data = {
-                                        "image_url": src,
-                                        "alt_text": alt,
-                                        "title": title,
-                                        "pin_link": pin_link,
-                                        "pin_id": "",
-                                        "selector_used": selector,
-                                    }
-
-                                    # Avoid duplicates based on image URL
-                                    if not any(
-                                        pin["image_url"] == src
-                                        for pin in extracted_pins
-                                    ):
-                                        extracted_pins.append(pin_data)
-                                        logger.debug(f"Extracted pin: {src[:50]}...")
-
-                            except Exception as e:
-                                logger.debug(f"Error processing individual image: {e}")
-                                continue
-
-                        # If we found images with this selector, break to avoid duplicates
-                        if extracted_pins:
-                            break
-
-                except Exception as e:
-                    logger.debug(f"Image selector {selector} failed: {e}")
-                    continue
+            # The whole page is needed from here on: one HTML dump, parsed in-process
+            tree = HTMLParser(await page.content())
+
+            # Same single pass + grouping as the containers
+            rows = _pin_image_rows(tree, PIN_IMAGE_SELECTORS, PIN_IMAGE_SELECTORS_UNION)
+            image_groups = _group_rows(rows, PIN_IMAGE_SELECTORS)
+            if not image_groups:
+                logger.info("No images found with the pin image selectors")
+
+            for selector, images in image_groups:
+                logger.info(f"Found {len(images)} images with selector: {selector}")
+                for row in images:
+                    src = row["image_url"]
+                    # Only include if we have a valid image URL
+                    if src and src.startswith("http"):
+                        pin_data = {
+                            "image_url": src,
+                            "alt_text": row["alt_text"],
+                            "title": row["title"],
+                            "pin_link": row["pin_link"],
+                            "pin_id": "",
+                            "selector_used": selector,
+                        }
+
+                        # Avoid duplicates based on image URL
+                        if src not in seen_urls:
+                            seen_urls.add(src)
+                            extracted_pins.append(pin_data)
+                            logger.debug(f"Extracted pin: {src[:50]}...")
+
+                # If we found images with this selector, break to avoid duplicates
+                if extracted_pins:
+                    break
 
             # If still no images found, try a broader approach
             if not extracted_pins:
@@ -1074,40 +1460,33 @@ async def extract_pin_images_from_more_ideas(page: Page) -> List[Dict[str, str]]
                     "No images found with specific selectors, trying broader approach..."
                 )
 
-                # Get all images on the page
-                all_images = await page.query_selector_all("img")
+                # Every image on the page, again in one pass
+                all_images = _pin_image_rows(tree, ("img",), "img")
                 logger.info(f"Trying broader approach with {len(all_images)} total images")
 
-                for img in all_images:
-                    try:
-                        src = await img.get_attribute("src")
-                        alt = await img.get_attribute("alt") or ""
-
-                        # Filter for likely Pinterest images
-                        if (
-                            src
-                            and src.startswith("http")
-                            and (
-                                "pinimg.com" in src
-                                or "pin" in src.lower()
-                                or "pin" in alt.lower()
-                            )
-                        ):
-
-                            pin_data = {
-                                "image_url": src,
-                                "alt_text": alt,
-                                "title": await img.get_attribute("title") or "",
-                                "pin_link": "",
-                                "selector_used": "broad_search",
-                            }
-
-                            if not any(pin["image_url"] == src for pin in extracted_pins):
-                                extracted_pins.append(pin_data)
-
-                    except Exception as e:
-                        logger.debug(f"Error processing image in broad search: {e}")
-                        continue
+                # Filter for likely Pinterest images with one compiled pattern, then keep the
+                # first row per URL (nothing was extracted yet, so seen_urls is empty here)
+                likely_pins: Dict[str, Dict[str, Any]] = {}
+                for row in all_images:
+                    src = row["image_url"]
+                    if (
+                        src
+                        and src.startswith("http")
+                        and (_PIN_RE.search(src) or _PIN_RE.search(row["alt_text"]))
+                    ):
+                        likely_pins.setdefault(src, row)
+
+                seen_urls.update(likely_pins)
+                extracted_pins.extend(
+                    {
+                        "image_url": src,
+                        "alt_text": row["alt_text"],
+                        "title": row["title"],
+                        "pin_link": "",
+                        "selector_used": "broad_search",
+                    }
+                    for src, row in likely_pins.items()
+                )
 
         logger.info(f"Successfully extracted {len(extracted_pins)} unique pin images")
 
@@ -9,17 +9,32 @@ Features:
 - Anti-detection browser configuration
 - Proxy support with validation
 - User agent customization
+- One shared browser per process (BrowserPool), a new context per job
 - Comprehensive resource cleanup
 - Error handling and logging
+- Optional persistent per-account profiles (BROWSER_PROFILES_DIR) for warm starts
+- Blocking of images, fonts, media and analytics the automation never looks at
 
 TODO:
     - Finish cookie management
 """
 
 from __future__ import annotations
+import asyncio
+import atexit
 import logging
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from typing import Optional
+import os
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+)
+from typing import AbstractSet, Awaitable, Callable, Optional
+from app.services.automation.actions import DEFAULT_TIMEOUT, NAVIGATION_TIMEOUT
+from app.util.event_loop import keep_running
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +46,7 @@ BROWSER_CONFIG = {
     "args": [
         "--no-sandbox",
         "--disable-setuid-sandbox",
-        "--disable-dev-shm-usage",
         "--no-first-run",
-        "--no-zygote",
         "--disable-blink-features=AutomationControlled",
         "--disable-web-security",
         "--disable-features=VizDisplayCompositor",
@@ -44,6 +57,41 @@ BROWSER_CONFIG = {
     ],
 }
 
+# When set, each account gets a persistent Chromium profile under this directory, so cookies,
+# HTTP cache and service workers survive between runs instead of cold-starting every time
+BROWSER_PROFILES_DIR = os.getenv("BROWSER_PROFILES_DIR") or None
+
+# Requests the automation doesn't need, selectors only read the DOM and image URLs are taken
+# from src attributes, so the bytes behind them are never used. PIN_BLOCK_RESOURCES=0 turns it off
+# Stylesheets are left out by default: the selectors check visibility, which needs real layout
+BLOCK_RESOURCES = os.getenv("PIN_BLOCK_RESOURCES", "1") == "1"
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "pinimg.com/videos",
+)
+
+
+def _request_blocker(resource_types: AbstractSet[str]) -> Callable[[Route], Awaitable[None]]:
+    """Context route handler that aborts the given resource types and tracking requests"""
+
+    async def block(route: Route) -> None:
+        request = route.request
+        if request.resource_type in resource_types or any(
+            host in request.url for host in BLOCKED_HOSTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    return block
+
+
+# Keys a proxy_config passed to create_context must have (with non-empty values)
+REQUIRED_PROXY_KEYS = frozenset({"server", "username", "password"})
+
 # Default HTTP headers for browser context - more realistic for Pinterest
 DEFAULT_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
@@ -61,13 +109,179 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 }
 
+# Installed on every page of the context, window.__pinWaitAny(selectors, timeout) resolves
+# with the first selector that has a visible match (or null on timeout). It checks on
+# DOM mutations rather than polling, used by actions.wait_for_element for plain CSS selectors
+WAIT_FOR_ANY_INIT_SCRIPT = """
+window.__pinWaitAny = (selectors, timeout) => new Promise((resolve) => {
+    const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    let observer = null;
+    let timer = null;
+    const check = () => {
+        for (const s of selectors) {
+            let els;
+            try { els = document.querySelectorAll(s); } catch (e) { continue; }
+            for (const el of els) {
+                if (visible(el)) {
+                    if (observer) observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(s);
+                    return true;
+                }
+            }
+        }
+        return false;
+    };
+    if (check()) return;
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true});
+    timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeout);
+});
+"""
+
+
+# 0 = close the shared browser as soon as the last job using it stops (e.g. when one process
+# runs a single job), by default it stays up for the next job until the interpreter exits
+BROWSER_KEEP_ALIVE = os.getenv("BROWSER_KEEP_ALIVE", "1") == "1"
+
+
+# Docker workarounds, only used when needed: Chromium falls back from /dev/shm to (slower,
+# disk-backed) /tmp when the container's /dev/shm is small (Docker's default is 64MB), and
+# --no-zygote (no forked renderer template, slower new pages) is opt-in
+BROWSER_SHM_MB = int(os.getenv("BROWSER_SHM_MB", "64"))
+DISABLE_ZYGOTE = os.getenv("DISABLE_ZYGOTE") == "1"
+DOCKER_WORKAROUND_ARGS = (["--disable-dev-shm-usage"] if BROWSER_SHM_MB < 256 else []) + (
+    ["--no-zygote"] if DISABLE_ZYGOTE else []
+)
+
+# Launch arguments: anti-detection configuration plus flags against CPU throttling in Docker
+BROWSER_LAUNCH_ARGS = BROWSER_CONFIG["args"] + DOCKER_WORKAROUND_ARGS + [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-domain-reliability",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-extensions",
+    "--disable-plugins",
+]
+
+
+class BrowserPool:
+    """
+    Process-wide Playwright instance and Chromium browser shared by every job.
+
+    Launching Chromium takes seconds while a new context takes milliseconds, so the
+    browser is started once and each BrowserFactory only creates its own context/page.
+    Playwright objects belong to the event loop they were created on, if a job runs on a
+    different loop (e.g. a Celery task that had to create a new one) a new browser is launched.
+
+    Jobs take the browser with acquire() and hand it back with release(), the pool counts them
+    so it is never closed under a running job, and with BROWSER_KEEP_ALIVE=0 closes it once
+    the last one is done.
+    """
+
+    _playwright: Optional[Playwright] = None
+    _browser: Optional[Browser] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock: Optional[asyncio.Lock] = None
+    _refcount = 0
+    _atexit_registered = False
+
+    @classmethod
+    def _bind_loop(cls) -> asyncio.Lock:
+        """Reset the pool if it was started on another event loop, returns the loop's lock"""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            if cls._browser is not None:
+                logger.warning("Event loop changed, launching a new shared browser")
+            cls._playwright = None
+            cls._browser = None
+            cls._refcount = 0
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def get_playwright(cls) -> Playwright:
+        """Start Playwright once per event loop"""
+        async with cls._bind_loop():
+            if cls._playwright is None:
+                before = asyncio.all_tasks()
+                cls._playwright = await async_playwright().start()
+                # Playwright's connection runs as a task on this loop, it has to survive the
+                # end of the job that happened to start the pool
+                keep_running(asyncio.all_tasks() - before)
+                if not cls._atexit_registered:
+                    atexit.register(cls._shutdown_at_exit)
+                    cls._atexit_registered = True
+            return cls._playwright
+
+    @classmethod
+    async def ensure_started(cls, headless: bool = True) -> Browser:
+        """Return the shared browser, launching it (again, if it crashed) when needed"""
+        playwright = await cls.get_playwright()
+        async with cls._bind_loop():
+            if cls._browser is None or not cls._browser.is_connected():
+                logger.info("Starting Playwright browser")
+                cls._browser = await playwright.chromium.launch(
+                    headless=headless,
+                    args=BROWSER_LAUNCH_ARGS,
+                    timeout=60000,  # 60 second timeout for Docker
+                )
+                logger.info("Playwright browser started successfully")
+            return cls._browser
+
+    @classmethod
+    async def acquire(cls, headless: bool = True) -> Browser:
+        """ensure_started, counting the caller as a user of the browser until release()"""
+        browser = await cls.ensure_started(headless)
+        cls._refcount += 1
+        return browser
+
+    @classmethod
+    async def release(cls) -> None:
+        """Hand back a browser from acquire(), closing it at zero users unless kept alive"""
+        cls._refcount = max(cls._refcount - 1, 0)
+        if cls._refcount == 0 and not BROWSER_KEEP_ALIVE:
+            async with cls._bind_loop():
+                # Another job may have acquired it while waiting for the lock
+                if cls._refcount == 0:
+                    await cls.shutdown()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared browser and stop Playwright"""
+        browser, playwright = cls._browser, cls._playwright
+        cls._browser = None
+        cls._playwright = None
+        for name, close in (
+            ("browser", browser.close if browser else None),
+            ("playwright", playwright.stop if playwright else None),
+        ):
+            if close:
+                try:
+                    await close()
+                except Exception as e:
+                    logger.error(f"Error shutting down shared {name}: {e}")
+
+    @classmethod
+    def _shutdown_at_exit(cls) -> None:
+        loop = cls._loop
+        if loop is None or loop.is_closed() or loop.is_running():
+            return
+        loop.run_until_complete(cls.shutdown())
+
 
 class BrowserFactory:
     """
     Factory class for creating and managing Playwright browser instances.
 
-    This class handles the complete browser lifecycle including:
-    - Browser startup with anti-detection configuration
+    This class handles one job's browser lifecycle including:
+    - Getting the shared browser from BrowserPool (anti-detection configuration)
     - Context creation with proxy and user agent support
     - Page management and cookie handling
     - Resource cleanup and error recovery
@@ -87,13 +301,19 @@ class BrowserFactory:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.user_data_dir: Optional[str] = None
+        self._launch_options: dict = {}
+        # True while this factory holds a BrowserPool reference, given back in stop()
+        self._pooled = False
 
-    async def start(self, headless: bool = True) -> bool:
+    async def start(self, headless: bool = True, user_data_dir: Optional[str] = None) -> bool:
         """
-        Start the Playwright browser with anti-detection configuration.
+        Get the shared Playwright browser for this job, launching it on first use.
 
         Args:
             headless: Whether to run browser in headless mode (default: True)
+            user_data_dir: Optional profile directory, the browser is then launched together
+                with a persistent context in create_context instead of shared
 
         Returns:
             bool: True if browser started successfully, False otherwise
@@ -102,43 +322,27 @@ class BrowserFactory:
         being identified as an automated browser.
         """
         try:
-            logger.info("Starting Playwright browser")
-            self.playwright = await async_playwright().start()
-
-            # Launch browser with anti-detection configuration and CPU throttling
-            browser_args = BROWSER_CONFIG["args"] + [
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows", 
-                "--disable-renderer-backgrounding",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-                "--disable-hang-monitor",
-                "--disable-prompt-on-repost",
-                "--disable-domain-reliability",
-                "--disable-component-extensions-with-background-pages",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--force-color-profile=srgb",
-                "--no-default-browser-check",
-                "--password-store=basic",
-                "--use-mock-keychain",
-                "--disable-extensions",
-                "--disable-plugins",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-            ]
-            
-            self.browser = await self.playwright.chromium.launch(
-                headless=headless, 
-                args=browser_args,
-                timeout=60000  # 60 second timeout for Docker
-            )
+            self.playwright = await BrowserPool.get_playwright()
+            self._launch_options = {
+                "headless": headless,
+                "args": BROWSER_LAUNCH_ARGS,
+                "timeout": 60000,  # 60 second timeout for Docker
+            }
 
-            logger.info("Playwright browser started successfully")
+            # A persistent profile is one browser + context launch, done in create_context
+            # once the proxy and user agent are known
+            if user_data_dir:
+                os.makedirs(user_data_dir, exist_ok=True)
+                self.user_data_dir = user_data_dir
+                logger.info(f"Using persistent browser profile: {user_data_dir}")
+                return True
+
+            # Called again (e.g. after a crash), the reference this factory holds is kept
+            if self._pooled:
+                self.browser = await BrowserPool.ensure_started(headless)
+            else:
+                self.browser = await BrowserPool.acquire(headless)
+                self._pooled = True
             return True
 
         except Exception as e:
@@ -147,44 +351,21 @@ class BrowserFactory:
 
     async def stop(self):
         """
-        Stop the Playwright browser and clean up all resources.
+        Close this job's page and context.
 
-        This method ensures proper cleanup of all browser resources in the correct order:
-        1. Page (if exists)
-        2. Context (if exists)
-        3. Browser (if exists)
-        4. Playwright instance (if exists)
-
-        Each cleanup step is handled independently to ensure maximum resource cleanup
-        even if individual steps fail.
+        The shared browser is handed back to BrowserPool, it stays up for the next job and is
+        closed at interpreter exit (or right away with BROWSER_KEEP_ALIVE=0 when this was
+        its last user). A persistent profile context owns its browser, so closing the
+        context closes that browser too.
         """
-        # Define cleanup order (page -> context -> browser -> playwright)
-        cleanup_order = [
-            ("page", self.page),
-            ("context", self.context),
-            ("browser", self.browser),
-            ("playwright", self.playwright),
-        ]
-
-        for resource_name, resource in cleanup_order:
-            if resource:
-                try:
-                    if resource_name == "page":
-                        await resource.close()
-                    elif resource_name == "context":
-                        await resource.close()
-                    elif resource_name == "browser":
-                        await resource.close()
-                    elif resource_name == "playwright":
-                        await resource.stop()
-
-                    # Clear the reference
-                    setattr(self, resource_name, None)
-                    logger.debug(f"Cleaned up {resource_name}")
-
-                except Exception as e:
-                    logger.error(f"Error cleaning up {resource_name}: {e}")
+        await self.stop_context()
 
+        # Only references to the shared instances, not closed here
+        self.browser = None
+        self.playwright = None
+        if self._pooled:
+            self._pooled = False
+            await BrowserPool.release()
         logger.info("Playwright browser cleanup completed")
 
     def _validate_proxy_config(self, proxy_config: dict) -> bool:
@@ -201,17 +382,23 @@ class BrowserFactory:
             logger.error("Invalid proxy_config: must be a dictionary")
             return False
 
-        required_keys = ["server", "username", "password"]
-        missing_keys = [key for key in required_keys if key not in proxy_config]
-
+        missing_keys = REQUIRED_PROXY_KEYS - proxy_config.keys()
         if missing_keys:
-            logger.error(f"Invalid proxy_config: missing required keys: {missing_keys}")
+            logger.error(f"Invalid proxy_config: missing required keys: {sorted(missing_keys)}")
+            return False
+
+        empty_keys = [key for key in REQUIRED_PROXY_KEYS if not proxy_config[key]]
+        if empty_keys:
+            logger.error(f"Invalid proxy_config: empty values for keys: {sorted(empty_keys)}")
             return False
 
         return True
 
     async def create_context(
-        self, proxy_config: Optional[dict] = None, user_agent: Optional[str] = None
+        self,
+        proxy_config: Optional[dict] = None,
+        user_agent: Optional[str] = None,
+        block_resources: Optional[AbstractSet[str]] = BLOCKED_RESOURCE_TYPES,
     ) -> bool:
         """
         Create a browser context with optional proxy configuration and user agent.
@@ -219,6 +406,8 @@ class BrowserFactory:
         Args:
             proxy_config: Optional proxy configuration dictionary with server, username, password
             user_agent: Optional custom user agent string
+            block_resources: Resource types to abort (e.g. add "stylesheet"), None or empty
+                to load everything, e.g. for screenshots. PIN_BLOCK_RESOURCES=0 also disables it
 
         Returns:
             bool: True if context created successfully, False otherwise
@@ -227,7 +416,7 @@ class BrowserFactory:
         for web scraping operations.
         """
         # Validate browser is available
-        if not self.browser:
+        if not self.browser and not self.user_data_dir:
             logger.error("No browser available for context creation")
             return False
 
@@ -235,39 +424,25 @@ class BrowserFactory:
         if proxy_config and not self._validate_proxy_config(proxy_config):
             return False
 
+        context_options = self._context_options(proxy_config, user_agent)
+        if context_options is None:
+            return False
+
         try:
             logger.info("Creating browser context")
 
-            # Prepare context options with default configuration
-            context_options = {
-                "viewport": BROWSER_CONFIG["viewport"],
-                "ignore_https_errors": True,
-                "extra_http_headers": DEFAULT_HEADERS,
-            }
-
-            # Add user agent if provided
-            if user_agent:
-                if not isinstance(user_agent, str):
-                    logger.error("Invalid user_agent: must be a string")
-                    return False
-                context_options["user_agent"] = user_agent
-                logger.info(f"Using custom user agent: {user_agent[:50]}...")
-
-            # Add proxy configuration if provided
-            if proxy_config:
-                context_options["proxy"] = proxy_config
-                logger.info(
-                    f"Added proxy configuration: {proxy_config.get('server', 'unknown')}"
-                )
+            # Called again on the same factory: close the old context first
+            if self.context:
+                await self.stop_context()
 
             # Create browser context
-            self.context = await self.browser.new_context(**context_options)
-
-            # Create a new page in the context
-            self.page = await self.context.new_page()
-
-            # Set page headers (same as context headers for consistency)
-            await self.page.set_extra_http_headers(DEFAULT_HEADERS)
+            if self.user_data_dir:
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    self.user_data_dir, **self._launch_options, **context_options
+                )
+            else:
+                self.context = await self.browser.new_context(**context_options)
+            self.page = await self._setup_context(self.context, block_resources)
 
             logger.info("Browser context created successfully")
             return True
@@ -276,6 +451,68 @@ class BrowserFactory:
             logger.error(f"Failed to create context: {e}")
             return False
 
+    async def stop_context(self) -> None:
+        """Close the current context (and with it its page) only"""
+        resource = self.context or self.page
+        self.context = None
+        self.page = None
+        if resource:
+            try:
+                await resource.close()
+            except Exception as e:
+                logger.error(f"Error cleaning up context: {e}")
+
+    def _context_options(
+        self, proxy_config: Optional[dict], user_agent: Optional[str]
+    ) -> Optional[dict]:
+        """Build new_context options, None if the user agent is invalid"""
+        # Prepare context options with default configuration
+        context_options = {
+            "viewport": BROWSER_CONFIG["viewport"],
+            "ignore_https_errors": True,
+            "extra_http_headers": DEFAULT_HEADERS,
+        }
+
+        # Add user agent if provided
+        if user_agent:
+            if not isinstance(user_agent, str):
+                logger.error("Invalid user_agent: must be a string")
+                return None
+            context_options["user_agent"] = user_agent
+            logger.info(f"Using custom user agent: {user_agent[:50]}...")
+
+        # Add proxy configuration if provided
+        if proxy_config:
+            context_options["proxy"] = proxy_config
+            logger.info(
+                f"Added proxy configuration: {proxy_config.get('server', 'unknown')}"
+            )
+        return context_options
+
+    async def _setup_context(
+        self, context: BrowserContext, block_resources: Optional[AbstractSet[str]]
+    ) -> Page:
+        """Apply timeouts, init script and request blocking to a new context, return its page"""
+        # One timeout policy for every page, the actions only pass timeout= to deviate from it
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        # Both are context-level registrations, sent together rather than one after the other
+        setup = [context.add_init_script(WAIT_FOR_ANY_INIT_SCRIPT)]
+        if BLOCK_RESOURCES and block_resources:
+            setup.append(context.route("**/*", _request_blocker(block_resources)))
+        await asyncio.gather(*setup)
+
+        # Create a new page in the context (a persistent context opens with one)
+        if context.pages:
+            page = context.pages[0]
+            # the init script only applies to documents loaded after it was added
+            await page.evaluate(WAIT_FOR_ANY_INIT_SCRIPT)
+        else:
+            page = await context.new_page()
+
+        # No per-page set_extra_http_headers, the context's extra_http_headers already apply
+        return page
+
     async def add_cookies(self, cookies: list) -> bool:
         """
         Add cookies to the browser context for session persistence.
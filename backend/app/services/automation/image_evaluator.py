@@ -14,32 +14,134 @@ Algorithm and rationale:
 - the description is a string
 """
 
+import asyncio
+import os
+import random
+import time
+import httpx
+import msgspec
 import spacy
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 from app.util.config import get_settings
-from json import loads as json_loads
-from requests import post, RequestException
 
 # Configuration constants
 EVALUATION_CONFIG = {
     "object_weight": 0.5,
     "style_weight": 0.5,
     "timeout_seconds": 30,
+    # A batch request's timeout grows with its images: timeout_seconds + this per image
+    "timeout_seconds_per_image": 5,
+    "max_batch_size": 10,
+    "max_connections": 32,
+    "keepalive_seconds": 120,
     "max_retries": 3,
     "retry_delay": 1,
+    "max_retry_delay": 60,
+    # Account limits for gpt-4o-mini, and how many worker processes make requests against
+    # them (the io worker's -c). Each process throttles itself to its share of the limits
+    "requests_per_minute": int(os.getenv("OPENAI_RPM", "500")),
+    "tokens_per_minute": int(os.getenv("OPENAI_TPM", "200000")),
+    "worker_processes": max(1, int(os.getenv("OPENAI_WORKER_PROCESSES", "1"))),
+    # Token estimate per image (low detail image cost) and per answer object
+    "tokens_per_image": 85,
+    "output_tokens_per_image": 80,
 }
 
+# Statuses worth retrying: rate limited, or the API failing on its side
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
-def split_prompt_by_nouns_and_adjectives(prompt: str) -> Tuple[str, str]:
+
+class RateLimiter:
     """
-    Splits the prompt into adjectives and nouns
+    Token bucket refilled continuously to `per_minute` units per minute.
+    acquire() reserves its units right away, going into debt if the bucket is short, and
+    then sleeps until the debt is repaid: concurrent callers queue up in order without a lock
+    (which also keeps it usable from whichever event loop a task runs on)
     """
-    NLP = spacy.load("en_core_web_sm", disable=["parser", "ner"])
-    ADJ = {"ADJ"}
-    NOUNS = {"NOUN", "PROPN"}
-    prompt_lower = prompt.lower()
-    doc = NLP(prompt_lower)
 
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= min(amount, self.capacity)
+        if self.level < 0:
+            await asyncio.sleep(-self.level / self.rate)
+
+
+# Requests are throttled before they are sent, so they stay just under the limits instead
+# of running into 429s and being retried. The buckets are per process (each prefork child
+# has its own), so each gets an even share of the account limits
+_processes = EVALUATION_CONFIG["worker_processes"]
+request_limiter = RateLimiter(
+    max(1, EVALUATION_CONFIG["requests_per_minute"] // _processes)
+)
+token_limiter = RateLimiter(
+    max(1, EVALUATION_CONFIG["tokens_per_minute"] // _processes)
+)
+
+# One AsyncClient (and so one connection pool) per event loop, connections can't be shared
+# across loops and a Celery task may have to run on a new one
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Returns the shared OpenAI HTTP client for the running event loop
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        # Idle connections are kept open (and their TLS sessions with them) between
+        # evaluations, the key and content type are sent as the client's default headers
+        _client = httpx.AsyncClient(
+            base_url="https://api.openai.com/v1",
+            headers={
+                "Authorization": f"Bearer {get_settings().openai_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=EVALUATION_CONFIG["timeout_seconds"],
+            limits=httpx.Limits(
+                max_connections=EVALUATION_CONFIG["max_connections"],
+                max_keepalive_connections=EVALUATION_CONFIG["max_connections"],
+                keepalive_expiry=EVALUATION_CONFIG["keepalive_seconds"],
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+ADJ = {"ADJ"}
+NOUNS = {"NOUN", "PROPN"}
+
+
+# Package name or path of the spaCy pipeline, the Docker image saves a tagger-only copy of
+# en_core_web_sm to disk at build time and points this at it (less to deserialize at load)
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+
+@lru_cache
+def get_nlp() -> spacy.language.Language:
+    """
+    Loads the spaCy pipeline once per process, on first use rather than at import so
+    forked Celery workers that never validate don't pay for it.
+    Only the tagger (and the tok2vec it listens to) and the attribute ruler, which maps
+    the tagger's fine-grained tags to the coarse pos_ read here, run
+    """
+    return spacy.load(SPACY_MODEL, exclude=["parser", "ner", "lemmatizer", "senter"])
+
+
+def _phrases(doc: spacy.tokens.Doc) -> Tuple[str, str]:
+    """
+    Style (adjectives) and object (nouns) phrases of a tagged, lowercased prompt
+    """
     adjectives = [tok.text for tok in doc if tok.pos_ in ADJ]
     nouns = [tok.text for tok in doc if tok.pos_ in NOUNS]
 
@@ -48,45 +150,80 @@ def split_prompt_by_nouns_and_adjectives(prompt: str) -> Tuple[str, str]:
 
     # Fallbacks ensure non‑empty strings
     if not style_phrase:
-        style_phrase = prompt_lower
+        style_phrase = doc.text
     if not object_phrase:
-        object_phrase = prompt_lower
+        object_phrase = doc.text
 
     return style_phrase, object_phrase
 
 
-def create_image_evaluation_prompt(
-    prompt: str, image_url: str, style_phrase: str, object_phrase: str
-) -> dict:
+@lru_cache(maxsize=256)
+def split_prompt_by_nouns_and_adjectives(prompt: str) -> Tuple[str, str]:
     """
-    Creates the prompt for the image evaluator
+    Splits the prompt into adjectives and nouns
+    Cached, every batch of a validation run splits the same prompt
+    A single word is returned as both phrases without tagging it: whatever its tag, one
+    side is empty and the fallback fills it with the whole prompt
     """
-    system_message = (
-        "You are an image curator."
-        "Respond ONLY with valid JSON of format:\n"
-        '{"object":0.00, "style":0.00, "image_description":"...", "evaluation_explanation":"..."}'
-    )
+    prompt_lower = prompt.lower()
+    if prompt_lower.isalpha():
+        return prompt_lower, prompt_lower
+    return _phrases(get_nlp()(prompt_lower))
 
-    user_message = (
-        "Critically rate how well this image matches the prompt in the following way:"
-        "Provide two floats between 0 and 1 for how well the image matches the style phrase and the object phrase respectively."
-        "Provide a brief explanation for your score, 15 words max."
-        "Provide a description of the image, 15 words max."
-        f"Prompt: {prompt}\n"
-        f"Image URL: {image_url}\n"
-        f"Style phrase: {style_phrase}\n"
-        f"Object phrase: {object_phrase}\n"
-    )
 
+# Prompt text for the image evaluator, the constant parts are built once and the per-call
+# values filled in with str.format
+_INSTRUCTIONS = (
+    "Provide two floats between 0 and 1 for how well the image matches the style phrase and the object phrase respectively."
+    "Provide a brief explanation for your score, 15 words max."
+    "Provide a description of the image, 15 words max."
+)
+_RESPONSE_OBJECT = '{"object":0.00, "style":0.00, "image_description":"...", "evaluation_explanation":"..."}'
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an image curator."
+    "Respond ONLY with valid JSON of format:\n" + _RESPONSE_OBJECT,
+}
+_BATCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an image curator."
+    "Respond ONLY with a valid JSON array, one object per image in the order given, of format:\n"
+    "[" + _RESPONSE_OBJECT + "]",
+}
+_USER_TEMPLATE = (
+    "Critically rate how well this image matches the prompt in the following way:"
+    + _INSTRUCTIONS
+    + "Prompt: {prompt}\n"
+    "Image URL: {image_url}\n"
+    "Style phrase: {style_phrase}\n"
+    "Object phrase: {object_phrase}\n"
+)
+_BATCH_USER_TEMPLATE = (
+    "Critically rate how well each of these images matches the prompt in the following way:"
+    + _INSTRUCTIONS
+    + "Prompt: {prompt}\n"
+    "Style phrase: {style_phrase}\n"
+    "Object phrase: {object_phrase}\n"
+    "Return a JSON array of {count} objects in the order of the images.\n"
+)
+
+
+def _evaluation_body(
+    system_message: dict, user_message: str, image_urls: Sequence[str]
+) -> dict:
+    """
+    Chat completion body: the system message, then the text followed by the images
+    """
     return {
         "model": "gpt-4o-mini",
         "messages": [
-            {"role": "system", "content": system_message},
+            system_message,
             {
                 "role": "user",
-                "content": [
-                    {"type": "text", "text": user_message},
-                    {"type": "image_url", "image_url": {"url": image_url}},
+                "content": [{"type": "text", "text": user_message}]
+                + [
+                    {"type": "image_url", "image_url": {"url": image_url}}
+                    for image_url in image_urls
                 ],
             },
         ],
@@ -94,37 +231,142 @@ def create_image_evaluation_prompt(
     }
 
 
-def score_image_against_prompt(image_url: str, prompt: str) -> tuple[float, dict]:
+def create_image_evaluation_prompt(
+    prompt: str, image_url: str, style_phrase: str, object_phrase: str
+) -> dict:
     """
-    Scores the image against the prompt
+    Creates the prompt for the image evaluator
     """
-    # Input validation
-    if not image_url or not prompt:
-        raise ValueError("Both image_url and prompt must be provided and non-empty")
+    user_message = _USER_TEMPLATE.format(
+        prompt=prompt,
+        image_url=image_url,
+        style_phrase=style_phrase,
+        object_phrase=object_phrase,
+    )
+    return _evaluation_body(_SYSTEM_MESSAGE, user_message, (image_url,))
+
+
+def create_batch_evaluation_prompt(
+    prompt: str, image_urls: Sequence[str], style_phrase: str, object_phrase: str
+) -> dict:
+    """
+    Creates one prompt that evaluates several images, the instructions and prompt phrases
+    are sent (and billed) once for the whole batch instead of once per image
+    """
+    user_message = _BATCH_USER_TEMPLATE.format(
+        prompt=prompt,
+        style_phrase=style_phrase,
+        object_phrase=object_phrase,
+        count=len(image_urls),
+    )
+    return _evaluation_body(_BATCH_SYSTEM_MESSAGE, user_message, image_urls)
+
+
+# Response schemas, decoded straight into these Structs instead of walking dicts
+# Only the fields used are declared, msgspec skips the rest of the response
+class _Message(msgspec.Struct):
+    content: str
+
+
+class _Choice(msgspec.Struct):
+    message: _Message
+
+
+class _ChatResponse(msgspec.Struct):
+    choices: List[_Choice]
 
-    if not isinstance(image_url, str) or not isinstance(prompt, str):
-        raise TypeError("Both image_url and prompt must be strings")
 
+class Evaluation(msgspec.Struct):
+    """One image's evaluation, as the model is asked to respond in _RESPONSE_OBJECT"""
+
+    object: float
+    style: float
+    image_description: str = ""
+    evaluation_explanation: str = ""
+
+
+_chat_decoder = msgspec.json.Decoder(_ChatResponse)
+# strict=False keeps accepting scores the model quotes as strings, e.g. "0.8"
+_evaluation_decoder = msgspec.json.Decoder(Evaluation, strict=False)
+_evaluations_decoder = msgspec.json.Decoder(List[Evaluation], strict=False)
+
+
+def _check_image_url(image_url: str) -> None:
+    if not isinstance(image_url, str):
+        raise TypeError("image_url must be a string")
     if not image_url.startswith(("http://", "https://")):
         raise ValueError("image_url must be a valid HTTP/HTTPS URL")
 
-    settings = get_settings()
-    style, object_ = split_prompt_by_nouns_and_adjectives(prompt)
-    body = create_image_evaluation_prompt(prompt, image_url, style, object_)
 
-    try:
-        response = post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {settings.openai_key}",
-                "Content-Type": "application/json",
-            },
-            json=body,
-            timeout=EVALUATION_CONFIG["timeout_seconds"],
-        )
-        response.raise_for_status()
-    except RequestException as e:
-        if hasattr(e, "response") and e.response is not None:
+def _estimate_tokens(body: dict) -> int:
+    """
+    Rough token count of a completion request (4 characters per token for the text),
+    used to throttle against the tokens per minute limit
+    """
+    chars = 0
+    images = 0
+    for message in body["messages"]:
+        content = message["content"]
+        if isinstance(content, str):
+            chars += len(content)
+            continue
+        for part in content:
+            if part["type"] == "text":
+                chars += len(part["text"])
+            else:
+                images += 1
+    return chars // 4 + images * (
+        EVALUATION_CONFIG["tokens_per_image"]
+        + EVALUATION_CONFIG["output_tokens_per_image"]
+    )
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """
+    Exponential backoff with full jitter, or the server's Retry-After when it sends one
+    """
+    if response is not None:
+        try:
+            return min(
+                float(response.headers["retry-after"]),
+                EVALUATION_CONFIG["max_retry_delay"],
+            )
+        except (KeyError, ValueError):
+            pass
+    return random.uniform(
+        0,
+        min(
+            EVALUATION_CONFIG["retry_delay"] * 2**attempt,
+            EVALUATION_CONFIG["max_retry_delay"],
+        ),
+    )
+
+
+async def _request_completion(body: dict, timeout: float) -> str:
+    """
+    Posts a chat completion and returns the message content, API errors become RuntimeErrors
+    Requests are throttled to the configured rate limits, rate limited (429), server (5xx)
+    and network errors are retried up to EVALUATION_CONFIG["max_retries"] times
+    """
+    tokens = _estimate_tokens(body)
+    attempt = 0
+    while True:
+        await request_limiter.acquire()
+        await token_limiter.acquire(tokens)
+        try:
+            response = await get_client().post(
+                "/chat/completions", json=body, timeout=timeout
+            )
+            response.raise_for_status()
+            break
+        except httpx.HTTPStatusError as e:
+            if (
+                e.response.status_code in RETRYABLE_STATUS_CODES
+                and attempt < EVALUATION_CONFIG["max_retries"]
+            ):
+                await asyncio.sleep(_retry_delay(attempt, e.response))
+                attempt += 1
+                continue
             if e.response.status_code == 429:
                 raise RuntimeError("OpenAI API rate limit exceeded")
             elif e.response.status_code == 401:
@@ -139,31 +381,33 @@ def score_image_against_prompt(image_url: str, prompt: str) -> tuple[float, dict
                 raise RuntimeError(
                     f"OpenAI API request failed (HTTP {e.response.status_code}): {e}"
                 )
-        else:
+        except httpx.TransportError as e:
+            if attempt < EVALUATION_CONFIG["max_retries"]:
+                await asyncio.sleep(_retry_delay(attempt, None))
+                attempt += 1
+                continue
+            raise RuntimeError(f"OpenAI API request failed (network error): {e}")
+        except httpx.RequestError as e:
             raise RuntimeError(f"OpenAI API request failed (network error): {e}")
 
     try:
-        raw_json = response.json()
-        message_content = raw_json["choices"][0]["message"]["content"]
-        resp = json_loads(message_content)
-
-        # Validate response structure
-        if "object" not in resp or "style" not in resp:
-            raise RuntimeError(
-                "OpenAI response missing required 'object' or 'style' fields"
-            )
+        return _chat_decoder.decode(response.content).choices[0].message.content
+    except (msgspec.MsgspecError, IndexError) as e:
+        raise RuntimeError(f"Malformed OpenAI response: {e}")
 
-        obj_score = float(resp["object"])
-        style_score = float(resp["style"])
 
-        # Validate score ranges
-        if not (0 <= obj_score <= 1):
-            raise RuntimeError(f"Invalid object score: {obj_score} (must be 0-1)")
-        if not (0 <= style_score <= 1):
-            raise RuntimeError(f"Invalid style score: {style_score} (must be 0-1)")
+def _score_evaluation(resp: Evaluation) -> tuple[float, dict]:
+    """
+    Validates one image's evaluation scores and combines them into the final score
+    """
+    obj_score = resp.object
+    style_score = resp.style
 
-    except (KeyError, json_loads, ValueError) as e:
-        raise RuntimeError(f"Malformed OpenAI response: {e}")
+    # Validate score ranges
+    if not (0 <= obj_score <= 1):
+        raise RuntimeError(f"Invalid object score: {obj_score} (must be 0-1)")
+    if not (0 <= style_score <= 1):
+        raise RuntimeError(f"Invalid style score: {style_score} (must be 0-1)")
 
     final = (
         EVALUATION_CONFIG["object_weight"] * obj_score
@@ -172,6 +416,74 @@ def score_image_against_prompt(image_url: str, prompt: str) -> tuple[float, dict
     detail = {
         "object_score": obj_score,
         "style_score": style_score,
-        "explanation": resp.get("evaluation_explanation", ""),
+        "explanation": resp.evaluation_explanation,
     }
     return final, detail
+
+
+async def score_image_against_prompt(image_url: str, prompt: str) -> tuple[float, dict]:
+    """
+    Scores the image against the prompt
+    """
+    # Input validation
+    if not image_url or not prompt:
+        raise ValueError("Both image_url and prompt must be provided and non-empty")
+
+    if not isinstance(image_url, str) or not isinstance(prompt, str):
+        raise TypeError("Both image_url and prompt must be strings")
+
+    _check_image_url(image_url)
+
+    style, object_ = split_prompt_by_nouns_and_adjectives(prompt)
+    body = create_image_evaluation_prompt(prompt, image_url, style, object_)
+    message_content = await _request_completion(
+        body, EVALUATION_CONFIG["timeout_seconds"]
+    )
+
+    try:
+        resp = _evaluation_decoder.decode(message_content)
+    except msgspec.MsgspecError as e:
+        raise RuntimeError(f"Malformed OpenAI response: {e}")
+    return _score_evaluation(resp)
+
+
+async def score_images_against_prompt(
+    image_urls: Sequence[str], prompt: str
+) -> List[tuple[float, dict]]:
+    """
+    Scores several images against the prompt with a single request
+    Returns one (score, detail) per image, in the order of image_urls
+    At most EVALUATION_CONFIG["max_batch_size"] images fit one request, callers chunk the rest
+    The timeout applies to each attempt's HTTP request and scales with the number of images,
+    waiting on the rate limiters or between retries doesn't count against it
+    """
+    # Input validation
+    if not image_urls or not prompt:
+        raise ValueError("Both image_urls and prompt must be provided and non-empty")
+
+    if not isinstance(prompt, str):
+        raise TypeError("prompt must be a string")
+
+    if len(image_urls) > EVALUATION_CONFIG["max_batch_size"]:
+        raise ValueError(
+            f"At most {EVALUATION_CONFIG['max_batch_size']} images can be scored per request"
+        )
+
+    for image_url in image_urls:
+        _check_image_url(image_url)
+
+    style, object_ = split_prompt_by_nouns_and_adjectives(prompt)
+    body = create_batch_evaluation_prompt(prompt, image_urls, style, object_)
+    per_image = EVALUATION_CONFIG["timeout_seconds_per_image"]
+    timeout = EVALUATION_CONFIG["timeout_seconds"] + per_image * len(image_urls)
+    message_content = await _request_completion(body, timeout)
+
+    try:
+        resp = _evaluations_decoder.decode(message_content)
+    except msgspec.MsgspecError as e:
+        raise RuntimeError(f"Malformed OpenAI response: {e}")
+    if len(resp) != len(image_urls):
+        raise RuntimeError(
+            f"Malformed OpenAI response: expected a JSON array of {len(image_urls)} objects"
+        )
+    return [_score_evaluation(item) for item in resp]
@@ -2,12 +2,17 @@
 Celery Application
 
 This module initializes the Celery application with the following configuration:
-- Task serialization format
+- Task serialization format (msgpack, json still accepted)
+- Fair scheduling for long tasks (no prefetch, late acks)
+- Queue routing: browser scraping on "cpu", OpenAI validation on "io"
+- uvloop as the event loop of the tasks' async code
 - Timezone
 - Task discovery
 """
 
+import asyncio
 from celery import Celery
+from celery.signals import worker_init
 from app.util.config import get_settings
 
 s = get_settings()
@@ -15,12 +20,42 @@ celery_app = Celery("pinmatch", broker=s.redis_url, backend=s.redis_url)
 
 # celery config
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack payloads are smaller and faster to (de)serialize, json is still accepted
+    # so tasks queued before the switch can run
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    # Scraping and validation run for minutes with very uneven durations, so a worker
+    # process only reserves the task it is running and acks it when done, instead of
+    # prefetching tasks that then wait behind a slow one
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # Unacked tasks are redelivered after this long, keep it above the longest task
+    broker_transport_options={"visibility_timeout": 3600},
+    result_expires=3600,
     timezone="UTC",
     enable_utc=True,
+    # Scraping drives a Chromium per task and is bound by CPU and memory, validation mostly
+    # waits on OpenAI, so they get separate queues and workers sized for each:
+    #   celery -A app.services.celery_app worker -Q cpu -c 2
+    #   celery -A app.services.celery_app worker -Q io -c 8
+    task_routes={
+        "app.tasks.warmup_and_scraping": {"queue": "cpu"},
+        "app.tasks.validation": {"queue": "io"},
+    },
 )
 
 # discover tasks in the app.tasks package
 celery_app.autodiscover_tasks(["app.tasks"])
+
+
+@worker_init.connect
+def _install_uvloop(**_):
+    # The tasks run their async code on loops created through the policy, set it in the
+    # main worker process before the pool forks so every child inherits it
+    # uvloop is a dependency everywhere but Windows, where the stock loop is used
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
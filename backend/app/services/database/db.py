@@ -1,12 +1,29 @@
 """
 Database Connection
 
-This module provides a connection to the MongoDB database using Motor async driver.
+This module provides a connection to the MongoDB database using Motor async driver,
+and the indexes the repositories rely on.
 """
 
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.util.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 client = AsyncIOMotorClient(settings.mongo_uri)
 db = client.pinmatch
+
+
+async def ensure_indexes() -> None:
+    """
+    Create the indexes the repositories query by, pins and sessions are looked up by
+    prompt_id. create_index is a no-op when the index already exists
+    """
+    try:
+        await db.pins.create_index("prompt_id")
+        await db.sessions.create_index("prompt_id")
+    except Exception as e:
+        # Queries still work without them, only slower
+        logger.error(f"Failed to create indexes: {e}")
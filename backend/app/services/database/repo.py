@@ -15,18 +15,38 @@ TODO:
 - Break out into separate files for each entity
 """
 
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 from bson import ObjectId
-from datetime import datetime
+from pymongo import UpdateOne
+from datetime import datetime, timezone
 from app.services.database.db import db
 from app.models.pinterest_account import PinterestAccount
 from app.models.prompt import Prompt
 from app.models.session import Session
-from app.models.pin import Pin
+from app.models.pin import Pin, PinMetadata
+from app.models.pin_struct import PinStruct
 import logging
 
 logger = logging.getLogger(__name__)
 
+# IDs can be passed as strings or as already parsed ObjectIds
+OidLike = Union[str, ObjectId]
+
+
+@lru_cache(maxsize=10000)
+def _parse_oid(value: str) -> ObjectId:
+    return ObjectId(value)
+
+
+def _to_oid(value: OidLike) -> ObjectId:
+    """
+    ObjectId for an ID, a task keeps using the same few prompt/session/pin IDs so the
+    parsed ObjectIds of strings are cached
+    """
+    return value if isinstance(value, ObjectId) else _parse_oid(value)
+
 
 class PromptRepo:
     """
@@ -58,14 +78,48 @@ class PromptRepo:
             return None
 
         try:
-            res = Prompt(text=text, status="pending", created_at=datetime.utcnow())
+            res = Prompt(
+                text=text, status="pending", created_at=datetime.now(timezone.utc)
+            )
             res = await self._col.insert_one(res.model_dump())
             return str(res.inserted_id)
         except Exception as e:
             logger.error(f"Failed to create prompt: {e}")
             return None
 
-    async def get(self, pid: str) -> Optional[Dict[str, Any]]:
+    async def create_with_id(self, pid: str, text: str) -> bool:
+        """
+        Create a new prompt under a pre-generated ID.
+
+        Lets the caller know the ID up front so dependent inserts can run concurrently.
+
+        Args:
+            pid: Prompt ID (ObjectId string) generated by the caller
+            text: The user's search prompt text
+
+        Returns:
+            bool: True if creation successful, False otherwise
+        """
+        # Input validation
+        if not pid or not isinstance(pid, str):
+            logger.error("Invalid prompt ID provided for prompt creation")
+            return False
+        if not text or not isinstance(text, str):
+            logger.error("Invalid text parameter provided for prompt creation")
+            return False
+
+        try:
+            doc = Prompt(
+                text=text, status="pending", created_at=datetime.now(timezone.utc)
+            ).model_dump()
+            doc["_id"] = _to_oid(pid)
+            await self._col.insert_one(doc)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create prompt {pid}: {e}")
+            return False
+
+    async def get(self, pid: OidLike) -> Optional[Dict[str, Any]]:
         """
         Retrieve a prompt by its ID.
 
@@ -76,17 +130,17 @@ class PromptRepo:
             dict: Prompt data, or None if not found or error occurred
         """
         # Input validation
-        if not pid or not isinstance(pid, str):
+        if not pid or not isinstance(pid, (str, ObjectId)):
             logger.error("Invalid prompt ID provided")
             return None
 
         try:
-            return await self._col.find_one({"_id": ObjectId(pid)})
+            return await self._col.find_one({"_id": _to_oid(pid)})
         except Exception as e:
             logger.error(f"Failed to get prompt {pid}: {e}")
             return None
 
-    async def update_status(self, pid: str, status: str) -> bool:
+    async def update_status(self, pid: OidLike, status: str) -> bool:
         """
         Update the status of a prompt.
 
@@ -98,7 +152,7 @@ class PromptRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not pid or not isinstance(pid, str):
+        if not pid or not isinstance(pid, (str, ObjectId)):
             logger.error("Invalid prompt ID provided for status update")
             return False
         if not status or not isinstance(status, str):
@@ -107,14 +161,14 @@ class PromptRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(pid)}, {"$set": {"status": status}}
+                {"_id": _to_oid(pid)}, {"$set": {"status": status}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update status for prompt {pid}: {e}")
             return False
 
-    async def delete(self, pid: str) -> bool:
+    async def delete(self, pid: OidLike) -> bool:
         """
         Delete a prompt from the database.
 
@@ -125,12 +179,12 @@ class PromptRepo:
             bool: True if deletion successful, False otherwise
         """
         # Input validation
-        if not pid or not isinstance(pid, str):
+        if not pid or not isinstance(pid, (str, ObjectId)):
             logger.error("Invalid prompt ID provided for deletion")
             return False
 
         try:
-            await self._col.delete_one({"_id": ObjectId(pid)})
+            await self._col.delete_one({"_id": _to_oid(pid)})
             return True
         except Exception as e:
             logger.error(f"Failed to delete prompt {pid}: {e}")
@@ -170,7 +224,7 @@ class PinterestAccountRepo:
             logger.error(f"Failed to create account: {e}")
             return None
 
-    async def update_state(self, account_id: str, state: PinterestAccount) -> bool:
+    async def update_state(self, account_id: OidLike, state: PinterestAccount) -> bool:
         """
         Update an existing Pinterest account with new state.
 
@@ -182,7 +236,7 @@ class PinterestAccountRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not account_id or not isinstance(account_id, str):
+        if not account_id or not isinstance(account_id, (str, ObjectId)):
             logger.error("Invalid account ID provided for state update")
             return False
         if not state or not isinstance(state, PinterestAccount):
@@ -191,7 +245,7 @@ class PinterestAccountRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(account_id)}, {"$set": state.model_dump()}
+                {"_id": _to_oid(account_id)}, {"$set": state.model_dump()}
             )
             return True
         except Exception as e:
@@ -206,15 +260,15 @@ class PinterestAccountRepo:
             PinterestAccount: First account found, or None if no accounts exist
         """
         try:
-            account = await self._col.find_one()
-            if account:
-                return await self.get_account_by_id(str(account["_id"]))
-            return None
+            account_data = await self._col.find_one()
+            return PinterestAccount(**account_data) if account_data else None
         except Exception as e:
             logger.error(f"Failed to get first account: {e}")
             return None
 
-    async def get_account_by_id(self, account_id: str) -> Optional[PinterestAccount]:
+    async def get_account_by_id(
+        self, account_id: OidLike
+    ) -> Optional[PinterestAccount]:
         """
         Retrieve a Pinterest account by its ID.
 
@@ -225,12 +279,12 @@ class PinterestAccountRepo:
             PinterestAccount: Account object, or None if not found or error occurred
         """
         # Input validation
-        if not account_id or not isinstance(account_id, str):
+        if not account_id or not isinstance(account_id, (str, ObjectId)):
             logger.error("Invalid account ID provided")
             return None
 
         try:
-            account_data = await self._col.find_one({"_id": ObjectId(account_id)})
+            account_data = await self._col.find_one({"_id": _to_oid(account_id)})
 
             if not account_data:
                 logger.error(f"Account {account_id} not found")
@@ -280,6 +334,36 @@ class SessionRepo:
             logger.error(f"Failed to create session: {e}")
             return None
 
+    async def create_with_id(self, session_id: str, pid: str) -> bool:
+        """
+        Create a new session for a prompt under a pre-generated ID.
+
+        Args:
+            session_id: Session ID (ObjectId string) generated by the caller
+            pid: Prompt ID to associate with the session
+
+        Returns:
+            bool: True if creation successful, False otherwise
+        """
+        # Input validation
+        if not session_id or not isinstance(session_id, str):
+            logger.error("Invalid session ID provided for session creation")
+            return False
+        if not pid or not isinstance(pid, str):
+            logger.error("Invalid prompt ID provided for session creation")
+            return False
+
+        try:
+            doc = Session(
+                id=session_id, prompt_id=pid, stage="warmup", status="pending", log=[]
+            ).model_dump()
+            doc["_id"] = _to_oid(session_id)
+            await self._col.insert_one(doc)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create session {session_id}: {e}")
+            return False
+
     async def get_by_prompt_id(self, prompt_id: str) -> Optional[Session]:
         """
         Retrieve a session by its associated prompt ID.
@@ -319,15 +403,16 @@ class SessionRepo:
             return None
 
         try:
+            # Only the ID is needed, not the (growing) log
             session = await self._col.find_one(
-                {"prompt_id": prompt_id}
+                {"prompt_id": prompt_id}, {"_id": 1}
             )  # Fixed: use string comparison
             return str(session["_id"]) if session else None
         except Exception as e:
             logger.error(f"Failed to get sessionid by prompt_id {prompt_id}: {e}")
             return None
 
-    async def update_status(self, session_id: str, status: str) -> bool:
+    async def update_status(self, session_id: OidLike, status: str) -> bool:
         """
         Update the status of a session.
 
@@ -339,7 +424,7 @@ class SessionRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not session_id or not isinstance(session_id, str):
+        if not session_id or not isinstance(session_id, (str, ObjectId)):
             logger.error("Invalid session ID provided for status update")
             return False
         if not status or not isinstance(status, str):
@@ -348,14 +433,14 @@ class SessionRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(session_id)}, {"$set": {"status": status}}
+                {"_id": _to_oid(session_id)}, {"$set": {"status": status}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update status for session {session_id}: {e}")
             return False
 
-    async def update_stage(self, session_id: str, stage: str) -> bool:
+    async def update_stage(self, session_id: OidLike, stage: str) -> bool:
         """
         Update the stage of a session (warmup, scraping, validation).
 
@@ -367,7 +452,7 @@ class SessionRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not session_id or not isinstance(session_id, str):
+        if not session_id or not isinstance(session_id, (str, ObjectId)):
             logger.error("Invalid session ID provided for stage update")
             return False
         if not stage or not isinstance(stage, str):
@@ -376,14 +461,14 @@ class SessionRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(session_id)}, {"$set": {"stage": stage}}
+                {"_id": _to_oid(session_id)}, {"$set": {"stage": stage}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update stage for session {session_id}: {e}")
             return False
 
-    async def add_log(self, session_id: str, log: str) -> bool:
+    async def add_log(self, session_id: OidLike, log: str) -> bool:
         """
         Add a log entry to a session's log array.
 
@@ -395,7 +480,7 @@ class SessionRepo:
             bool: True if log addition successful, False otherwise
         """
         # Input validation
-        if not session_id or not isinstance(session_id, str):
+        if not session_id or not isinstance(session_id, (str, ObjectId)):
             logger.error("Invalid session ID provided for log addition")
             return False
         if not log or not isinstance(log, str):
@@ -404,13 +489,86 @@ class SessionRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(session_id)}, {"$push": {"log": log}}
+                {"_id": _to_oid(session_id)}, {"$push": {"log": log}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to add log to session {session_id}: {e}")
             return False
 
+    async def add_logs(self, session_id: OidLike, logs: Sequence[str]) -> bool:
+        """
+        Add several log entries to a session's log array with a single update.
+
+        Args:
+            session_id: Session ID to add logs to
+            logs: Log messages to add, in order
+
+        Returns:
+            bool: True if log addition successful, False otherwise
+        """
+        # Input validation
+        if not session_id or not isinstance(session_id, (str, ObjectId)):
+            logger.error("Invalid session ID provided for log addition")
+            return False
+        if any(not log or not isinstance(log, str) for log in logs):
+            logger.error("Invalid log message provided")
+            return False
+        if not logs:
+            return True
+
+        try:
+            await self._col.update_one(
+                {"_id": _to_oid(session_id)}, {"$push": {"log": {"$each": list(logs)}}}
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add logs to session {session_id}: {e}")
+            return False
+
+
+class SessionLogBuffer:
+    """
+    Collects a session's log lines and writes them with SessionRepo.add_logs, once
+    max_lines are buffered or interval seconds passed since the last write, instead of
+    one update per line. Call close() when the session's task ends.
+    """
+
+    def __init__(
+        self,
+        session_repo: SessionRepo,
+        session_id: OidLike,
+        max_lines: int = 50,
+        interval: float = 2.0,
+    ):
+        self._repo = session_repo
+        self._session_id = session_id
+        self._max_lines = max_lines
+        self._interval = interval
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+
+    async def add(self, log: str) -> None:
+        """Buffer a log line, writing the buffer out when it is full or due"""
+        self._lines.append(log)
+        if (
+            len(self._lines) >= self._max_lines
+            or time.monotonic() - self._last_flush >= self._interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """Write out the buffered lines"""
+        # Swapped out before awaiting, lines added meanwhile go to the next flush
+        lines, self._lines = self._lines, []
+        self._last_flush = time.monotonic()
+        return await self._repo.add_logs(self._session_id, lines)
+
+    async def close(self) -> bool:
+        """Write out the buffered lines, lines added afterwards are written straight away"""
+        self._max_lines = 1
+        return await self.flush()
+
 
 class PinRepo:
     """
@@ -423,29 +581,65 @@ class PinRepo:
 
     _col = db.pins
 
-    async def create(self, pin: Pin) -> Optional[str]:
+    async def create(self, pin: Union[Pin, PinStruct]) -> Optional[str]:
         """
         Create a new pin in the database.
 
         Args:
-            pin: Pin object with image data and metadata
+            pin: Pin or PinStruct object with image data and metadata
 
         Returns:
             str: The created pin ID, or None if creation failed
         """
         # Input validation
-        if not pin or not isinstance(pin, Pin):
+        if isinstance(pin, PinStruct):
+            doc = pin.to_document()
+        elif isinstance(pin, Pin):
+            doc = pin.model_dump()
+        else:
             logger.error("Invalid Pin object provided for creation")
             return None
 
         try:
-            res = await self._col.insert_one(pin.model_dump())
+            res = await self._col.insert_one(doc)
             return str(res.inserted_id)
         except Exception as e:
             logger.error(f"Failed to create pin: {e}")
             return None
 
-    async def get_pin_by_id(self, pin_id: str) -> Optional[Pin]:
+    async def create_many(
+        self, pins: Sequence[Union[Pin, PinStruct]]
+    ) -> Optional[List[str]]:
+        """
+        Create several pins with a single insert_many.
+
+        Args:
+            pins: Pin or PinStruct objects with image data and metadata
+
+        Returns:
+            List[str]: The created pin IDs in the order of pins, or None if creation failed
+        """
+        # Input validation
+        docs = []
+        for pin in pins:
+            if isinstance(pin, PinStruct):
+                docs.append(pin.to_document())
+            elif isinstance(pin, Pin):
+                docs.append(pin.model_dump())
+            else:
+                logger.error("Invalid Pin object provided for creation")
+                return None
+        if not docs:
+            return []
+
+        try:
+            res = await self._col.insert_many(docs, ordered=False)
+            return [str(inserted_id) for inserted_id in res.inserted_ids]
+        except Exception as e:
+            logger.error(f"Failed to create pins: {e}")
+            return None
+
+    async def get_pin_by_id(self, pin_id: OidLike) -> Optional[Pin]:
         """
         Retrieve a pin by its ID.
 
@@ -456,25 +650,48 @@ class PinRepo:
             Pin: Pin object, or None if not found or error occurred
         """
         # Input validation
-        if not pin_id or not isinstance(pin_id, str):
+        if not pin_id or not isinstance(pin_id, (str, ObjectId)):
             logger.error("Invalid pin ID provided")
             return None
 
         try:
-            return await self._col.find_one({"_id": ObjectId(pin_id)})
+            return await self._col.find_one({"_id": _to_oid(pin_id)})
         except Exception as e:
             logger.error(f"Failed to get pin by id {pin_id}: {e}")
             return None
 
-    async def get_pins_by_prompt_id(self, prompt_id: str) -> Optional[List[Pin]]:
+    @staticmethod
+    def _pin_from_doc(pin_data: Dict[str, Any]) -> Pin:
+        """
+        Build a Pin from a stored document with model_construct, skipping validation.
+        Only metadata is validated (a single field), so it is a PinMetadata with its stored
+        datetime converted back like a validated Pin's, instead of the raw dict.
+        Fields the document doesn't have keep their defaults, but required fields have
+        none: with a projection, only the projected fields (and the defaulted ones) can be
+        accessed on the Pin, the others raise AttributeError
+        """
+        # Convert ObjectId to string for the id field
+        pin_data["_id"] = str(pin_data["_id"])
+        if "metadata" in pin_data:
+            pin_data["metadata"] = PinMetadata.model_validate(pin_data["metadata"])
+        return Pin.model_construct(**pin_data)
+
+    async def get_pins_by_prompt_id(
+        self, prompt_id: str, projection: Optional[Dict[str, int]] = None
+    ) -> Optional[List[Pin]]:
         """
         Retrieve all pins associated with a prompt ID.
 
         Args:
             prompt_id: Prompt ID to find pins for
+            projection: Optional MongoDB projection, to only fetch the fields the caller uses
+                (fields left out keep their model defaults)
 
         Returns:
             List[Pin]: List of Pin objects, or None if error occurred
+
+        The documents were written from our own models, so the Pins are built without
+        validating them again, see _pin_from_doc
         """
         # Input validation
         if not prompt_id or not isinstance(prompt_id, str):
@@ -483,17 +700,16 @@ class PinRepo:
 
         try:
             # Query pins by prompt_id (using string comparison)
-            cursor = self._col.find({"prompt_id": prompt_id})
+            cursor = self._col.find({"prompt_id": prompt_id}, projection).batch_size(
+                500
+            )
             pins_data = await cursor.to_list(length=None)
 
             # Convert MongoDB documents to Pin objects with error handling
             pins = []
             for pin_data in pins_data:
                 try:
-                    # Convert ObjectId to string for the id field
-                    pin_data["_id"] = str(pin_data["_id"])
-                    pin = Pin(**pin_data)
-                    pins.append(pin)
+                    pins.append(self._pin_from_doc(pin_data))
                 except Exception as pin_error:
                     logger.error(f"Failed to create Pin object from data: {pin_error}")
                     continue
@@ -503,7 +719,36 @@ class PinRepo:
             logger.error(f"Failed to get pins by prompt_id {prompt_id}: {e}")
             return None
 
-    async def update_pin_description(self, pin_id: str, description: str) -> bool:
+    async def iter_pins_by_prompt_id(
+        self, prompt_id: str, projection: Optional[Dict[str, int]] = None
+    ) -> AsyncIterator[Pin]:
+        """
+        Stream the pins associated with a prompt ID, one cursor batch in memory at a time.
+
+        Args:
+            prompt_id: Prompt ID to find pins for
+            projection: Optional MongoDB projection, to only fetch the fields the caller uses
+                (fields left out keep their model defaults)
+
+        Yields:
+            Pin: Pin objects built with _pin_from_doc, like get_pins_by_prompt_id.
+            On an error the stream is logged and ends early
+        """
+        # Input validation
+        if not prompt_id or not isinstance(prompt_id, str):
+            logger.error("Invalid prompt ID provided for pin retrieval")
+            return
+
+        try:
+            cursor = self._col.find({"prompt_id": prompt_id}, projection).batch_size(
+                200
+            )
+            async for pin_data in cursor:
+                yield self._pin_from_doc(pin_data)
+        except Exception as e:
+            logger.error(f"Failed to stream pins by prompt_id {prompt_id}: {e}")
+
+    async def update_pin_description(self, pin_id: OidLike, description: str) -> bool:
         """
         Update the description of a pin.
 
@@ -515,7 +760,7 @@ class PinRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not pin_id or not isinstance(pin_id, str):
+        if not pin_id or not isinstance(pin_id, (str, ObjectId)):
             logger.error("Invalid pin ID provided for description update")
             return False
         if not isinstance(description, str):
@@ -524,14 +769,14 @@ class PinRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(pin_id)}, {"$set": {"description": description}}
+                {"_id": _to_oid(pin_id)}, {"$set": {"description": description}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update pin description for {pin_id}: {e}")
             return False
 
-    async def update_pin_match_score(self, pin_id: str, match_score: float) -> bool:
+    async def update_pin_match_score(self, pin_id: OidLike, match_score: float) -> bool:
         """
         Update the AI validation match score of a pin.
 
@@ -543,7 +788,7 @@ class PinRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not pin_id or not isinstance(pin_id, str):
+        if not pin_id or not isinstance(pin_id, (str, ObjectId)):
             logger.error("Invalid pin ID provided for match score update")
             return False
         if not isinstance(match_score, (int, float)) or not (0 <= match_score <= 1):
@@ -552,14 +797,16 @@ class PinRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(pin_id)}, {"$set": {"match_score": match_score}}
+                {"_id": _to_oid(pin_id)}, {"$set": {"match_score": match_score}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update pin match score for {pin_id}: {e}")
             return False
 
-    async def update_pin_ai_explanation(self, pin_id: str, ai_explanation: str) -> bool:
+    async def update_pin_ai_explanation(
+        self, pin_id: OidLike, ai_explanation: str
+    ) -> bool:
         """
         Update the AI explanation for a pin's validation result.
 
@@ -571,7 +818,7 @@ class PinRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not pin_id or not isinstance(pin_id, str):
+        if not pin_id or not isinstance(pin_id, (str, ObjectId)):
             logger.error("Invalid pin ID provided for AI explanation update")
             return False
         if not isinstance(ai_explanation, str):
@@ -580,14 +827,14 @@ class PinRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(pin_id)}, {"$set": {"ai_explanation": ai_explanation}}
+                {"_id": _to_oid(pin_id)}, {"$set": {"ai_explanation": ai_explanation}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update pin ai explanation for {pin_id}: {e}")
             return False
 
-    async def update_pin_status(self, pin_id: str, status: str) -> bool:
+    async def update_pin_status(self, pin_id: OidLike, status: str) -> bool:
         """
         Update the status of a pin (pending, approved, disqualified).
 
@@ -599,7 +846,7 @@ class PinRepo:
             bool: True if update successful, False otherwise
         """
         # Input validation
-        if not pin_id or not isinstance(pin_id, str):
+        if not pin_id or not isinstance(pin_id, (str, ObjectId)):
             logger.error("Invalid pin ID provided for status update")
             return False
         if not status or not isinstance(status, str):
@@ -608,9 +855,65 @@ class PinRepo:
 
         try:
             await self._col.update_one(
-                {"_id": ObjectId(pin_id)}, {"$set": {"status": status}}
+                {"_id": _to_oid(pin_id)}, {"$set": {"status": status}}
             )
             return True
         except Exception as e:
             logger.error(f"Failed to update pin status for {pin_id}: {e}")
             return False
+
+    @staticmethod
+    def _validation_fields(
+        match_score: float,
+        ai_explanation: str,
+        status: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Validated $set document for a pin's validation result, None if a value is invalid"""
+        if not isinstance(match_score, (int, float)) or not (0 <= match_score <= 1):
+            logger.error("Invalid match score provided (must be 0.0 to 1.0)")
+            return None
+        if not isinstance(ai_explanation, str):
+            logger.error("Invalid AI explanation provided for pin update")
+            return None
+        if not status or not isinstance(status, str):
+            logger.error("Invalid status provided for pin update")
+            return None
+        return {
+            "match_score": match_score,
+            "ai_explanation": ai_explanation,
+            "status": status,
+        }
+
+    async def bulk_update_validation(
+        self, results: Dict[OidLike, Tuple[float, str, str]]
+    ) -> bool:
+        """
+        Store the validation results of several pins with a single bulk_write.
+
+        Args:
+            results: Pin ID -> (match score, AI explanation, status)
+
+        Returns:
+            bool: True if update successful, False otherwise
+        """
+        # Input validation
+        operations = []
+        for pin_id, (match_score, ai_explanation, status) in results.items():
+            if not isinstance(pin_id, ObjectId) and not ObjectId.is_valid(pin_id):
+                logger.error("Invalid pin ID provided for validation update")
+                return False
+            fields = self._validation_fields(match_score, ai_explanation, status)
+            if fields is None:
+                return False
+            operations.append(UpdateOne({"_id": _to_oid(pin_id)}, {"$set": fields}))
+        if not operations:
+            return True
+
+        try:
+            await self._col.bulk_write(operations, ordered=False)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to update validation results for {len(results)} pins: {e}"
+            )
+            return False
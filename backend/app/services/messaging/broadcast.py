@@ -4,19 +4,39 @@ broadcast.py
 Broadcasts messages to the frontend via Redis pub/sub
 """
 
-import json
-import redis
-from app.util.config import get_settings
-from typing import Dict, Any
+from app.services.messaging.redis_pool import get_redis
+from app.util.serialization import dumps
+from typing import Dict, Any, Iterable, Union
 
-_redis = redis.Redis.from_url(get_settings().redis_url, decode_responses=True)
+# A message dict, or one already encoded to JSON bytes (e.g. ValidationMessage.to_bytes())
+Message = Union[Dict[str, Any], bytes]
 
 
-def broadcast(job_id: str, message: Dict[str, Any]) -> None:
+def _encode(message: Message) -> bytes:
+    return message if isinstance(message, bytes) else dumps(message)
+
+
+async def broadcast_async(job_id: str, message: Message) -> None:
     # Push a JSON event onto the Redis pub/sub channel for this job.
     # The message should already be a validated Pydantic model dict from the tasks.
+    # Published on the task's event loop through the shared pool, so it never blocks the loop
     try:
-        _redis.publish(f"job:{job_id}", json.dumps(message))
+        await get_redis().publish(f"job:{job_id}", _encode(message))
     except Exception as e:
         # TODO: handle more gracefully - should log / properly display error to user
         raise ValueError(f"Failed to broadcast message: {e}")
+
+
+async def broadcast_many_async(job_id: str, messages: Iterable[Message]) -> None:
+    # Same as broadcast_async for a burst of events: all of them are published in one
+    # pipeline, a single round trip to Redis, in order
+    channel = f"job:{job_id}"
+    pipe = get_redis().pipeline(transaction=False)
+    for message in messages:
+        pipe.publish(channel, _encode(message))
+    if not len(pipe):
+        return
+    try:
+        await pipe.execute()
+    except Exception as e:
+        raise ValueError(f"Failed to broadcast messages: {e}")
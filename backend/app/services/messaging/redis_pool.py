@@ -0,0 +1,38 @@
+"""
+redis_pool.py
+
+Shared async Redis client for publishing and subscribing to job channels
+"""
+
+import asyncio
+from typing import Optional
+import redis.asyncio as aioredis
+from app.util.config import get_settings
+
+REDIS_POOL_CONFIG = {
+    "max_connections": 64,
+}
+
+_redis: Optional[aioredis.Redis] = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    Returns the shared async Redis client for the running event loop
+    Connections are pooled and reused across calls, a new pool is only made when the
+    loop changes, since asyncio connections can't move between loops
+    Replies are left as bytes: the payloads only pass through (published by the tasks,
+    relayed to the WebSockets as is), decoding them would only be undone again
+    """
+    global _redis, _redis_loop
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        pool = aioredis.ConnectionPool.from_url(
+            get_settings().redis_url,
+            decode_responses=False,
+            max_connections=REDIS_POOL_CONFIG["max_connections"],
+        )
+        _redis = aioredis.Redis(connection_pool=pool)
+        _redis_loop = loop
+    return _redis
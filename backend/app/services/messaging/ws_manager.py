@@ -7,18 +7,23 @@ from Celery tasks (like scraping and validation) to connected frontend clients.
 Architecture:
 - Each job_id can have multiple WebSocket connections (multiple browser tabs/windows)
 - Redis pub/sub channel "job:{job_id}" receives messages from backend tasks
-- Messages are relayed to all connected WebSocket clients for that job_id
-- Automatic cleanup when all clients disconnect for a job_id
+- A single listener pattern-subscribes to "job:*" and relays each message to all
+  connected WebSocket clients for the job_id in its channel name
+- Automatic cleanup when all clients disconnect for a job_id, the listener stops
+  once no job has clients left
 """
 
 import asyncio
 import contextlib
-from collections import defaultdict
-from app.util.config import get_settings
-import redis.asyncio as aioredis
 from fastapi import WebSocket
+from app.services.messaging.redis_pool import get_redis
 
-REDIS_URL = get_settings().redis_url
+# Configuration constants
+WS_CONFIG = {
+    "send_timeout_seconds": 2.0,
+    "relay_poll_seconds": 1.0,
+    "relay_batch_size": 100,
+}
 
 
 class WSManager:
@@ -26,19 +31,19 @@ class WSManager:
     Manages WebSocket connections and Redis pub/sub for real-time task updates.
 
     Maintains a mapping of job_id -> set of WebSocket connections and handles
-    message relay from Redis to all connected clients for each job.
+    message relay from Redis to all connected clients for each job, over one
+    pub/sub connection shared by every job.
     """
 
     def __init__(self):
         """
-        Initialize the WebSocket manager with Redis connection and data structures.
+        Initialize the WebSocket manager's data structures.
         """
-        # job_id -> set of WebSocket connections (multiple clients per job)
-        self._conns = defaultdict(set)
-        # job_id -> asyncio.Task for Redis pub/sub listener
-        self._tasks = {}
-        # Redis connection for pub/sub messaging
-        self._redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+        # job_id -> set of WebSocket connections (multiple clients per job), only jobs
+        # with clients have an entry so the dict doesn't grow with every job ever seen
+        self._conns: dict[str, set[WebSocket]] = {}
+        # Single Redis pub/sub listener for every job_id, started with the first client
+        self._listener_task = None
 
     async def connect(self, job_id: str, ws: WebSocket):
         """
@@ -48,14 +53,14 @@ class WSManager:
             job_id: Unique identifier for the job/session
             ws: WebSocket connection from FastAPI
 
-        Creates a Redis pub/sub listener for this job_id if this is the first client.
+        Starts the shared Redis pub/sub listener if it isn't running.
         """
         await ws.accept()
-        self._conns[job_id].add(ws)
+        self._conns.setdefault(job_id, set()).add(ws)
 
-        # Start Redis listener if this is the first client for this job_id
-        if job_id not in self._tasks:
-            self._tasks[job_id] = asyncio.create_task(self._relay(job_id))
+        # Start the Redis listener if this is the first client of any job
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._relay())
 
         print(f"WS connected job={job_id} cnt={len(self._conns[job_id])}")
 
@@ -67,90 +72,130 @@ class WSManager:
             job_id: Unique identifier for the job/session
             ws: WebSocket connection to remove
 
-        Stops the Redis listener if this was the last client for this job_id.
+        Stops the Redis listener if this was the last client of any job.
         """
-        self._conns[job_id].discard(ws)
-        print(f"WS disconnected job={job_id} cnt={len(self._conns[job_id])}")
-
-        # Stop Redis listener if no more clients for this job_id
-        if not self._conns[job_id]:
-            await self._cancel_listener(job_id)
-
-    async def _relay(self, job_id: str):
+        # The job may already be gone if a failed send removed its last client
+        conns = self._conns.get(job_id)
+        if conns is not None:
+            conns.discard(ws)
+            # Forget the job_id once it has no clients left
+            if not conns:
+                self._conns.pop(job_id, None)
+        print(f"WS disconnected job={job_id} cnt={len(conns) if conns else 0}")
+
+        # Stop the Redis listener if no job has clients left
+        if not self._conns:
+            await self._cancel_listener()
+
+    async def _relay(self):
         """
-        Listen to Redis pub/sub channel for a job_id and relay messages to WebSocket clients.
+        Listen to the Redis pub/sub channels of every job and relay messages to WebSocket clients.
 
-        Args:
-            job_id: Unique identifier for the job/session
+        This method runs as a single background task, pattern-subscribed to "job:*", and
+        continuously listens for messages from backend tasks (scraping, validation). Each
+        message is forwarded to the WebSocket clients of the job_id in its channel name,
+        messages for jobs without clients are dropped.
 
-        This method runs as a background task and continuously listens for messages
-        from backend tasks (scraping, validation) and forwards them to all connected
-        WebSocket clients for this job_id.
+        Messages that have already arrived are read together (up to
+        WS_CONFIG["relay_batch_size"]) before fanning them out in order, instead of
+        returning to the event loop once per message.
         """
-        chan = f"job:{job_id}"
-        pubsub = self._redis.pubsub()
-        await pubsub.subscribe(chan)
-        print(f"Subscribed to {chan}")
+        pattern = "job:*"
+        # The pub/sub connection comes from the shared pool, subscription confirmations
+        # are dropped by the pubsub itself
+        pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(pattern)
+        print(f"Subscribed to {pattern}")
 
         try:
-            async for msg in pubsub.listen():
-                # Only process actual messages, ignore subscription confirmations
-                if msg["type"] != "message":
+            while True:
+                # Wait for the next message, then drain whatever else is already buffered
+                msg = await pubsub.get_message(timeout=WS_CONFIG["relay_poll_seconds"])
+                if msg is None:
                     continue
-
-                # Forward the JSON payload to all connected WebSocket clients
-                payload = msg["data"]  # JSON string from backend tasks
-                await self._fanout(job_id, payload)
+                batch = [msg]
+                while len(batch) < WS_CONFIG["relay_batch_size"]:
+                    msg = await pubsub.get_message(timeout=0)
+                    if msg is None:
+                        break
+                    batch.append(msg)
+
+                for msg in batch:
+                    job_id = msg["channel"].split(b":", 1)[1].decode()
+                    if job_id not in self._conns:
+                        continue
+
+                    # Forward the JSON payload (UTF-8 bytes, as published by the backend
+                    # tasks) to all connected WebSocket clients without re-encoding it
+                    await self._fanout(job_id, msg["data"])
         finally:
             # Clean up Redis subscription
             with contextlib.suppress(Exception):
-                await pubsub.unsubscribe(chan)
+                await pubsub.punsubscribe(pattern)
                 await pubsub.close()
-            print(f"Unsubscribed from {chan}")
+            print(f"Unsubscribed from {pattern}")
 
-    async def _fanout(self, job_id: str, payload: str):
+    async def _fanout(self, job_id: str, payload: bytes):
         """
         Send a message to all WebSocket clients connected to a job_id.
 
         Args:
             job_id: Unique identifier for the job/session
-            payload: JSON string message to send to all clients
+            payload: UTF-8 encoded JSON message to send to all clients, as a binary frame
 
-        Handles dead connections by removing them from the connection set.
+        Sends to every client at once, each send bounded by WS_CONFIG["send_timeout_seconds"],
+        so a slow or hung client doesn't hold up the others. A client whose send failed or
+        timed out is removed from the connection set and closed (1011), so a slow but live
+        client knows to reconnect instead of waiting for updates that no longer come.
         """
-        dead = []
-
-        # Try to send message to all connected clients
-        for ws in list(self._conns[job_id]):
-            try:
-                await ws.send_text(payload)
-            except Exception:
-                # Mark connection as dead if send fails
-                dead.append(ws)
-
-        # Remove dead connections
-        for ws in dead:
-            self._conns[job_id].discard(ws)
-
-    async def _cancel_listener(self, job_id: str):
+        # Snapshot the clients, the set can change while the sends are awaited
+        clients = tuple(self._conns.get(job_id, ()))
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    ws.send_bytes(payload), WS_CONFIG["send_timeout_seconds"]
+                )
+                for ws in clients
+            ),
+            return_exceptions=True,
+        )
+
+        # Remove dead connections (failed or timed out sends), the job may have been
+        # dropped while sending
+        dropped = [
+            ws
+            for ws, result in zip(clients, results)
+            if isinstance(result, BaseException)
+        ]
+        conns = self._conns.get(job_id)
+        if conns is not None:
+            conns.difference_update(dropped)
+            if not conns:
+                self._conns.pop(job_id, None)
+        if dropped:
+            await asyncio.gather(*(self._close(ws) for ws in dropped))
+
+    @staticmethod
+    async def _close(ws: WebSocket):
+        """Close a client after a failed send, the close itself is bounded and may fail too"""
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                ws.close(code=1011), WS_CONFIG["send_timeout_seconds"]
+            )
+
+    async def _cancel_listener(self):
         """
-        Cancel the Redis listener task and clean up resources for a job_id.
-
-        Args:
-            job_id: Unique identifier for the job/session
+        Cancel the shared Redis listener task.
 
-        Called when the last WebSocket client disconnects to free up resources.
+        Called when the last WebSocket client of any job disconnects to free up resources.
         """
         # Cancel the background Redis listener task
-        task = self._tasks.pop(job_id, None)
+        task, self._listener_task = self._listener_task, None
         if task:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
 
-        # Clean up connection set for this job_id
-        self._conns.pop(job_id, None)
-
 
 # Global WebSocket manager instance
 ws_manager = WSManager()
@@ -22,21 +22,25 @@ The validation ensures that only high-quality, relevant images are presented to
 """
 
 from app.services.celery_app import celery_app
-from app.services.messaging.broadcast import broadcast
+from app.services.messaging.broadcast import broadcast_many_async
 from app.services.database.db import db
 from app.models.update_messages import ValidationMessage
 from bson import ObjectId
 import time
 import random
-from app.services.database.repo import SessionRepo, PinRepo, PromptRepo
+from app.services.database.repo import SessionRepo, SessionLogBuffer, PinRepo, PromptRepo
 import asyncio
-import nest_asyncio
-from app.services.automation.image_evaluator import score_image_against_prompt
+from app.services.automation.image_evaluator import (
+    score_image_against_prompt,
+    score_images_against_prompt,
+)
+from app.util.event_loop import run_in_worker_loop
 
 # Configuration constants
 VALIDATION_CONFIG = {
     "min_score": 0.5,
-    "timeout_seconds": 30,
+    "batch_size": 8,  # images scored per OpenAI request
+    "max_concurrent_requests": 4,
     "max_retries": 3
 }
 
@@ -72,44 +76,13 @@ def validate(pid: str, session_id: str, prompt: str):
     if not isinstance(pid, str) or not isinstance(session_id, str) or not isinstance(prompt, str):
         raise TypeError("All parameters must be strings")
     try:
-        # Apply nest_asyncio only when we need it for the task
-        try:
-            nest_asyncio.apply()
-        except ValueError as e:
-            if "uvloop" in str(e):
-                print("uvloop detected, nest_asyncio not needed")
-            else:
-                print(f"nest_asyncio error: {e}")
-        
-        # Get the current event loop or create a new one
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        # Run the async function in the current loop
-        return loop.run_until_complete(_validate_async(pid, session_id, prompt))
+        # Run the async function on this worker process's event loop
+        return run_in_worker_loop(_validate_async(pid, session_id, prompt))
     except Exception as e:
         print(f"Task failed with error: {e}")
         import traceback
         print(f"Task traceback: {traceback.format_exc()}")
         return None
-    finally:
-        # Clean up any remaining tasks in the event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if not loop.is_closed():
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                if pending:
-                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        except Exception as cleanup_error:
-            print(f"Error during cleanup: {cleanup_error}")
 
     
 
@@ -123,6 +96,9 @@ async def _validate_async(pid: str, session_id: str, prompt: str):
     - Pin retrieval and processing
     - AI-powered image evaluation
     - Database updates and real-time broadcasting
+
+    Each batch's results are written to MongoDB with one bulk_write and broadcast as soon
+    as the batch is scored, log lines are pushed to the session in batches
     
     Args:
         pid: Prompt ID for database operations
@@ -131,15 +107,14 @@ async def _validate_async(pid: str, session_id: str, prompt: str):
         
     Raises:
         RuntimeError: If validation process fails
-    
-    #TODO:
-        -while we want real time updates to the frontend over websockets, we should switch to batching the mongodb updates so all images are evaluated and then the results are send to mongo in a single message
     """
     try:
         # Initialize database repositories for session, pin, and prompt operations
         session_repo = SessionRepo()
         pin_repo = PinRepo()
         prompt_repo = PromptRepo()
+        # Per-pin log lines are buffered and written to the session in batches
+        logs = SessionLogBuffer(session_repo, session_id)
 
         # Update session status to indicate validation phase
         try:
@@ -148,75 +123,45 @@ async def _validate_async(pid: str, session_id: str, prompt: str):
             print(f"Failed to update session {session_id} stage: {e}")
             raise RuntimeError(f"Failed to initialize validation session {session_id}: {e}")
 
-        # Retrieve all scraped pins for this prompt from database
-        pins = await pin_repo.get_pins_by_prompt_id(pid)
-        
-        print(f"Found {len(pins) if pins else 0} pins for prompt {pid}")
-        
+        # Stream the scraped pins for this prompt from database (only their IDs and image
+        # URLs are used) and start validating each batch as soon as it is filled.
+        # Batches run through AI-powered validation, several images per request and
+        # several requests at a time (bounded to stay under the OpenAI rate limits)
+        batch_size = VALIDATION_CONFIG["batch_size"]
+        semaphore = asyncio.Semaphore(VALIDATION_CONFIG["max_concurrent_requests"])
+        tasks = []
+        batch = []
+        pin_count = 0
+
+        def start_batch(pins):
+            tasks.append(asyncio.create_task(_validate_batch(
+                pins, pid, prompt, logs, pin_repo, semaphore
+            )))
+
+        async for pin in pin_repo.iter_pins_by_prompt_id(pid, {"image_url": 1}):
+            batch.append(pin)
+            pin_count += 1
+            if len(batch) == batch_size:
+                start_batch(batch)
+                batch = []
+        if batch:
+            start_batch(batch)
+
+        print(f"Found {pin_count} pins for prompt {pid}")
+
         # Handle case where no pins were found for validation
-        if pins is None:
+        if not pin_count:
             print(f"No pins found for prompt {pid}")
             await session_repo.update_status(session_id, "completed")
             return
 
-        # Handle case where pins list is empty
-        if not pins:
-            print(f"Empty pins list for prompt {pid}")
-            await session_repo.update_status(session_id, "completed")
-            return
-
-        # Process each pin through AI-powered validation
-        for pin in pins:
-            try:
-                # Evaluate image against prompt using AI with timeout protection
-                try:
-                    score, detail = await asyncio.wait_for(
-                        asyncio.to_thread(score_image_against_prompt, pin.image_url, prompt),
-                        timeout=VALIDATION_CONFIG["timeout_seconds"]
-                    )
-                except asyncio.TimeoutError:
-                    print(f"Image evaluation timed out for pin {pin.id}")
-                    await session_repo.add_log(session_id, f"Pin {pin.id} evaluation timed out")
-                    score = 0.0
-                    detail = {"explanation": "Evaluation timed out"}
-                
-                # Update pin status based on validation score threshold
-                if score < VALIDATION_CONFIG["min_score"]:
-                    await pin_repo.update_pin_status(pin.id, "disqualified")
-                    await session_repo.add_log(session_id, f"Pin {pin.id} disqualified: {score}, {detail}")
-                else:
-                    await pin_repo.update_pin_status(pin.id, "approved")
-                    await session_repo.add_log(session_id, f"Pin {pin.id} approved: {score}, {detail}")
-                
-                # Store validation results in database
-                await pin_repo.update_pin_match_score(pin.id, score)
-                await pin_repo.update_pin_ai_explanation(pin.id, detail.get("explanation", ""))
-
-                # Prepare validation result for frontend broadcasting
-                # Convert score to float and ensure it's in 0-1 range
-                score_float = float(score) if score is not None else 0.0
-                score_float = max(0.0, min(1.0, score_float))  # Clamp to 0-1 range
-                
-                # Create validation message for real-time frontend updates
-                updateMessage = ValidationMessage(
-                    type="validation",
-                    pin_id=pin.id,
-                    score=score_float,
-                    label=detail.get("explanation", ""),
-                    valid=score_float >= VALIDATION_CONFIG["min_score"]
-                )
-                
-                # Broadcast validation result to frontend via WebSocket
-                try:
-                    broadcast(pid, updateMessage.model_dump(mode='json'))
-                except Exception as broadcast_error:
-                    print(f"Broadcast error: {broadcast_error}")
-                    await session_repo.add_log(session_id, f"Broadcast error: {broadcast_error}")
-                    
-            except Exception as pin_error:
-                # Handle individual pin validation failures gracefully
-                print(f"Error processing pin {pin.id} during validation: {pin_error}")
-                await session_repo.add_log(session_id, f"Validation failed for pin {pin.id}: {pin_error}")
+        # A batch that raises anyway doesn't cancel or orphan the ones still running
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Validation batch failed: {result}")
+                await logs.add(f"Validation batch failed: {result}")
+        await logs.flush()
 
         # Mark validation process as completed
         await session_repo.update_status(session_id, "completed")
@@ -232,6 +177,7 @@ async def _validate_async(pid: str, session_id: str, prompt: str):
         # Update session status to failed and log error
         try:
             if session_repo and session_id:
+                await logs.flush()
                 await session_repo.update_status(session_id, "failed")
                 await session_repo.add_log(session_id, f"Validation task failed: {e}")
         except Exception as log_error:
@@ -249,4 +195,91 @@ async def _validate_async(pid: str, session_id: str, prompt: str):
         print(f"Error type: {type(e).__name__}")
         
         # Re-raise the exception to ensure the task is marked as failed
-        raise
\ No newline at end of file
+        raise
+
+
+async def _validate_batch(
+    batch: list,
+    pid: str,
+    prompt: str,
+    logs: SessionLogBuffer,
+    pin_repo: PinRepo,
+    semaphore: asyncio.Semaphore,
+):
+    """
+    Scores one batch of pins with a single evaluation request, then stores and broadcasts
+    each pin's result. Failures are logged per pin (through the shared session log buffer)
+    and never raised, so one batch can't stop the others running alongside it
+    """
+    # Evaluate the batch's images against the prompt using AI, the requests carry their own
+    # timeouts (scaled to the batch, not counting rate limiter waits)
+    async with semaphore:
+        results = await _score_batch(batch, prompt, logs)
+
+    # The batch's results are stored with one bulk write, then broadcast together
+    updates = {}
+    messages = []
+    for pin, (score, detail) in zip(batch, results):
+        try:
+            # Convert score to float and ensure it's in 0-1 range
+            score_float = float(score) if score is not None else 0.0
+            score_float = max(0.0, min(1.0, score_float))  # Clamp to 0-1 range
+            explanation = detail.get("explanation", "")
+
+            # Pin status based on validation score threshold
+            valid = score_float >= VALIDATION_CONFIG["min_score"]
+            status = "approved" if valid else "disqualified"
+            updates[pin.id] = (score_float, explanation, status)
+            await logs.add(f"Pin {pin.id} {status}: {score}, {detail}")
+
+            # Create validation message for real-time frontend updates
+            updateMessage = ValidationMessage.model_construct(
+                type="validation",
+                pin_id=pin.id,
+                score=score_float,
+                label=explanation,
+                valid=valid
+            )
+
+            messages.append(updateMessage.to_bytes())
+
+        except Exception as pin_error:
+            # Handle individual pin validation failures gracefully
+            print(f"Error processing pin {pin.id} during validation: {pin_error}")
+            await logs.add(f"Validation failed for pin {pin.id}: {pin_error}")
+
+    # Store validation results in database
+    if not await pin_repo.bulk_update_validation(updates):
+        print(f"Failed to store validation results for pins {list(updates)}")
+        await logs.add(f"Failed to store validation results for {len(updates)} pins")
+
+    # Broadcast the validation results to frontend via WebSocket
+    try:
+        await broadcast_many_async(pid, messages)
+    except Exception as broadcast_error:
+        print(f"Broadcast error: {broadcast_error}")
+        await logs.add(f"Broadcast error: {broadcast_error}")
+
+
+async def _score_batch(batch: list, prompt: str, logs: SessionLogBuffer) -> list:
+    """
+    One (score, detail) per pin of the batch, in order
+    If the batch request fails each image is scored on its own, and an image that can't be
+    scored at all gets 0.0 so its pin is still stored and broadcast instead of left pending
+    """
+    try:
+        return await score_images_against_prompt([pin.image_url for pin in batch], prompt)
+    except Exception as batch_error:
+        print(f"Batch evaluation failed, scoring its images one by one: {batch_error}")
+        await logs.add(f"Batch evaluation failed, scoring its images one by one: {batch_error}")
+
+    results = await asyncio.gather(
+        *(score_image_against_prompt(pin.image_url, prompt) for pin in batch),
+        return_exceptions=True
+    )
+    for i, (pin, result) in enumerate(zip(batch, results)):
+        if isinstance(result, Exception):
+            print(f"Image evaluation failed for pin {pin.id}: {result}")
+            await logs.add(f"Validation failed for pin {pin.id}: {result}")
+            results[i] = (0.0, {"explanation": "Evaluation failed"})
+    return results
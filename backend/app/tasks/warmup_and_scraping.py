@@ -27,17 +27,17 @@ TODO:
 """
 
 from app.services.celery_app import celery_app
-from app.services.messaging.broadcast import broadcast
+from app.services.messaging.broadcast import broadcast_async, broadcast_many_async
 from app.models.update_messages import WarmupMessage, ScrapedImageMessage
 import asyncio
-import nest_asyncio
 from app.services.database.repo import (
     PinterestAccountRepo,
     PromptRepo,
     SessionRepo,
+    SessionLogBuffer,
     PinRepo,
 )
-from app.services.automation.browser_factory import BrowserFactory
+from app.services.automation.browser_factory import BrowserFactory, BROWSER_PROFILES_DIR
 from app.services.automation.actions import (
     navigate_to_pinterest,
     test_login_status_on_pinterest,
@@ -49,9 +49,10 @@ from app.services.automation.actions import (
     navigate_to_more_ideas,
     extract_pin_images_from_more_ideas,
 )
-from app.models.pin import Pin, PinMetadata
-from datetime import datetime
+from app.models.pin_struct import PinStruct, PinMetadataStruct
+from datetime import datetime, timezone
 import os
+from app.util.event_loop import run_in_worker_loop
 from app.models.pinterest_account import PinterestAccount, ProxyConfig
 
 # Configuration constants
@@ -59,6 +60,7 @@ SCRAPING_CONFIG = {
     "acceptance_threshold": 0.7,
     "max_pins": 7,
     "max_scrolls": 4,
+    "extract_scrolls": 2,  # extra grid scrolls when extracting more ideas pins
     "headless": True,
     "viewport_width": 1920,
     "viewport_height": 1080,
@@ -104,47 +106,14 @@ def warm_up_scraping(pid: str, session_id: str, prompt: str):
     ):
         raise TypeError("All parameters must be strings")
     try:
-        # Apply nest_asyncio only when we need it for the task
-        try:
-            nest_asyncio.apply()
-        except ValueError as e:
-            if "uvloop" in str(e):
-                print("uvloop detected, nest_asyncio not needed")
-            else:
-                print(f"nest_asyncio error: {e}")
-
-        # Get the current event loop or create a new one
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        # Run the async function in the current loop
-        return loop.run_until_complete(_warm_up_async(pid, session_id, prompt))
+        # Run the async function on this worker process's event loop
+        return run_in_worker_loop(_warm_up_async(pid, session_id, prompt))
     except Exception as e:
         print(f"Task failed with error: {e}")
         import traceback
 
         print(f"Task traceback: {traceback.format_exc()}")
         return None
-    finally:
-        # Clean up any remaining tasks in the event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if not loop.is_closed():
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                if pending:
-                    loop.run_until_complete(
-                        asyncio.gather(*pending, return_exceptions=True)
-                    )
-        except Exception as cleanup_error:
-            print(f"Error during cleanup: {cleanup_error}")
 
 
 async def _warm_up_async(pid: str, session_id: str, prompt: str):
@@ -166,38 +135,34 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
     Raises:
         RuntimeError: If any critical operation fails
 
-    #TODO:
-        -while we want real time updates to the frontend over websockets (at each scrape), we should switch to batching the mongodb updates so all images are scraped and then the results are send to mongo in a single message
+    Log lines are buffered and pushed to the session in batches, the buffer is closed
+    (written out) when the task ends, whether it succeeded or not
     """
+    logs = None
     try:
         # c
         prompt_repo = PromptRepo()
         account_repo = PinterestAccountRepo()
         session_repo = SessionRepo()
         pin_repo = PinRepo()
+        logs = SessionLogBuffer(session_repo, session_id)
 
         # Update session stage and status
         try:
             await session_repo.update_stage(session_id, "warmup")
             await session_repo.update_status(session_id, "pending")
-            await _full_warmup_log(
-                pid, f"Warmup started for {prompt}!", session_repo, session_id
-            )
+            await _full_warmup_log(pid, f"Warmup started for {prompt}!", logs)
         except Exception as e:
             print(f"Failed to update session {session_id} status: {e}")
             # Don't continue silently - this is critical for tracking
             raise RuntimeError(f"Failed to initialize session {session_id}: {e}")
 
         # Get Pinterest account credentials from database
-        await _full_warmup_log(
-            pid, "Getting Pinterest account info...", session_repo, session_id
-        )
+        await _full_warmup_log(pid, "Getting Pinterest account info...", logs)
         account = await account_repo.get_first_account()
 
         if not account:
-            await _full_warmup_log(
-                pid, "No Pinterest account found, creating", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "No Pinterest account found, creating", logs)
             # Create account from environment variables as fallback
             
             email = os.getenv("PIN_EMAIL")
@@ -205,9 +170,7 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
             username = os.getenv("PIN_USERNAME", "Pinterest User")
             
             if not email or not password:
-                await _full_warmup_log(
-                    pid, "Missing login info", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Missing login info", logs)
                 raise RuntimeError("No Pinterest account found and missing required environment variables")
             
             # Create proxy config if available
@@ -231,56 +194,43 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
                 user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             )
             
-            await _full_warmup_log(
-                pid, f"Created fallback account", session_repo, session_id
-            )
+            await _full_warmup_log(pid, f"Created fallback account", logs)
 
         # Initialize browser automation with Playwright
         browser_factory = None
         try:
             browser_factory = BrowserFactory()
-            if not await browser_factory.start(headless=SCRAPING_CONFIG["headless"]):
-                await _full_warmup_log(
-                    pid, "Failed to start browser", session_repo, session_id
-                )
+            profile_dir = (
+                os.path.join(BROWSER_PROFILES_DIR, account.slug)
+                if BROWSER_PROFILES_DIR
+                else None
+            )
+            if not await browser_factory.start(
+                headless=SCRAPING_CONFIG["headless"], user_data_dir=profile_dir
+            ):
+                await _full_warmup_log(pid, "Failed to start browser", logs)
                 raise RuntimeError("Failed to start browser")
 
-            await _full_warmup_log(pid, "Browser started", session_repo, session_id)
+            await _full_warmup_log(pid, "Browser started", logs)
 
-            # Configure proxy settings if available
-            proxy_config = None
-            if account.proxy:
-                # Ensure proxy server has proper format
-                server = account.proxy.server
-                if not server.startswith(("http://", "https://")):
-                    server = f"http://{server}"
-
-                proxy_config = {
-                    "server": server,
-                    "username": account.proxy.username,
-                    "password": account.proxy.password,
-                }
-                print(f"✅ Proxy configured: {server}")
+            # Configure proxy settings if available (built once per account)
+            proxy_config = account.playwright_proxy()
+            if proxy_config:
+                print(f"✅ Proxy configured: {proxy_config['server']}")
 
-            await _full_warmup_log(pid, "Proxy configured", session_repo, session_id)
+            await _full_warmup_log(pid, "Proxy configured", logs)
 
             # Create browser context with proxy and user agent
             if not await browser_factory.create_context(
                 proxy_config=proxy_config, user_agent=account.user_agent
             ):
-                await _full_warmup_log(
-                    pid, "Failed to create browser context", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Failed to create browser context", logs)
                 raise RuntimeError("Failed to create browser context")
 
-            await _full_warmup_log(
-                pid, "Browser context created", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Browser context created", logs)
 
             # Configure browser settings for Pinterest automation
-            await _full_warmup_log(
-                pid, "Configuring browser...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Configuring browser...", logs)
             # Set Pinterest-optimized headers
             await browser_factory.page.set_extra_http_headers(
                 {
@@ -352,84 +302,57 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
                     await _full_warmup_log(
                         pid,
                         f"Added {len(playwright_cookies)} cookies",
-                        session_repo,
-                        session_id,
+                        logs,
                     )
                 else:
-                    await _full_warmup_log(
-                        pid, "No valid cookies to add", session_repo, session_id
-                    )
+                    await _full_warmup_log(pid, "No valid cookies to add", logs)
 
-            await _full_warmup_log(pid, "Browser configured", session_repo, session_id)
+            await _full_warmup_log(pid, "Browser configured", logs)
 
             # Navigate to Pinterest homepage
-            await _full_warmup_log(
-                pid, "Navigating to Pinterest...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Navigating to Pinterest...", logs)
             if not await navigate_to_pinterest(browser_factory.page):
-                await _full_warmup_log(
-                    pid, "Failed to navigate to Pinterest", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Failed to navigate to Pinterest", logs)
                 raise RuntimeError("Failed to navigate to Pinterest")
-            await _full_warmup_log(
-                pid, "Navigated to Pinterest", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Navigated to Pinterest", logs)
 
             # Wait for page to fully load and add debugging
-            await _full_warmup_log(
-                pid, "Waiting for page to fully load...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Waiting for page to fully load...", logs)
             await asyncio.sleep(3)  # Allow dynamic content to load
 
             # Check if already logged in or need to authenticate
             is_logged_in = await test_login_status_on_pinterest(browser_factory.page)
 
             if not is_logged_in:
-                await _full_warmup_log(
-                    pid, "Not logged in, attempting login...", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Not logged in, attempting login...", logs)
                 if not await login_to_pinterest(browser_factory.page, account):
-                    await _full_warmup_log(
-                        pid, "Failed to login to Pinterest", session_repo, session_id
-                    )
+                    await _full_warmup_log(pid, "Failed to login to Pinterest", logs)
                     raise RuntimeError("Failed to login to Pinterest")
 
-            await _full_warmup_log(pid, "Login successful", session_repo, session_id)
+            await _full_warmup_log(pid, "Login successful", logs)
 
             # Handle any popup dialogs that might interfere with automation
             await check_and_skip_popups(browser_factory.page)
 
             # Navigate to Pinterest boards section
-            await _full_warmup_log(
-                pid, "Navigating to boards page...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Navigating to boards page...", logs)
             if not await navigate_to_create_board(browser_factory.page, account):
-                await _full_warmup_log(
-                    pid, "Failed to navigate to boards page", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Failed to navigate to boards page", logs)
                 raise RuntimeError("Failed to navigate to boards page")
 
-            await _full_warmup_log(
-                pid, "Navigated to boards page", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Navigated to boards page", logs)
 
             # Create a new board with the user's prompt as the name
-            await _full_warmup_log(
-                pid, f"Creating board: {prompt}", session_repo, session_id
-            )
+            await _full_warmup_log(pid, f"Creating board: {prompt}", logs)
             if not await create_board(
                 browser_factory.page, board_name=prompt, is_secret=True
             ):
-                await _full_warmup_log(
-                    pid, "Failed to create board", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Failed to create board", logs)
                 raise RuntimeError("Failed to create board")
-            await _full_warmup_log(pid, "Board created", session_repo, session_id)
+            await _full_warmup_log(pid, "Board created", logs)
 
             # Save relevant pins to the board to train Pinterest's recommendation algorithm
-            await _full_warmup_log(
-                pid, "Saving pins to board...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Saving pins to board...", logs)
             if not await save_pins_to_board(
                 browser_factory.page,
                 prompt=prompt,
@@ -437,40 +360,30 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
                 max_pins=SCRAPING_CONFIG["max_pins"],
                 max_scrolls=SCRAPING_CONFIG["max_scrolls"],
             ):
-                await _full_warmup_log(
-                    pid, "Failed to save pins to board", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "Failed to save pins to board", logs)
                 raise RuntimeError("Failed to save pins to board")
-            await _full_warmup_log(pid, "Pins saved to board", session_repo, session_id)
+            await _full_warmup_log(pid, "Pins saved to board", logs)
 
             # Navigate to "More Ideas" page to access personalized recommendations
-            await _full_warmup_log(
-                pid, "Getting recommendations from board...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Getting recommendations from board...", logs)
             if not await navigate_to_more_ideas(browser_factory.page):
                 await _full_warmup_log(
                     pid,
                     "Failed to navigate to more ideas page",
-                    session_repo,
-                    session_id,
+                    logs,
                 )
                 raise RuntimeError("Failed to navigate to more ideas page")
-            await _full_warmup_log(
-                pid, "Navigated to more ideas page", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Navigated to more ideas page", logs)
 
             # Warmup phase completed successfully
             await _full_warmup_log(
                 pid,
                 "Pinterest account successfully warmed up!",
-                session_repo,
-                session_id,
+                logs,
             )
 
             # Begin the scraping phase
-            await _full_warmup_log(
-                pid, "Beginning scraping...", session_repo, session_id
-            )
+            await _full_warmup_log(pid, "Beginning scraping...", logs)
 
             # ============== SCRAPING PHASE ==============
 
@@ -479,32 +392,32 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
             await session_repo.update_status(session_id, "pending")
 
             # Extract pin images, titles, and links from the recommendations page
-            pins = await extract_pin_images_from_more_ideas(browser_factory.page)
+            pins = await extract_pin_images_from_more_ideas(
+                browser_factory.page, max_scrolls=SCRAPING_CONFIG["extract_scrolls"]
+            )
             curr_url = browser_factory.page.url
 
             if pins is None:
                 await _full_warmup_log(
                     pid,
                     "Failed to extract pins - function returned None",
-                    session_repo,
-                    session_id,
+                    logs,
                 )
                 await session_repo.update_status(session_id, "failed")
                 return
 
             if not pins:
-                await _full_warmup_log(
-                    pid, "No pins found to process", session_repo, session_id
-                )
+                await _full_warmup_log(pid, "No pins found to process", logs)
                 await session_repo.update_status(session_id, "completed")
                 return
 
-            # Process each extracted pin and save to database
+            # Build a database document for each extracted pin
+            pin_docs = []
             for pin in pins:
                 print(f"Pin: {pin}")
 
                 # Create metadata for tracking when pin was collected
-                metadata = PinMetadata(collected_at=datetime.utcnow())
+                metadata = PinMetadataStruct(collected_at=datetime.now(timezone.utc))
 
                 # Construct valid Pinterest pin URL with fallback handling
                 pin_link = pin.get("pin_link", "")
@@ -520,40 +433,47 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
                     )
 
                 # Create database document for the pin
-                pin_doc = Pin(
-                    prompt_id=pid,
-                    image_url=pin["image_url"],
-                    pin_url=_pin_url,
-                    title=pin.get("title", ""),
-                    description=pin.get("alt_text", ""),
-                    match_score=0.0,
-                    status="pending",
-                    ai_explanation="",
-                    metadata=metadata,
+                pin_docs.append(
+                    PinStruct(
+                        prompt_id=pid,
+                        image_url=pin["image_url"],
+                        pin_url=_pin_url,
+                        title=pin.get("title", ""),
+                        description=pin.get("alt_text", ""),
+                        match_score=0.0,
+                        status="pending",
+                        ai_explanation="",
+                        metadata=metadata,
+                    )
                 )
 
-                # Save pin to database and broadcast to frontend
-                pin_id = await pin_repo.create(pin_doc)
+            # Save all pins to database with one insert
+            pin_ids = await pin_repo.create_many(pin_docs)
+            if pin_ids is None:
+                await _full_warmup_log(pid, "Failed to save extracted pins", logs)
+                await session_repo.update_status(session_id, "failed")
+                return
+
+            messages = []
+            for pin_id, pin_doc in zip(pin_ids, pin_docs):
                 print(f"Saved pin: {pin_id}")
-                await session_repo.add_log(session_id, f"Saved pin: {pin_id}")
+                await logs.add(f"Saved pin: {pin_id}")
+                messages.append(
+                    ScrapedImageMessage.model_construct(
+                        type="scraped_image",
+                        pin_id=pin_id,
+                        url=pin_doc.image_url,
+                        pin_url=pin_doc.pin_url,
+                        image_title=pin_doc.title,
+                    ).model_dump(mode="json")
+                )
 
-                # Broadcast pin data to frontend for real-time updates
-                try:
-                    broadcast(
-                        pid,
-                        ScrapedImageMessage(
-                            type="scraped_image",
-                            pin_id=pin_id,
-                            url=pin["image_url"],
-                            pin_url=_pin_url,
-                            image_title=pin["title"],
-                        ).model_dump(mode="json"),
-                    )
-                except Exception as broadcast_error:
-                    print(f"Broadcast error: {broadcast_error}")
-                    await session_repo.add_log(
-                        session_id, f"Broadcast error: {broadcast_error}"
-                    )
+            # Broadcast pin data to frontend for real-time updates, in one pipeline
+            try:
+                await broadcast_many_async(pid, messages)
+            except Exception as broadcast_error:
+                print(f"Broadcast error: {broadcast_error}")
+                await logs.add(f"Broadcast error: {broadcast_error}")
 
             # Mark session as completed after processing all pins
             await session_repo.update_status(session_id, "completed")
@@ -575,8 +495,8 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
 
         # Only try to log if we have valid repos and the event loop is still open
         try:
-            if session_repo and session_id:
-                await _full_warmup_log(pid, f"Error: {e}", session_repo, session_id)
+            if logs is not None:
+                await _full_warmup_log(pid, f"Error: {e}", logs)
         except Exception as log_error:
             print(f"Error in _full_warmup_log: {log_error}")
 
@@ -593,33 +513,40 @@ async def _warm_up_async(pid: str, session_id: str, prompt: str):
         # Re-raise the exception to ensure the task is marked as failed
         raise
 
+    finally:
+        # Write out the log lines still buffered
+        if logs is not None:
+            try:
+                await logs.close()
+            except Exception as log_error:
+                print(f"Error writing session logs: {log_error}")
+
 
 async def _full_warmup_log(
-    pid: str, message: str, session_repo: SessionRepo, session_id: str
+    pid: str, message: str, logs: SessionLogBuffer
 ) -> WarmupMessage:
     """
     Comprehensive logging function that handles progress tracking and real-time updates.
 
     This function:
     1. Logs messages to console for debugging
-    2. Saves messages to session log history in database
+    2. Saves messages to session log history in database (through the session's log buffer)
     3. Broadcasts messages to frontend via WebSocket for real-time progress updates
 
     Args:
         pid: Prompt ID for WebSocket broadcasting
         message: Progress message to log and broadcast
-        session_repo: Database repository for session operations
-        session_id: Session ID for database logging
+        logs: Log buffer of the session
 
     Returns:
         WarmupMessage: Message object for broadcasting
     """
     print(f"Warmup: {message}")
 
-    update_message = WarmupMessage(type="warmup", message=message)
-    await session_repo.add_log(session_id, f"Warmup: {message}")
+    update_message = WarmupMessage.model_construct(type="warmup", message=message)
+    await logs.add(f"Warmup: {message}")
     try:
-        broadcast(pid, update_message.model_dump(mode="json"))
+        await broadcast_async(pid, update_message.model_dump(mode="json"))
     except Exception as broadcast_error:
         print(f"Broadcast error in _full_warmup_log: {broadcast_error}")
 
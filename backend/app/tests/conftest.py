@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the unit tests
+The app reads its settings at import, so placeholder values are set before any app
+module is imported, none of the unit tests connect to them
+"""
+
+import os
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,114 @@
+"""
+Tests for decoding and scoring the evaluation responses in image_evaluator.py
+Run with: python -m pytest app/tests/test_evaluation_decoding.py
+"""
+
+import asyncio
+
+import msgspec
+import orjson
+import pytest
+
+from app.services.automation import image_evaluator
+from app.services.automation.image_evaluator import (
+    Evaluation,
+    _chat_decoder,
+    _evaluation_decoder,
+    _evaluations_decoder,
+    _score_evaluation,
+    score_image_against_prompt,
+    score_images_against_prompt,
+)
+
+IMAGE_URL = "https://i.pinimg.com/1200x/b4/c0/20/b4c020bd95d85cd2ea5e4a0932bc8013.jpg"
+
+
+def test_chat_response_keeps_only_the_message_content():
+    body = orjson.dumps(
+        {
+            "id": "chatcmpl-1",
+            "model": "gpt-4o-mini",
+            "choices": [
+                {"index": 0, "message": {"role": "assistant", "content": "{}"}}
+            ],
+            "usage": {"total_tokens": 10},
+        }
+    )
+    assert _chat_decoder.decode(body).choices[0].message.content == "{}"
+
+
+def test_evaluation_decodes_with_defaults():
+    evaluation = _evaluation_decoder.decode('{"object": 0.8, "style": 1}')
+    assert evaluation == Evaluation(object=0.8, style=1.0)
+
+
+def test_evaluation_accepts_quoted_scores():
+    evaluation = _evaluation_decoder.decode('{"object": "0.8", "style": "0.4"}')
+    assert (evaluation.object, evaluation.style) == (0.8, 0.4)
+
+
+def test_evaluation_requires_both_scores():
+    with pytest.raises(msgspec.ValidationError, match="object"):
+        _evaluation_decoder.decode('{"style": 0.5}')
+
+
+def test_evaluations_decode_in_order():
+    evaluations = _evaluations_decoder.decode(
+        '[{"object": 0.1, "style": 0.2}, {"object": 0.3, "style": 0.4}]'
+    )
+    assert [(e.object, e.style) for e in evaluations] == [(0.1, 0.2), (0.3, 0.4)]
+
+
+def test_score_combines_the_weighted_scores():
+    score, detail = _score_evaluation(
+        Evaluation(object=1.0, style=0.5, evaluation_explanation="close match")
+    )
+    assert score == pytest.approx(0.75)
+    assert detail == {
+        "object_score": 1.0,
+        "style_score": 0.5,
+        "explanation": "close match",
+    }
+
+
+def test_score_rejects_out_of_range_scores():
+    with pytest.raises(RuntimeError, match="object score"):
+        _score_evaluation(Evaluation(object=1.5, style=0.5))
+
+
+@pytest.fixture
+def completion(monkeypatch):
+    """Makes the evaluator's OpenAI request return the given message content"""
+    content = {}
+
+    async def fake_request(body, timeout):
+        return content["value"]
+
+    monkeypatch.setattr(image_evaluator, "_request_completion", fake_request)
+    # Tagging the prompt is covered elsewhere, it needs the spaCy model
+    monkeypatch.setattr(
+        image_evaluator,
+        "split_prompt_by_nouns_and_adjectives",
+        lambda prompt: ("boho", "bedroom"),
+    )
+    return content
+
+
+def test_score_image_wraps_malformed_content(completion):
+    completion["value"] = "not json"
+    with pytest.raises(RuntimeError, match="Malformed OpenAI response"):
+        asyncio.run(score_image_against_prompt(IMAGE_URL, "boho bedroom"))
+
+
+def test_score_images_returns_one_result_per_image(completion):
+    completion["value"] = '[{"object": 1, "style": 1}, {"object": 0, "style": 0}]'
+    results = asyncio.run(
+        score_images_against_prompt([IMAGE_URL, IMAGE_URL], "boho bedroom")
+    )
+    assert [score for score, _ in results] == [1.0, 0.0]
+
+
+def test_score_images_rejects_a_count_mismatch(completion):
+    completion["value"] = '[{"object": 1, "style": 1}]'
+    with pytest.raises(RuntimeError, match="JSON array of 2"):
+        asyncio.run(score_images_against_prompt([IMAGE_URL, IMAGE_URL], "boho bedroom"))
@@ -0,0 +1,105 @@
+"""
+Tests for the OpenAI request path of image_evaluator.py: rate limiting and retries
+Run with: python -m pytest app/tests/test_evaluation_requests.py
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app.services.automation import image_evaluator
+from app.services.automation.image_evaluator import RateLimiter, _request_completion
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records the delays slept for instead of sleeping"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(image_evaluator.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _use_responses(monkeypatch, responses):
+    """Serves the given responses, in order, to the requests the evaluator makes"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    client = httpx.AsyncClient(
+        base_url="https://api.openai.com/v1", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(image_evaluator, "get_client", lambda: client)
+    return requests
+
+
+def _completion(content: str) -> httpx.Response:
+    return httpx.Response(
+        200, content=orjson.dumps({"choices": [{"message": {"content": content}}]})
+    )
+
+
+def test_rate_limiter_passes_within_capacity(sleeps):
+    limiter = RateLimiter(per_minute=60)
+    for _ in range(60):
+        asyncio.run(limiter.acquire())
+    assert sleeps == []
+
+
+def test_rate_limiter_waits_for_the_debt(sleeps):
+    limiter = RateLimiter(per_minute=60)
+    asyncio.run(limiter.acquire(60))
+    asyncio.run(limiter.acquire(2))
+    # 1 unit per second refill, 2 units short (give or take the time elapsed)
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(2, abs=0.1)
+
+
+def test_rate_limiter_caps_a_single_acquire_at_capacity(sleeps):
+    limiter = RateLimiter(per_minute=60)
+    asyncio.run(limiter.acquire(1000))
+    assert sleeps == []
+
+
+def test_retries_429_after_retry_after(monkeypatch, sleeps):
+    requests = _use_responses(
+        monkeypatch,
+        [
+            httpx.Response(429, headers={"retry-after": "7"}),
+            _completion("ok"),
+        ],
+    )
+    assert asyncio.run(_request_completion({"messages": []}, 5)) == "ok"
+    assert len(requests) == 2
+    assert 7 in sleeps
+
+
+def test_retry_after_is_capped(monkeypatch, sleeps):
+    _use_responses(
+        monkeypatch,
+        [httpx.Response(429, headers={"retry-after": "3600"}), _completion("ok")],
+    )
+    asyncio.run(_request_completion({"messages": []}, 5))
+    assert image_evaluator.EVALUATION_CONFIG["max_retry_delay"] in sleeps
+
+
+def test_gives_up_after_max_retries(monkeypatch, sleeps):
+    retries = image_evaluator.EVALUATION_CONFIG["max_retries"]
+    requests = _use_responses(monkeypatch, [httpx.Response(429)] * (retries + 1))
+    with pytest.raises(RuntimeError, match="rate limit"):
+        asyncio.run(_request_completion({"messages": []}, 5))
+    assert len(requests) == retries + 1
+
+
+def test_client_errors_are_not_retried(monkeypatch, sleeps):
+    requests = _use_responses(monkeypatch, [httpx.Response(401)])
+    with pytest.raises(RuntimeError, match="authentication"):
+        asyncio.run(_request_completion({"messages": []}, 5))
+    assert len(requests) == 1
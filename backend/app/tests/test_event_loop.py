@@ -0,0 +1,73 @@
+"""
+Tests for the per-worker event loop the Celery tasks run on
+Run with: python -m pytest app/tests/test_event_loop.py
+"""
+
+import asyncio
+
+from app.services.automation.browser_factory import BrowserPool
+from app.util.event_loop import keep_running, run_in_worker_loop
+
+
+def test_jobs_share_one_loop():
+    async def job():
+        return asyncio.get_running_loop()
+
+    assert run_in_worker_loop(job()) is run_in_worker_loop(job())
+
+
+def test_leftover_tasks_are_cancelled_and_kept_tasks_survive():
+    async def first_job():
+        stray = asyncio.create_task(asyncio.sleep(60))
+        kept = asyncio.create_task(asyncio.sleep(60))
+        keep_running([kept])
+        return stray, kept
+
+    async def second_job(kept):
+        # Still scheduled on the shared loop, nothing cancelled it between the jobs
+        await asyncio.sleep(0)
+        return kept.done()
+
+    stray, kept = run_in_worker_loop(first_job())
+    assert stray.cancelled()
+    assert run_in_worker_loop(second_job(kept)) is False
+    kept.cancel()
+
+
+def test_tasks_running_before_a_job_survive_it():
+    async def start_background():
+        background = asyncio.create_task(asyncio.sleep(60))
+        keep_running([background])
+        return background
+
+    async def other_job():
+        return None
+
+    background = run_in_worker_loop(start_background())
+    run_in_worker_loop(other_job())
+    assert not background.done()
+    background.cancel()
+
+
+def test_pooled_playwright_survives_between_jobs():
+    # The first job starts the shared Playwright, the second one still has to be able to
+    # talk to it (a cancelled connection makes every later call hang)
+    async def first_job():
+        await BrowserPool.get_playwright()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    async def second_job():
+        playwright = await BrowserPool.get_playwright()
+        request = await asyncio.wait_for(playwright.request.new_context(), 10)
+        await request.dispose()
+
+    async def cleanup():
+        await asyncio.wait_for(BrowserPool.shutdown(), 10)
+
+    playwright_tasks = run_in_worker_loop(first_job())
+    try:
+        assert playwright_tasks
+        assert not any(task.done() for task in playwright_tasks)
+        run_in_worker_loop(second_job())
+    finally:
+        run_in_worker_loop(cleanup())
@@ -4,6 +4,7 @@ Test script for image_evaluator.py
 Run with: python test_image_evaluator.py
 """
 
+import asyncio
 import sys
 import os
 
@@ -72,7 +73,7 @@ def test_image_scoring():
     for i, image_url in enumerate(test_images, 1):
         print(f"Testing image {i}: {image_url}")
         try:
-            score, details = score_image_against_prompt(image_url, prompt)
+            score, details = asyncio.run(score_image_against_prompt(image_url, prompt))
             print(f"  Final Score: {score:.2f}")
             print(f"  Object Score: {details['object_score']:.2f}")
             print(f"  Style Score: {details['style_score']:.2f}")
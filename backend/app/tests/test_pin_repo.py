@@ -0,0 +1,172 @@
+"""
+Tests for the PinRepo bulk write paths, against a fake collection
+Run with: python -m pytest app/tests/test_pin_repo.py
+"""
+
+import asyncio
+import warnings
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.models.pin import PinMetadata
+from app.models.pin_struct import PinStruct
+from app.services.database.repo import PinRepo
+
+
+class FakeCollection:
+    """Records the writes made through it"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.inserted = []
+        self.bulk_writes = []
+
+    async def insert_many(self, docs, ordered=True):
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.inserted.append((docs, ordered))
+        return SimpleNamespace(inserted_ids=[ObjectId() for _ in docs])
+
+    async def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.bulk_writes.append((operations, ordered))
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    col = FakeCollection()
+    monkeypatch.setattr(PinRepo, "_col", col)
+    return col
+
+
+def _pin(n: int) -> PinStruct:
+    return PinStruct(
+        prompt_id="p", image_url=f"https://i.pinimg.com/{n}.jpg", pin_url=f"/pin/{n}/"
+    )
+
+
+def test_create_many_inserts_once_unordered(collection):
+    ids = asyncio.run(PinRepo().create_many([_pin(1), _pin(2), _pin(3)]))
+    assert len(ids) == 3 and all(isinstance(pin_id, str) for pin_id in ids)
+    assert len(collection.inserted) == 1
+    docs, ordered = collection.inserted[0]
+    assert [doc["image_url"] for doc in docs] == [
+        "https://i.pinimg.com/1.jpg",
+        "https://i.pinimg.com/2.jpg",
+        "https://i.pinimg.com/3.jpg",
+    ]
+    assert ordered is False
+
+
+def test_create_many_without_pins_skips_the_insert(collection):
+    assert asyncio.run(PinRepo().create_many([])) == []
+    assert collection.inserted == []
+
+
+def test_create_many_rejects_invalid_pins(collection):
+    assert asyncio.run(PinRepo().create_many([_pin(1), {"image_url": "x"}])) is None
+    assert collection.inserted == []
+
+
+def test_create_many_returns_none_when_the_insert_fails(monkeypatch):
+    monkeypatch.setattr(PinRepo, "_col", FakeCollection(fail=True))
+    assert asyncio.run(PinRepo().create_many([_pin(1)])) is None
+
+
+def test_bulk_update_validation_writes_one_batch(collection):
+    first, second = ObjectId(), str(ObjectId())
+    results = {
+        first: (0.9, "matches", "approved"),
+        second: (0.1, "off topic", "disqualified"),
+    }
+    assert asyncio.run(PinRepo().bulk_update_validation(results)) is True
+
+    assert len(collection.bulk_writes) == 1
+    operations, ordered = collection.bulk_writes[0]
+    assert ordered is False
+    assert operations == [
+        UpdateOne(
+            {"_id": first},
+            {
+                "$set": {
+                    "match_score": 0.9,
+                    "ai_explanation": "matches",
+                    "status": "approved",
+                }
+            },
+        ),
+        UpdateOne(
+            {"_id": ObjectId(second)},
+            {
+                "$set": {
+                    "match_score": 0.1,
+                    "ai_explanation": "off topic",
+                    "status": "disqualified",
+                }
+            },
+        ),
+    ]
+
+
+def test_bulk_update_validation_rejects_invalid_ids(collection):
+    results = {
+        str(ObjectId()): (0.9, "matches", "approved"),
+        "not-an-object-id": (0.5, "meh", "approved"),
+    }
+    assert asyncio.run(PinRepo().bulk_update_validation(results)) is False
+    assert collection.bulk_writes == []
+
+
+def test_bulk_update_validation_rejects_out_of_range_scores(collection):
+    results = {str(ObjectId()): (1.5, "matches", "approved")}
+    assert asyncio.run(PinRepo().bulk_update_validation(results)) is False
+    assert collection.bulk_writes == []
+
+
+def test_bulk_update_validation_without_results_skips_the_write(collection):
+    assert asyncio.run(PinRepo().bulk_update_validation({})) is True
+    assert collection.bulk_writes == []
+
+
+def test_bulk_update_validation_returns_false_when_the_write_fails(monkeypatch):
+    monkeypatch.setattr(PinRepo, "_col", FakeCollection(fail=True))
+    results = {str(ObjectId()): (0.9, "matches", "approved")}
+    assert asyncio.run(PinRepo().bulk_update_validation(results)) is False
+
+
+def test_pin_from_doc_builds_metadata():
+    doc = {
+        "_id": ObjectId(),
+        "prompt_id": "p",
+        "image_url": "https://i.pinimg.com/1.jpg",
+        "pin_url": "/pin/1/",
+        "match_score": 0.0,
+        "status": "pending",
+        "ai_explanation": "",
+        # stored by MongoDB as a naive UTC datetime
+        "metadata": {"collected_at": datetime(2024, 1, 1)},
+    }
+    pin = PinRepo._pin_from_doc(doc)
+
+    assert isinstance(pin.metadata, PinMetadata)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = pin.model_dump()
+    assert dumped["metadata"] == {
+        "collected_at": datetime(2024, 1, 1, tzinfo=timezone.utc)
+    }
+
+
+def test_pin_from_doc_keeps_defaults_for_projected_out_fields():
+    oid = ObjectId()
+    pin = PinRepo._pin_from_doc({"_id": oid, "image_url": "https://i.pinimg.com/1.jpg"})
+
+    assert pin.id == str(oid)
+    assert pin.image_url == "https://i.pinimg.com/1.jpg"
+    assert pin.title == ""
+    assert isinstance(pin.metadata, PinMetadata)
@@ -0,0 +1,58 @@
+"""
+Tests for splitting a prompt into its style and object phrases in image_evaluator.py
+The docs are built by hand with their tags, so the spaCy model isn't needed
+Run with: python -m pytest app/tests/test_prompt_split.py
+"""
+
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
+
+from app.services.automation import image_evaluator
+from app.services.automation.image_evaluator import (
+    _phrases,
+    split_prompt_by_nouns_and_adjectives,
+)
+
+
+def tagged(words, tags, pos):
+    # spaces between words only, like the tokenizer's doc of the prompt
+    spaces = [True] * (len(words) - 1) + [False]
+    return Doc(Vocab(), words=words, spaces=spaces, tags=tags, pos=pos)
+
+
+def test_adjectives_and_nouns_by_coarse_tag():
+    doc = tagged(
+        ["cozy", "wooden", "cabin", "in", "aspen"],
+        ["JJ", "JJ", "NN", "IN", "NNP"],
+        ["ADJ", "ADJ", "NOUN", "ADP", "PROPN"],
+    )
+
+    assert _phrases(doc) == ("cozy wooden", "cabin aspen")
+
+
+def test_affix_mapped_to_adjective_is_kept():
+    # the attribute ruler maps AFX (e.g. "pre" in "pre-war") to ADJ
+    doc = tagged(
+        ["pre", "-", "war", "house"],
+        ["AFX", "HYPH", "NN", "NN"],
+        ["ADJ", "PUNCT", "NOUN", "NOUN"],
+    )
+
+    assert _phrases(doc) == ("pre", "war house")
+
+
+def test_missing_side_falls_back_to_the_prompt():
+    doc = tagged(["sunset", "beach"], ["NN", "NN"], ["NOUN", "NOUN"])
+
+    assert _phrases(doc) == ("sunset beach", "sunset beach")
+
+
+def test_single_word_is_not_tagged(monkeypatch):
+    split_prompt_by_nouns_and_adjectives.cache_clear()
+
+    def no_model():
+        raise AssertionError("single word prompts shouldn't load the model")
+
+    monkeypatch.setattr(image_evaluator, "get_nlp", no_model)
+
+    assert split_prompt_by_nouns_and_adjectives("Boho") == ("boho", "boho")
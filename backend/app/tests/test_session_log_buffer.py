@@ -0,0 +1,98 @@
+"""
+Tests for SessionLogBuffer, the batched session log writer
+Run with: python -m pytest app/tests/test_session_log_buffer.py
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.database import repo
+from app.services.database.repo import SessionLogBuffer
+
+
+class FakeSessionRepo:
+    """Records the add_logs calls made to it"""
+
+    def __init__(self):
+        self.writes = []
+
+    async def add_logs(self, session_id, logs):
+        self.writes.append((session_id, list(logs)))
+        return True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(repo.time, "monotonic", clock)
+    return clock
+
+
+def _add_all(buffer, lines):
+    async def add():
+        for line in lines:
+            await buffer.add(line)
+
+    asyncio.run(add())
+
+
+def test_flushes_when_full(clock):
+    session_repo = FakeSessionRepo()
+    buffer = SessionLogBuffer(session_repo, "s1", max_lines=3, interval=60)
+    _add_all(buffer, ["a", "b"])
+    assert session_repo.writes == []
+
+    _add_all(buffer, ["c", "d"])
+    assert session_repo.writes == [("s1", ["a", "b", "c"])]
+
+
+def test_flushes_when_the_interval_passed(clock):
+    session_repo = FakeSessionRepo()
+    buffer = SessionLogBuffer(session_repo, "s1", max_lines=50, interval=2.0)
+    _add_all(buffer, ["a"])
+    assert session_repo.writes == []
+
+    clock.now += 2.0
+    _add_all(buffer, ["b"])
+    assert session_repo.writes == [("s1", ["a", "b"])]
+
+
+def test_close_writes_what_is_buffered(clock):
+    session_repo = FakeSessionRepo()
+    buffer = SessionLogBuffer(session_repo, "s1")
+    _add_all(buffer, ["a", "b"])
+    asyncio.run(buffer.close())
+    assert session_repo.writes == [("s1", ["a", "b"])]
+
+
+def test_lines_added_after_close_are_written_straight_away(clock):
+    session_repo = FakeSessionRepo()
+    buffer = SessionLogBuffer(session_repo, "s1")
+    asyncio.run(buffer.close())
+    _add_all(buffer, ["late"])
+    assert session_repo.writes[-1] == ("s1", ["late"])
+
+
+def test_add_logs_pushes_all_lines_in_one_update(monkeypatch):
+    class FakeCollection:
+        def __init__(self):
+            self.updates = []
+
+        async def update_one(self, query, update):
+            self.updates.append((query, update))
+
+    col = FakeCollection()
+    monkeypatch.setattr(repo.SessionRepo, "_col", col)
+    session_id = "66b0f0f0f0f0f0f0f0f0f0f0"
+    assert asyncio.run(repo.SessionRepo().add_logs(session_id, ["a", "b"])) is True
+    assert len(col.updates) == 1
+    assert col.updates[0][1] == {"$push": {"log": {"$each": ["a", "b"]}}}
@@ -0,0 +1,43 @@
+"""
+Tests for the WebSocket update message models
+Run with: python -m pytest app/tests/test_update_messages.py
+"""
+
+import orjson
+import pytest
+
+from app.models.update_messages import ValidationMessage
+
+
+@pytest.mark.parametrize(
+    "score, label, valid",
+    [
+        (0.82, "Matches the style and the object", True),
+        (0.0, "Off topic", False),
+        (1, "é ✓", True),
+    ],
+)
+def test_validation_message_to_bytes_round_trips(score, label, valid):
+    message = ValidationMessage.model_construct(
+        type="validation",
+        pin_id="66b0f0f0f0f0f0f0f0f0f0f0",
+        score=score,
+        label=label,
+        valid=valid,
+    )
+    payload = message.to_bytes()
+
+    assert ValidationMessage.model_validate_json(payload) == ValidationMessage(
+        type="validation",
+        pin_id="66b0f0f0f0f0f0f0f0f0f0f0",
+        score=score,
+        label=label,
+        valid=valid,
+    )
+
+
+def test_validation_message_to_bytes_matches_model_dump():
+    message = ValidationMessage.model_construct(
+        type="validation", pin_id="p1", score=0.5, label="ok", valid=True
+    )
+    assert orjson.loads(message.to_bytes()) == message.model_dump(mode="json")
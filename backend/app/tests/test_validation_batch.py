@@ -0,0 +1,102 @@
+"""
+Tests for scoring, storing and broadcasting one batch of pins in the validation task
+Run with: python -m pytest app/tests/test_validation_batch.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.tasks import validation
+
+
+class FakeLogs:
+    def __init__(self):
+        self.lines = []
+
+    async def add(self, line):
+        self.lines.append(line)
+
+
+class FakePinRepo:
+    def __init__(self):
+        self.updates = {}
+
+    async def bulk_update_validation(self, results):
+        self.updates.update(results)
+        return True
+
+
+@pytest.fixture
+def broadcasts(monkeypatch):
+    sent = []
+
+    async def broadcast_many_async(job_id, messages):
+        sent.extend(orjson.loads(message) for message in messages)
+
+    monkeypatch.setattr(validation, "broadcast_many_async", broadcast_many_async)
+    return sent
+
+
+def _pins(*names):
+    return [
+        SimpleNamespace(id=name, image_url=f"https://i.pinimg.com/{name}.jpg")
+        for name in names
+    ]
+
+
+def _detail(explanation):
+    return {"object_score": 1.0, "style_score": 1.0, "explanation": explanation}
+
+
+def _run(batch, pin_repo, logs):
+    asyncio.run(
+        validation._validate_batch(
+            batch, "prompt1", "boho bedroom", logs, pin_repo, asyncio.Semaphore(1)
+        )
+    )
+
+
+def test_batch_results_are_stored_and_broadcast(monkeypatch, broadcasts):
+    async def score_images(image_urls, prompt):
+        return [(0.9, _detail("match")), (0.1, _detail("off"))]
+
+    monkeypatch.setattr(validation, "score_images_against_prompt", score_images)
+    pin_repo = FakePinRepo()
+
+    _run(_pins("a", "b"), pin_repo, FakeLogs())
+
+    assert pin_repo.updates == {
+        "a": (0.9, "match", "approved"),
+        "b": (0.1, "off", "disqualified"),
+    }
+    assert [(m["pin_id"], m["valid"]) for m in broadcasts] == [
+        ("a", True),
+        ("b", False),
+    ]
+
+
+def test_failed_batch_falls_back_to_single_images(monkeypatch, broadcasts):
+    async def score_images(image_urls, prompt):
+        raise RuntimeError("Malformed OpenAI response")
+
+    async def score_image(image_url, prompt):
+        if image_url.endswith("b.jpg"):
+            raise RuntimeError("OpenAI API rate limit exceeded")
+        return 0.8, _detail("match")
+
+    monkeypatch.setattr(validation, "score_images_against_prompt", score_images)
+    monkeypatch.setattr(validation, "score_image_against_prompt", score_image)
+    pin_repo, logs = FakePinRepo(), FakeLogs()
+
+    _run(_pins("a", "b"), pin_repo, logs)
+
+    # every pin gets a result, none stays pending
+    assert pin_repo.updates == {
+        "a": (0.8, "match", "approved"),
+        "b": (0.0, "Evaluation failed", "disqualified"),
+    }
+    assert [m["pin_id"] for m in broadcasts] == ["a", "b"]
+    assert any("Validation failed for pin b" in line for line in logs.lines)
@@ -0,0 +1,183 @@
+"""
+Tests for WSManager's pub/sub relay and WebSocket fanout, against fake Redis and sockets
+Run with: python -m pytest app/tests/test_ws_manager.py
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.messaging import ws_manager as ws_manager_module
+from app.services.messaging.ws_manager import WS_CONFIG, WSManager
+
+
+class FakePubSub:
+    """Serves the messages put on its queue like a pattern-subscribed redis pubsub"""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.patterns = []
+        self.closed = False
+
+    async def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+
+    async def punsubscribe(self, pattern):
+        self.patterns.remove(pattern)
+
+    async def close(self):
+        self.closed = True
+
+    async def get_message(self, timeout=0.0):
+        if not timeout:
+            return None if self.queue.empty() else self.queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def publish(self, job_id: str, data: bytes):
+        self.queue.put_nowait(
+            {
+                "type": "pmessage",
+                "pattern": b"job:*",
+                "channel": f"job:{job_id}".encode(),
+                "data": data,
+            }
+        )
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pubsubs = []
+
+    def pubsub(self, **kwargs):
+        self.pubsubs.append(FakePubSub())
+        return self.pubsubs[-1]
+
+
+class FakeWebSocket:
+    def __init__(self, fail: bool = False, hang: bool = False):
+        self.fail = fail
+        self.hang = hang
+        self.sent = []
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, data):
+        if self.hang:
+            await asyncio.sleep(60)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(ws_manager_module, "get_redis", lambda: redis)
+    return redis
+
+
+async def _settle():
+    # Lets the relay task pick up and fan out what was published
+    await asyncio.sleep(0.05)
+
+
+def test_relay_dispatches_by_channel(redis):
+    async def run():
+        manager = WSManager()
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.connect("job1", first)
+        await manager.connect("job2", second)
+        await _settle()
+
+        assert len(redis.pubsubs) == 1
+        pubsub = redis.pubsubs[0]
+        assert pubsub.patterns == ["job:*"]
+
+        pubsub.publish("job1", b'{"n": 1}')
+        pubsub.publish("job2", b'{"n": 2}')
+        pubsub.publish("job1", b'{"n": 3}')
+        pubsub.publish("job3", b'{"n": 4}')
+        await _settle()
+
+        await manager.disconnect("job1", first)
+        await manager.disconnect("job2", second)
+        return first, second, pubsub
+
+    first, second, pubsub = asyncio.run(run())
+    assert first.sent == [b'{"n": 1}', b'{"n": 3}']
+    assert second.sent == [b'{"n": 2}']
+    assert pubsub.closed
+
+
+def test_listener_stops_with_the_last_client(redis):
+    async def run():
+        manager = WSManager()
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.connect("job1", first)
+        await manager.connect("job1", second)
+        await manager.disconnect("job1", first)
+        still_running = manager._listener_task is not None
+        await manager.disconnect("job1", second)
+        return manager, still_running
+
+    manager, still_running = asyncio.run(run())
+    assert still_running
+    assert manager._listener_task is None
+    assert manager._conns == {}
+
+
+def test_fanout_removes_dead_sockets(redis):
+    async def run():
+        manager = WSManager()
+        alive, dead = FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect("job1", alive)
+        await manager.connect("job1", dead)
+        await manager._fanout("job1", b"{}")
+        conns = set(manager._conns["job1"])
+        await manager.disconnect("job1", alive)
+        return alive, dead, conns
+
+    alive, dead, conns = asyncio.run(run())
+    assert alive.sent == [b"{}"]
+    assert conns == {alive}
+    assert dead.close_code == 1011
+
+
+def test_fanout_drops_the_job_when_every_socket_died(redis):
+    async def run():
+        manager = WSManager()
+        await manager.connect("job1", FakeWebSocket(fail=True))
+        await manager._fanout("job1", b"{}")
+        jobs = dict(manager._conns)
+        await manager._cancel_listener()
+        return jobs
+
+    assert asyncio.run(run()) == {}
+
+
+def test_fanout_does_not_wait_for_a_hung_socket(redis, monkeypatch):
+    monkeypatch.setitem(WS_CONFIG, "send_timeout_seconds", 0.05)
+
+    async def run():
+        manager = WSManager()
+        alive, hung = FakeWebSocket(), FakeWebSocket(hang=True)
+        await manager.connect("job1", alive)
+        await manager.connect("job1", hung)
+        await asyncio.wait_for(manager._fanout("job1", b"{}"), 1)
+        conns = set(manager._conns["job1"])
+        await manager.disconnect("job1", alive)
+        return alive, hung, conns
+
+    alive, hung, conns = asyncio.run(run())
+    assert alive.sent == [b"{}"]
+    assert conns == {alive}
+    assert hung.close_code == 1011
+    assert alive.close_code is None
@@ -0,0 +1,47 @@
+"""
+event_loop.py
+
+Runs the Celery tasks' async code on one event loop per worker process
+The loop is kept between tasks, so the per-loop clients (OpenAI, Redis, Motor) and the
+shared browser stay usable by the next task instead of being rebuilt on a new loop
+"""
+
+import asyncio
+import weakref
+from typing import Any, Coroutine, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+# Tasks started during a run that are meant to outlive it, see keep_running
+_kept: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
+
+def keep_running(tasks: Iterable[asyncio.Task]) -> None:
+    """
+    Exempts tasks from the cancellation at the end of the run that started them
+    For the background tasks of objects kept between runs, e.g. a pooled client's connection
+    """
+    _kept.update(tasks)
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs the coroutine to completion on this process's event loop, creating it on first use
+    The loop comes from the installed policy (uvloop in the worker), tasks the coroutine
+    left behind are cancelled so they don't run during the next task. Tasks that were
+    already running before it started, and tasks passed to keep_running, are left alone
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    existing = asyncio.all_tasks(_loop)
+    try:
+        return _loop.run_until_complete(coro)
+    finally:
+        pending = asyncio.all_tasks(_loop) - existing - set(_kept)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
@@ -0,0 +1,31 @@
+"""
+serialization.py
+
+Contains the orjson helpers shared by the API responses and the task broadcasts
+orjson handles datetimes natively, the default hook covers the remaining types we emit
+"""
+
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize the types orjson does not handle out of the box"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """orjson.dumps with the app-wide default hook"""
+    return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """FastAPI ORJSONResponse that also understands ObjectId"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -12,6 +12,9 @@ export interface WebSocketCallbacks {
   onError?: (error: Event) => void
 }
 
+// The backend sends messages as binary frames holding UTF-8 JSON, decoded back to strings here
+const textDecoder = new TextDecoder()
+
 export class WebSocketService {
   private ws: WebSocket | null = null
   private reconnectAttempts = 0
@@ -27,6 +30,7 @@ export class WebSocketService {
     
     try {
       this.ws = new WebSocket(wsUrl)
+      this.ws.binaryType = 'arraybuffer'
       
       this.ws.onopen = () => {
         console.log('WebSocket connected')
@@ -37,7 +41,8 @@ export class WebSocketService {
       this.ws.onmessage = (event) => {
         // Simply pass the raw message string to the callback
         // Let the consuming code handle parsing
-        this.callbacks.onMessage?.(event.data)
+        const message = event.data instanceof ArrayBuffer ? textDecoder.decode(event.data) : event.data
+        this.callbacks.onMessage?.(message)
       }
 
       this.ws.onclose = () => {